@@ -1,5 +1,5 @@
 
-from .cids import verify_raw, verify, CIDError
+from .cids import verify_raw, verify_raw_many, verify, verify_many, CIDError
 
-__all__ = ["verify_raw", "verify", "CIDError"]
+__all__ = ["verify_raw", "verify_raw_many", "verify", "verify_many", "CIDError"]
 
@@ -1,4 +1,9 @@
-from typing import Union
+import functools
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple, Union
 
 try:
     from multiformats import CID, multihash
@@ -8,27 +13,104 @@ except ImportError:
     CID = None
 
 
+# Multihash prefixes (code, digest length) for the hash functions served by hashlib.
+_HASHLIB_MULTIHASH = {
+    "sha2-256": (hashlib.sha256, b"\x12\x20"),
+    "sha2-512": (hashlib.sha512, b"\x13\x40"),
+}
+
+# sha2-256 multihash of b"" (e.g. empty padding blocks).
+_EMPTY_SHA256_MULTIHASH = b"\x12\x20" + bytes.fromhex(
+    "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+)
+
+# hashlib releases the GIL for buffers larger than 2 KiB, so batches of blocks at
+# least this size are hashed concurrently on a thread pool.
+_PARALLEL_HASH_MIN_SIZE = 2048
+
+_hash_pool: Optional[ThreadPoolExecutor] = None
+_hash_pool_lock = threading.Lock()
+
+
 class CIDError(Exception):
     pass
 
 
+if MULTIFORMATS_AVAILABLE:
+    # CID instances are immutable, so decoded CIDs can be shared between calls.
+    _decode_cached = functools.lru_cache(maxsize=4096)(CID.decode)
+
+
 def verify_raw(provided_cid: str, data: bytes) -> None:
     if not MULTIFORMATS_AVAILABLE:
         raise CIDError("multiformats library is not available")
     
     try:
-        parsed_cid = CID.decode(provided_cid)
+        parsed_cid = _decode_cached(provided_cid)
     except Exception as e:
         raise CIDError(f"failed to decode provided CID: {e}")
     
     verify(parsed_cid, data)
 
 
+def verify_raw_many(pairs: List[Tuple[str, bytes]], max_workers: Optional[int] = None) -> None:
+    if not MULTIFORMATS_AVAILABLE:
+        raise CIDError("multiformats library is not available")
+
+    parsed = []
+    for provided_cid, data in pairs:
+        try:
+            parsed.append((_decode_cached(provided_cid), data))
+        except Exception as e:
+            raise CIDError(f"failed to decode provided CID: {e}")
+
+    verify_many(parsed, max_workers=max_workers)
+
+
+def verify_many(pairs: List[Tuple['CID', bytes]], max_workers: Optional[int] = None) -> None:
+    if not MULTIFORMATS_AVAILABLE:
+        raise CIDError("multiformats library is not available")
+
+    large = sum(1 for _, data in pairs if len(data) >= _PARALLEL_HASH_MIN_SIZE)
+    if large < 2 or max_workers == 1:
+        for c, data in pairs:
+            verify(c, data)
+        return
+
+    # list() re-raises the first CIDError in input order.
+    if max_workers is None:
+        list(_get_hash_pool().map(lambda item: verify(*item), pairs))
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(lambda item: verify(*item), pairs))
+
+
+def _get_hash_pool() -> ThreadPoolExecutor:
+    # Hashing is CPU-bound, so one thread per core is enough; the pool is
+    # shared so repeated batches do not pay for thread start-up.
+    global _hash_pool
+    if _hash_pool is None:
+        with _hash_pool_lock:
+            if _hash_pool is None:
+                _hash_pool = ThreadPoolExecutor(
+                    max_workers=os.cpu_count() or 1, thread_name_prefix="cid-verify"
+                )
+    return _hash_pool
+
+
 def verify(c: 'CID', data: bytes) -> None:
     if not MULTIFORMATS_AVAILABLE:
         raise CIDError("multiformats library is not available")
     
-    calculated_cid = _calculate_standard_cid(c, data)
+    digest = _multihash_digest(data, _hash_code(c))
+    
+    # Same version, codec and multihash means the CIDs are equal; only a
+    # mismatch needs the full CID rebuilt for the error message.
+    if c.version in (0, 1) and digest == c.digest:
+        return
+    
+    calculated_cid = _cid_from_digest(c, digest)
     
     if calculated_cid != c:
         raise CIDError(
@@ -41,20 +123,13 @@ def _calculate_standard_cid(c: 'CID', data: bytes) -> 'CID':
     if not MULTIFORMATS_AVAILABLE:
         raise CIDError("multiformats library is not available")
     
+    return _cid_from_digest(c, _multihash_digest(data, _hash_code(c)))
+
+
+def _cid_from_digest(c: 'CID', digest: bytes) -> 'CID':
     version = c.version
     codec = c.codec
     
-    if hasattr(c, 'hashfun'):
-        # hashfun is a multicodec object, convert to string
-        hash_code = str(c.hashfun).replace("multihash.get('", "").replace("')", "")
-    else:
-        hash_code = "sha2-256"
-    
-    try:
-        digest = multihash.digest(data, hash_code)
-    except Exception as e:
-        raise CIDError(f"failed to create multihash: {e}")
-    
     if version == 0:
         return CID("base58btc", 0, "dag-pb", digest)
     elif version == 1:
@@ -65,3 +140,29 @@ def _calculate_standard_cid(c: 'CID', data: bytes) -> 'CID':
     else:
         raise CIDError(f"unsupported CID version: {version}")
 
+
+def _hash_code(c: 'CID') -> str:
+    hashfun = getattr(c, 'hashfun', None)
+    if hashfun is None:
+        return "sha2-256"
+
+    # hashfun is a multihash object; its name is the multicodec name.
+    name = getattr(hashfun, 'name', None)
+    if name is not None:
+        return name
+    return str(hashfun).replace("multihash.get('", "").replace("')", "")
+
+
+def _multihash_digest(data: bytes, hash_code: str) -> bytes:
+    if not data and hash_code == "sha2-256":
+        return _EMPTY_SHA256_MULTIHASH
+
+    hasher = _HASHLIB_MULTIHASH.get(hash_code)
+    if hasher is not None:
+        hash_fn, prefix = hasher
+        return prefix + hash_fn(data).digest()
+
+    try:
+        return multihash.digest(data, hash_code)
+    except Exception as e:
+        raise CIDError(f"failed to create multihash: {e}")
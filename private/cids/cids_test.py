@@ -134,3 +134,42 @@ def test_verify_large_data():
     
     verify(expected_cid, large_data)
 
+
+
+def test_hashlib_multihash_matches_multiformats():
+    from private.cids.cids import _multihash_digest
+
+    test_data = secrets.token_bytes(256)
+
+    for hash_code in ("sha2-256", "sha2-512"):
+        assert _multihash_digest(test_data, hash_code) == multihash.digest(test_data, hash_code)
+        assert _multihash_digest(b"", hash_code) == multihash.digest(b"", hash_code)
+
+
+def test_verify_raw_many():
+    from private.cids.cids import verify_raw_many
+
+    blocks = [secrets.token_bytes(size) for size in (16, 4096, 64 * 1024, 1024 * 1024)]
+    pairs = [(str(CID("base32", 1, "raw", multihash.digest(b, "sha2-256"))), b) for b in blocks]
+
+    verify_raw_many(pairs)
+
+    pairs[2] = (pairs[2][0], b"different data")
+    with pytest.raises(CIDError) as exc_info:
+        verify_raw_many(pairs)
+
+    assert "CID mismatch" in str(exc_info.value)
+
+
+def test_verify_many():
+    from private.cids.cids import verify_many
+
+    blocks = [secrets.token_bytes(64 * 1024) for _ in range(8)]
+    pairs = [(CID("base32", 1, "dag-pb", multihash.digest(b, "sha2-256")), b) for b in blocks]
+
+    verify_many(pairs)
+    verify_many(pairs, max_workers=2)
+
+    pairs[5] = (pairs[5][0], blocks[0])
+    with pytest.raises(CIDError):
+        verify_many(pairs)
@@ -9,6 +9,9 @@ from eth_utils import to_checksum_address
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from sdk.common import SDKError
 
+# An address is encoded as a 32-byte word: 12 zero bytes, then its 20 bytes.
+_ADDRESS_PAD = bytes(12)
+
 class TypedData:
     def __init__(self, name: str, type_name: str):
         self.name = name
@@ -173,9 +176,8 @@ def encode_value(value: Any, type_name: str) -> bytes:
     
     elif type_name == "address":
         if isinstance(value, str):
-            addr_str = value.lower()
-            if addr_str.startswith('0x'):
-                addr_str = addr_str[2:]
+            # fromhex accepts either case, so checksummed input needs no lower().
+            addr_str = value[2:] if value[:2] in ('0x', '0X') else value
             if len(addr_str) != 40:
                 raise ValueError(f"invalid address length: {len(addr_str)}")
             addr_bytes = bytes.fromhex(addr_str)
@@ -186,9 +188,7 @@ def encode_value(value: Any, type_name: str) -> bytes:
         else:
             raise ValueError(f"expected string or bytes for address, got {type(value)}")
         
-        buf = bytearray(32)
-        buf[12:32] = addr_bytes
-        return bytes(buf)
+        return _ADDRESS_PAD + addr_bytes
     
     else:
         raise ValueError(f"unsupported type: {type_name}")
@@ -1,8 +1,24 @@
 # HTTP-related utility functions for internal Akave SDK components.
 
 
-from .httpext import range_download
+from .httpext import (
+    is_shared_pool,
+    make_async_pool,
+    make_pool,
+    range_download,
+    range_download_async,
+    range_download_many,
+    shared_pool,
+)
 
-__all__ = ["range_download"]
+__all__ = [
+    "range_download",
+    "range_download_async",
+    "range_download_many",
+    "make_pool",
+    "make_async_pool",
+    "shared_pool",
+    "is_shared_pool",
+]
 
 
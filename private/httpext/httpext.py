@@ -1,11 +1,34 @@
+import asyncio
+import atexit
+import functools
 import logging
-from typing import Optional
+import threading
+from typing import List, Optional, Sequence, Tuple, Union
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    httpx = None
+    HTTPX_AVAILABLE = False
+
+# Only the head of an error body is read; it is just for the error message.
+MAX_ERROR_BODY_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=32)
+def _httpx_timeout(timeout: Optional[float]) -> "httpx.Timeout":
+    # httpx would otherwise build a fresh Timeout from the float on every
+    # request; the same few values recur, and Timeout is immutable.
+    return httpx.Timeout(timeout)
 
 
 def range_download(
-    client: requests.Session,
+    client: Union[requests.Session, urllib3.PoolManager, "httpx.Client"],
     url: str,
     offset: int,
     length: int,
@@ -14,25 +37,31 @@ def range_download(
     """
     Download a specific byte range from *url* using the given HTTP client.
 
+    *client* may be a ``requests.Session`` or, for hot loops of small ranges,
+    a ``urllib3.PoolManager`` which skips the ``requests`` adapter chain.
+    An ``httpx.Client`` created with ``http2=True`` (see :func:`make_pool`)
+    multiplexes concurrent ranges from one host over a single connection.
+
     The function raises ``ValueError`` if the range is invalid and a generic
     ``Exception`` for network or HTTP errors.
     """
-    if length <= 0 or offset < 0:
-        raise ValueError("length must be positive and offset must be non-negative")
+    headers = _range_headers(offset, length)
 
-    end = offset + length - 1
-    headers = {"Range": f"bytes={offset}-{end}"}
+    if isinstance(client, urllib3.PoolManager):
+        return _range_download_urllib3(client, url, headers, length, timeout)
+    if HTTPX_AVAILABLE and isinstance(client, httpx.Client):
+        return _range_download_httpx(client, url, headers, length, timeout)
 
     try:
-        response = client.get(url, headers=headers, timeout=timeout)
+        response = client.get(url, headers=headers, timeout=timeout, stream=True)
     except requests.RequestException as exc:
         raise Exception(f"request failed: {exc}") from exc
 
-    try:
+    with response:
         # Some CDNs may return 200 OK for range requests.
         if response.status_code not in (requests.codes.partial_content, requests.codes.ok):
             try:
-                body = response.content
+                body = response.raw.read(MAX_ERROR_BODY_SIZE, decode_content=True)
             except Exception as body_exc:  # pragma: no cover - extremely rare
                 logging.warning("failed to read error response body: %s", body_exc)
                 body = b""
@@ -43,15 +72,307 @@ def range_download(
             )
 
         try:
-            data = response.content
-        except requests.RequestException as exc:
+            if response.status_code == requests.codes.partial_content:
+                return _read_range_body(response, length)
+            return response.raw.read(decode_content=True)
+        except (requests.RequestException, urllib3.exceptions.HTTPError) as exc:
+            # Reading response.raw surfaces urllib3 errors (e.g. a truncated
+            # body) that requests would otherwise wrap.
             raise Exception(f"failed to read response body: {exc}") from exc
 
-        return data
+
+async def range_download_async(
+    client: "httpx.AsyncClient",
+    url: str,
+    offset: int,
+    length: int,
+    timeout: Optional[float] = 10.0,
+) -> bytes:
+    """
+    Async counterpart of :func:`range_download` for an ``httpx.AsyncClient``.
+
+    Ranges awaited together (e.g. with ``asyncio.gather``) share the client's
+    pool, and over HTTP/2 (see :func:`make_async_pool`) a single connection,
+    without a thread per request. Errors are raised as in
+    :func:`range_download`.
+    """
+    headers = _range_headers(offset, length)
+
+    try:
+        async with client.stream("GET", url, headers=headers, timeout=_httpx_timeout(timeout)) as response:
+            # Some CDNs may return 200 OK for range requests.
+            if response.status_code not in (requests.codes.partial_content, requests.codes.ok):
+                body = b""
+                try:
+                    async for chunk in response.aiter_bytes():
+                        body += chunk
+                        if len(body) >= MAX_ERROR_BODY_SIZE:
+                            break
+                except Exception as body_exc:  # pragma: no cover - extremely rare
+                    logging.warning("failed to read error response body: %s", body_exc)
+
+                body_text = body[:MAX_ERROR_BODY_SIZE].decode(errors="replace")
+                raise Exception(
+                    f"download failed with status {response.status_code}: {body_text}"
+                )
+
+            if response.status_code != requests.codes.partial_content:
+                return await response.aread()
+
+            buf = bytearray(length)
+            pos = 0
+            async for chunk in response.aiter_bytes():
+                n = min(len(chunk), length - pos)
+                buf[pos:pos + n] = chunk[:n]
+                pos += n
+                if pos >= length:
+                    break
+            if pos < length:
+                del buf[pos:]
+            return bytes(buf)
+    except httpx.HTTPError as exc:
+        raise Exception(f"request failed: {exc}") from exc
+
+
+def range_download_many(
+    ranges: Sequence[Tuple[str, int, int]],
+    max_concurrency: int = 16,
+    timeout: Optional[float] = 10.0,
+) -> List[bytes]:
+    """
+    Download several ``(url, offset, length)`` ranges concurrently.
+
+    The ranges are fetched with :func:`range_download_async` on one
+    :func:`make_async_pool` client, so under HTTP/2 they share a connection
+    as parallel streams; at most *max_concurrency* are in flight, which should
+    stay within the server's concurrent stream limit. Results are returned in
+    input order and the first failure is raised. Must not be called from a
+    running event loop; await :func:`range_download_async` there instead.
+    """
+    if max_concurrency <= 0:
+        raise ValueError("max_concurrency must be positive")
+    if not ranges:
+        return []
+
+    async def download_all() -> List[bytes]:
+        semaphore = asyncio.Semaphore(max_concurrency)
+        async with make_async_pool(max_connections=max_concurrency) as client:
+            async def download(url: str, offset: int, length: int) -> bytes:
+                async with semaphore:
+                    return await range_download_async(client, url, offset, length, timeout)
+
+            return list(await asyncio.gather(*(download(*r) for r in ranges)))
+
+    return asyncio.run(download_all())
+
+
+def _range_headers(offset: int, length: int) -> dict:
+    if length <= 0 or offset < 0:
+        raise ValueError("length must be positive and offset must be non-negative")
+
+    end = offset + length - 1
+    return {"Range": f"bytes={offset}-{end}"}
+
+
+def _range_download_urllib3(
+    pool: urllib3.PoolManager,
+    url: str,
+    headers: dict,
+    length: int,
+    timeout: Optional[float],
+) -> bytes:
+    try:
+        response = pool.request(
+            "GET", url, headers=headers, preload_content=False, timeout=timeout, retries=False
+        )
+    except urllib3.exceptions.HTTPError as exc:
+        raise Exception(f"request failed: {exc}") from exc
+
+    try:
+        # Some CDNs may return 200 OK for range requests.
+        if response.status not in (requests.codes.partial_content, requests.codes.ok):
+            try:
+                body = response.read(MAX_ERROR_BODY_SIZE)
+            except Exception as body_exc:  # pragma: no cover - extremely rare
+                logging.warning("failed to read error response body: %s", body_exc)
+                body = b""
+
+            body_text = body.decode(errors="replace")
+            raise Exception(
+                f"download failed with status {response.status}: {body_text}"
+            )
+
+        try:
+            if response.status == requests.codes.partial_content:
+                return response.read(length)
+            return response.read()
+        except urllib3.exceptions.HTTPError as exc:
+            raise Exception(f"failed to read response body: {exc}") from exc
     finally:
+        response.release_conn()
+
+
+def _range_download_httpx(
+    client: "httpx.Client",
+    url: str,
+    headers: dict,
+    length: int,
+    timeout: Optional[float],
+) -> bytes:
+    try:
+        with client.stream("GET", url, headers=headers, timeout=_httpx_timeout(timeout)) as response:
+            # Some CDNs may return 200 OK for range requests.
+            if response.status_code not in (requests.codes.partial_content, requests.codes.ok):
+                body = b""
+                try:
+                    for chunk in response.iter_bytes():
+                        body += chunk
+                        if len(body) >= MAX_ERROR_BODY_SIZE:
+                            break
+                except Exception as body_exc:  # pragma: no cover - extremely rare
+                    logging.warning("failed to read error response body: %s", body_exc)
+
+                body_text = body[:MAX_ERROR_BODY_SIZE].decode(errors="replace")
+                raise Exception(
+                    f"download failed with status {response.status_code}: {body_text}"
+                )
+
+            if response.status_code != requests.codes.partial_content:
+                return response.read()
+
+            buf = bytearray(length)
+            pos = 0
+            for chunk in response.iter_bytes():
+                n = min(len(chunk), length - pos)
+                buf[pos:pos + n] = chunk[:n]
+                pos += n
+                if pos >= length:
+                    break
+            if pos < length:
+                del buf[pos:]
+            return bytes(buf)
+    except httpx.HTTPError as exc:
+        raise Exception(f"request failed: {exc}") from exc
+
+
+def make_pool(
+    http2: bool = False,
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 30.0,
+) -> Union[requests.Session, "httpx.Client"]:
+    """
+    Create an HTTP client suitable for :func:`range_download`.
+
+    Returns a ``requests.Session``. With ``http2=True`` it returns an
+    HTTP/2-enabled ``httpx.Client`` instead when httpx (with the ``http2``
+    extra) is installed, falling back to a session otherwise. Either way the
+    connection pool is sized explicitly, so bursts of requests to one node
+    reuse kept-alive connections (multiplexed streams under HTTP/2) instead
+    of opening new ones.
+    """
+    if http2 and HTTPX_AVAILABLE:
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        try:
+            return httpx.Client(http2=True, limits=limits)
+        except ImportError:
+            logging.debug("httpx installed without HTTP/2 support, using requests")
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=max_keepalive_connections, pool_maxsize=max_connections)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def make_async_pool(
+    http2: bool = True,
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 30.0,
+) -> "httpx.AsyncClient":
+    """
+    Create an ``httpx.AsyncClient`` suitable for :func:`range_download_async`.
+
+    Pool limits match :func:`make_pool`. HTTP/2 is used when the ``http2``
+    extra is installed; raises ``ImportError`` if httpx itself is missing.
+    """
+    if not HTTPX_AVAILABLE:
+        raise ImportError("httpx is required for async downloads")
+
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    if http2:
         try:
-            response.close()
-        except Exception as close_exc:  # pragma: no cover - defensive
-            logging.debug("error closing HTTP response: %s", close_exc)
+            return httpx.AsyncClient(http2=True, limits=limits)
+        except ImportError:
+            logging.debug("httpx installed without HTTP/2 support, using HTTP/1.1")
+    return httpx.AsyncClient(limits=limits)
+
+
+_shared_pool: Optional[Union[requests.Session, "httpx.Client"]] = None
+_shared_pool_lock = threading.Lock()
+
+
+def shared_pool() -> Union[requests.Session, "httpx.Client"]:
+    """
+    Return the process-wide client built by :func:`make_pool`.
+
+    Short-lived callers that each made their own client paid a fresh TCP (and
+    TLS) handshake per client and could leave sockets open until garbage
+    collection; sharing one pool lets keep-alive amortise that. The client is
+    closed at interpreter exit and must not be closed by callers.
+    """
+    global _shared_pool
+    if _shared_pool is None:
+        with _shared_pool_lock:
+            if _shared_pool is None:
+                pool = make_pool()
+                atexit.register(pool.close)
+                _shared_pool = pool
+    return _shared_pool
+
+
+def is_shared_pool(client: object) -> bool:
+    """Report whether *client* is the one returned by :func:`shared_pool`."""
+    return client is not None and client is _shared_pool
+
+
+def _read_range_body(response: requests.Response, length: int) -> bytes:
+    """Read a ranged body of at most *length* bytes."""
+    if not response.headers.get("Content-Encoding"):
+        # Akave blocks are served with identity encoding, so the raw stream is
+        # the body; urllib3 returns it in a single allocation.
+        data = response.raw.read(length)
+        if len(data) >= length or not data:
+            return data
 
+        parts = [data]
+        received = len(data)
+        while received < length:
+            part = response.raw.read(length - received)
+            if not part:
+                break
+            parts.append(part)
+            received += len(part)
+        return b"".join(parts)
 
+    # Encoded bodies must go through requests' decoder.
+    buf = bytearray(length)
+    pos = 0
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        n = min(len(chunk), length - pos)
+        buf[pos:pos + n] = chunk[:n]
+        pos += n
+        if pos >= length:
+            break
+    if pos < length:
+        del buf[pos:]
+    return bytes(buf)
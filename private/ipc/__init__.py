@@ -1,10 +1,12 @@
-from .client import Client, Config, TransactionFailedError
-from .errors import error_hash_to_error, parse_errors_to_hashes
+from .client import Client, Config, NonceManager, TransactionFailedError
+from .errors import ContractError, error_hash_to_error, parse_errors_to_hashes
 
 __all__ = [
     'Client',
     'Config',
+    'NonceManager',
     'TransactionFailedError',
+    'ContractError',
     'error_hash_to_error',
     'parse_errors_to_hashes'
 ]
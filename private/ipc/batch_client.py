@@ -4,23 +4,257 @@
 from __future__ import annotations
 
 import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List, Optional, Any, Dict
+
+import requests
 from web3 import Web3
 from web3.exceptions import BlockNotFound, TransactionNotFound
 from eth_typing import HexStr
 
-from .block_parser import block_from_json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    msgspec = None
+    MSGSPEC_AVAILABLE = False
+
+from ..retry import WithRetry
+from .block_parser import block_from_mapping
+
+def _hex0x(h: str) -> str:
+    return h if h[:2] == '0x' else '0x' + h
+
+
+def _to_int(value: Any) -> int:
+    # Raw JSON-RPC quantities are hex strings; formatted ones are ints.
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+def _install_orjson_batch_encoder(provider: Any) -> None:
+    """Serialize JSON-RPC batch payloads for *provider* with orjson."""
+    if not ORJSON_AVAILABLE or getattr(provider, '_orjson_batch_encoder', False):
+        return
+    if not hasattr(provider, 'encode_batch_rpc_request') or not hasattr(provider, 'request_counter'):
+        return
+
+    default_encode = provider.encode_batch_rpc_request
+
+    def encode_batch_rpc_request(requests):
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "method": method,
+                "params": params or [],
+                "id": next(provider.request_counter),
+            }
+            for method, params in requests
+        ]
+        try:
+            return orjson.dumps(payload)
+        except TypeError:
+            # Params orjson cannot serialize (e.g. HexBytes) use web3's encoder.
+            return default_encode(requests)
+
+    provider.encode_batch_rpc_request = encode_batch_rpc_request
+    provider._orjson_batch_encoder = True
+
+
+def _install_msgspec_response_decoder(provider: Any) -> None:
+    """Decode JSON-RPC responses for *provider* with msgspec.
+
+    orjson is not used here because it turns integers wider than 64 bits into
+    floats; msgspec keeps them exact.
+    """
+    if not MSGSPEC_AVAILABLE or getattr(provider, '_msgspec_response_decoder', False):
+        return
+    if not hasattr(provider, 'decode_rpc_response'):
+        return
+
+    default_decode = provider.decode_rpc_response
+    decode = msgspec.json.Decoder().decode
+
+    def decode_rpc_response(raw_response):
+        try:
+            return decode(raw_response)
+        except msgspec.DecodeError:
+            # Let web3's decoder produce its usual error for malformed bodies.
+            return default_decode(raw_response)
+
+    provider.decode_rpc_response = decode_rpc_response
+    provider._msgspec_response_decoder = True
+
+
+# Default upper bound on concurrent RPC calls: sub-batches, or per-request
+# calls when a batch request fails.
+FALLBACK_MAX_WORKERS = 16
+
+# Many providers cap JSON-RPC batches at 20 requests; larger batches are split
+# and the sub-batches sent concurrently.
+BATCH_CHUNK_SIZE = 20
+
+# Failed batches are split in half until they are this small, then sent
+# request by request.
+MIN_SPLIT_SIZE = 4
+
+# JSON-RPC error code for methods the node does not implement.
+_METHOD_NOT_FOUND = -32601
+
+# Default sizes of the per-client caches of mined blocks and receipts.
+BLOCK_CACHE_SIZE = 1024
+RECEIPT_CACHE_SIZE = 10000
+
+# Default depth below the head at which a block or receipt is cached;
+# shallower ones can still be reorged out.
+BLOCK_FINALITY_DEPTH = 12
+
+# Default number of receipts kept in an on-disk receipt store.
+RECEIPT_STORE_SIZE = 100000
+
+
+def _is_transient(err: Exception) -> bool:
+    if isinstance(err, requests.HTTPError):
+        status = getattr(err.response, 'status_code', None)
+        return status in (408, 429) or (status is not None and status >= 500)
+    return isinstance(err, (requests.ConnectionError, requests.Timeout, ConnectionError, TimeoutError))
+
+
+class _LRUCache:
+    """Thread-safe LRU mapping; a maxsize of 0 disables caching."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        if not self.maxsize:
+            return None
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+            return value
+
+    def put(self, key: Any, value: Any) -> None:
+        if not self.maxsize:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._data)}
+
+
+def _json_default(value: Any) -> Any:
+    # web3's AttributeDict is a Mapping, not a dict.
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, (bytes, bytearray)):
+        return '0x' + bytes(value).hex()
+    raise TypeError(f"cannot serialize {type(value).__name__}")
+
+
+def _dumps_receipt(receipt: Any) -> str:
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(receipt, default=_json_default).decode()
+        except TypeError:
+            # Integers wider than 64 bits; the stdlib encoder keeps them exact.
+            pass
+    return json.dumps(receipt, default=_json_default)
+
+
+# msgspec decodes faster than json and, unlike orjson, keeps wide ints exact.
+_loads_receipt = msgspec.json.Decoder().decode if MSGSPEC_AVAILABLE else json.loads
+
+
+class _ReceiptStore:
+    """Receipts persisted in SQLite, so final receipts survive restarts.
+
+    Entries beyond *maxsize* are evicted oldest first.
+    """
+
+    def __init__(self, path: str, maxsize: int):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS receipts (hash TEXT PRIMARY KEY, receipt TEXT NOT NULL)"
+            )
+
+    def get_many(self, hashes: List[str]) -> Dict[str, Any]:
+        found = {}
+        with self._lock:
+            # SQLite limits bound parameters per statement (999 before 3.32).
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT hash, receipt FROM receipts WHERE hash IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for tx_hash, receipt in rows:
+                    found[tx_hash] = _loads_receipt(receipt)
+        return found
+
+    def put_many(self, items: List[tuple]) -> None:
+        rows = [(tx_hash, _dumps_receipt(receipt)) for tx_hash, receipt in items]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO receipts VALUES (?, ?)", rows)
+            self._conn.execute(
+                "DELETE FROM receipts WHERE rowid <= (SELECT MAX(rowid) FROM receipts) - ?",
+                (self.maxsize,),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
 
 
 @dataclass
 class BatchReceiptRequest:
+    # Explicit __slots__ (dataclass(slots=True) needs Python 3.10+).
+    __slots__ = ('hash', 'key', '_hash')
+
     hash: str
     key: str
 
+    def __post_init__(self):
+        # The 0x-prefixed form sent to the node and used as the cache key,
+        # normalized once; the caller's hash is left as given.
+        self._hash = _hex0x(self.hash)
+
 
 @dataclass
 class BatchReceiptResponse:
+    __slots__ = ('receipt', 'error', 'key')
+
     receipt: Optional[Dict[str, Any]]
     error: Optional[Exception]
     key: str
@@ -28,11 +262,15 @@ class BatchReceiptResponse:
 
 @dataclass
 class BatchReceiptResult:
+    __slots__ = ('responses',)
+
     responses: List[BatchReceiptResponse]
 
 
 @dataclass
 class BatchBlockResponse:
+    __slots__ = ('block_number', 'block', 'error')
+
     block_number: int
     block: Optional[Dict[str, Any]]
     error: Optional[Exception]
@@ -40,151 +278,471 @@ class BatchBlockResponse:
 
 class BatchClient:
 
-    def __init__(self, web3: Web3):
+    def __init__(
+        self,
+        web3: Web3,
+        batch_size: int = BATCH_CHUNK_SIZE,
+        block_cache_size: int = BLOCK_CACHE_SIZE,
+        receipt_cache_size: int = RECEIPT_CACHE_SIZE,
+        with_retry: Optional[WithRetry] = None,
+        max_workers: int = FALLBACK_MAX_WORKERS,
+        receipt_finality_depth: int = BLOCK_FINALITY_DEPTH,
+        block_finality_depth: int = BLOCK_FINALITY_DEPTH,
+        receipt_store_path: Optional[str] = None,
+        receipt_store_size: int = RECEIPT_STORE_SIZE,
+    ):
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        if receipt_finality_depth < 0:
+            raise ValueError("receipt_finality_depth must not be negative")
+        if block_finality_depth < 0:
+            raise ValueError("block_finality_depth must not be negative")
+        if receipt_store_path is not None and not receipt_finality_depth:
+            # Receipts outlive the process there; only final ones may be kept.
+            raise ValueError("receipt_store_path requires a positive receipt_finality_depth")
         self.web3 = web3
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        # Transient failures of a batch are retried up to twice before it is split.
+        self.with_retry = with_retry if with_retry is not None else WithRetry(max_attempts=2, base_delay=0.1)
+        # Found blocks and receipts are cached and returned as shared dicts;
+        # callers must not mutate them.
+        self._block_cache = _LRUCache(block_cache_size)
+        self._receipt_cache = _LRUCache(receipt_cache_size)
+        # Receipts are only cached once their block is this many blocks below
+        # the head (BLOCK_FINALITY_DEPTH by default), so a reorg cannot leave a
+        # stale one behind. 0 caches them as soon as they are mined.
+        self.receipt_finality_depth = receipt_finality_depth
+        # Likewise for blocks, which are cached by number.
+        self.block_finality_depth = block_finality_depth
+        # Optional on-disk store behind the receipt cache, shared across runs.
+        self._receipt_store = (
+            _ReceiptStore(receipt_store_path, receipt_store_size)
+            if receipt_store_path is not None else None
+        )
+        provider = getattr(web3, 'provider', None)
+        # Bound once; each attribute hop on Web3 objects costs a lookup.
+        self._request_blocking = web3.manager.request_blocking
+        # web3 7 has no manager-level blocking batch call; the provider's one
+        # returns the raw responses and skips web3's result formatters.
+        self._request_blocking_batch = getattr(web3.manager, 'request_blocking_batch', None)
+        if self._request_blocking_batch is None:
+            self._request_blocking_batch = provider.make_batch_request
+        _install_orjson_batch_encoder(provider)
+        _install_msgspec_response_decoder(provider)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        # Whether the node serves eth_getBlockReceipts; None until first used.
+        self._supports_block_receipts: Optional[bool] = None
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        pool = self._pool
+        if pool is None:
+            # Locked so concurrent first calls cannot each start an executor.
+            with self._pool_lock:
+                pool = self._pool
+                if pool is None:
+                    pool = self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="batch-client"
+                    )
+        return pool
+
+    def close(self) -> None:
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+        if self._receipt_store is not None:
+            self._receipt_store.close()
+            self._receipt_store = None
+
+    def clear_cache(self) -> None:
+        self._block_cache.clear()
+        self._receipt_cache.clear()
+
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit, miss and size counts of the block and receipt caches."""
+        return {'blocks': self._block_cache.stats(), 'receipts': self._receipt_cache.stats()}
+
+    def _cache_receipts(self, found: List[tuple]) -> None:
+        """Cache (hash, receipt) pairs whose blocks are deep enough to be final."""
+        if not found or not (self._receipt_cache.maxsize or self._receipt_store):
+            return
+        depth = self.receipt_finality_depth
+        if depth:
+            latest = self._head_block_number()
+            if latest is None:
+                return
+            found = [
+                (tx_hash, receipt) for tx_hash, receipt in found
+                if _to_int(receipt['blockNumber']) + depth <= latest
+            ]
+        for tx_hash, receipt in found:
+            self._receipt_cache.put(tx_hash, receipt)
+        if self._receipt_store is not None and found:
+            self._receipt_store.put_many(found)
+
+    def _cache_blocks(self, found: List[BatchBlockResponse]) -> None:
+        """Cache fetched blocks that are deep enough to be final."""
+        if not found or not self._block_cache.maxsize:
+            return
+        depth = self.block_finality_depth
+        if depth:
+            latest = self._head_block_number()
+            if latest is None:
+                return
+            found = [response for response in found if response.block_number + depth <= latest]
+        for response in found:
+            self._block_cache.put(response.block_number, response.block)
+
+    def _head_block_number(self) -> Optional[int]:
+        try:
+            return _to_int(self._request_blocking('eth_blockNumber', []))
+        except Exception:
+            return None
+
+    def _lookup_cached_receipts(
+        self, requests: List[BatchReceiptRequest], responses: List[Optional[BatchReceiptResponse]]
+    ) -> List[int]:
+        """Fill *responses* from the memory cache, then the store; return the missing indices."""
+        cache = self._receipt_cache
+        missing = []
+        for i, req in enumerate(requests):
+            receipt = cache.get(req._hash)
+            if receipt is not None:
+                responses[i] = BatchReceiptResponse(receipt=receipt, error=None, key=req.key)
+            else:
+                missing.append(i)
+
+        if missing and self._receipt_store is not None:
+            stored = self._receipt_store.get_many([requests[i]._hash for i in missing])
+            if stored:
+                still_missing = []
+                for i in missing:
+                    req = requests[i]
+                    receipt = stored.get(req._hash)
+                    if receipt is None:
+                        still_missing.append(i)
+                        continue
+                    cache.put(req._hash, receipt)
+                    responses[i] = BatchReceiptResponse(receipt=receipt, error=None, key=req.key)
+                missing = still_missing
+        return missing
+
+    def _request_batch(self, batch_requests: List[tuple]) -> List[Optional[Any]]:
+        """Send *batch_requests* in sub-batches; None marks a request to be sent on its own."""
+        size = self.batch_size
+        if len(batch_requests) <= size:
+            return self._request_chunk(batch_requests)
+
+        starts = range(0, len(batch_requests), size)
+        chunks = [batch_requests[start:start + size] for start in starts]
+        # Each sub-batch result fills its own slot of a preallocated list.
+        raw_responses = [None] * len(batch_requests)
+        for start, chunk_responses in zip(starts, self._get_pool().map(self._request_chunk, chunks)):
+            raw_responses[start:start + size] = chunk_responses
+        return raw_responses
+
+    def _request_chunk(self, chunk: List[tuple]) -> List[Optional[Any]]:
+        raw_responses = None
+
+        def attempt():
+            nonlocal raw_responses
+            try:
+                raw = self._request_blocking_batch(chunk)
+            except Exception as err:
+                return _is_transient(err), err
+            if not isinstance(raw, list):
+                # The whole batch was rejected with a single error response.
+                return False, Exception(f"batch request failed: {raw}")
+            if len(raw) != len(chunk):
+                return False, ValueError(
+                    f"batch returned {len(raw)} responses for {len(chunk)} requests"
+                )
+            raw_responses = raw
+            return False, None
+
+        err = self.with_retry.do(attempt)
+        if err is None:
+            return raw_responses
+
+        if _is_transient(err):
+            # The node itself is unreachable or overloaded; splitting would only
+            # repeat the retries per half, so every request fails with the error.
+            error = {'error': {'message': str(err)}}
+            return [error] * len(chunk)
+
+        # A persistent rejection is often one bad request poisoning the batch:
+        # retry the halves, and send small remainders request by request.
+        if len(chunk) <= MIN_SPLIT_SIZE:
+            return [None] * len(chunk)
+        mid = len(chunk) // 2
+        return self._request_chunk(chunk[:mid]) + self._request_chunk(chunk[mid:])
 
     def get_transaction_receipts_batch(
         self, 
         requests: List[BatchReceiptRequest], 
         timeout: float = 30.0
     ) -> BatchReceiptResult:
-        # Prepare batch requests
-        batch_requests = []
-        for req in requests:
-            tx_hash = req.hash
-            if not tx_hash.startswith('0x'):
-                tx_hash = '0x' + tx_hash
-            batch_requests.append(('eth_getTransactionReceipt', [tx_hash]))
-        
-        try:
-            raw_responses = self.web3.manager.request_blocking_batch(batch_requests)
-            
-            responses = []
-            for i, (req, raw_response) in enumerate(zip(requests, raw_responses)):
-                if 'error' in raw_response:
-                    error_msg = raw_response['error'].get('message', 'Unknown error')
-                    response = BatchReceiptResponse(
-                        receipt=None,
-                        error=Exception(error_msg),
-                        key=req.key
-                    )
-                elif raw_response.get('result') is None:
-                    response = BatchReceiptResponse(
+        responses = [None] * len(requests)
+        missing = self._lookup_cached_receipts(requests, responses)
+
+        if missing:
+            fetched = self._fetch_receipts([requests[i] for i in missing])
+            found = []
+            for i, response in zip(missing, fetched):
+                responses[i] = response
+                if response.error is None:
+                    found.append((requests[i]._hash, response.receipt))
+            self._cache_receipts(found)
+
+        return BatchReceiptResult(responses=responses)
+
+    def get_transaction_receipts_grouped(
+        self,
+        requests: List[BatchReceiptRequest]
+    ) -> BatchReceiptResult:
+        """
+        Like get_transaction_receipts_batch, but fetch receipts per block.
+
+        Transactions are located with one eth_getTransactionByHash batch, then
+        all receipts of each distinct block come from one eth_getBlockReceipts
+        call: B block calls instead of N receipt calls when many transactions
+        share few blocks. Lookups that fail, and nodes without
+        eth_getBlockReceipts, use the per-hash path.
+        """
+        if self._supports_block_receipts is False:
+            return self.get_transaction_receipts_batch(requests)
+
+        responses = [None] * len(requests)
+        lookups = self._lookup_cached_receipts(requests, responses)
+
+        by_block: Dict[str, List[int]] = {}
+        per_hash = []
+        if lookups:
+            raw_txs = self._request_batch(
+                [('eth_getTransactionByHash', [requests[i]._hash]) for i in lookups]
+            )
+            for i, raw_tx in zip(lookups, raw_txs):
+                if raw_tx is None or 'error' in raw_tx:
+                    per_hash.append(i)
+                    continue
+                tx = raw_tx.get('result')
+                block_hash = tx.get('blockHash') if tx else None
+                if block_hash is None:
+                    # Unknown or still pending: no receipt yet.
+                    req = requests[i]
+                    responses[i] = BatchReceiptResponse(
                         receipt=None,
                         error=TransactionNotFound(f"Transaction {req.hash} not found"),
                         key=req.key
                     )
                 else:
-                    response = BatchReceiptResponse(
-                        receipt=raw_response['result'],
-                        error=None,
-                        key=req.key
-                    )
-                responses.append(response)
-            
-            return BatchReceiptResult(responses=responses)
-            
-        except Exception as e:
-            # Fallback: try individual requests
-            responses = []
-            for req in requests:
-                try:
-                    tx_hash = req.hash
-                    if not tx_hash.startswith('0x'):
-                        tx_hash = '0x' + tx_hash
-                    receipt = self.web3.eth.get_transaction_receipt(tx_hash)
-                    response = BatchReceiptResponse(
-                        receipt=dict(receipt),
-                        error=None,
-                        key=req.key
-                    )
-                except TransactionNotFound:
-                    response = BatchReceiptResponse(
-                        receipt=None,
-                        error=TransactionNotFound(f"Transaction {req.hash} not found"),
-                        key=req.key
-                    )
-                except Exception as err:
-                    response = BatchReceiptResponse(
-                        receipt=None,
-                        error=err,
-                        key=req.key
-                    )
-                responses.append(response)
-            
-            return BatchReceiptResult(responses=responses)
+                    by_block.setdefault(block_hash, []).append(i)
+
+        found = []
+        if by_block:
+            block_hashes = list(by_block)
+            raw_blocks = self._request_batch(
+                [('eth_getBlockReceipts', [block_hash]) for block_hash in block_hashes]
+            )
+            for block_hash, raw_block in zip(block_hashes, raw_blocks):
+                indices = by_block[block_hash]
+                receipts = raw_block.get('result') if raw_block is not None else None
+                if not isinstance(receipts, list):
+                    error = raw_block.get('error') if raw_block is not None else None
+                    if isinstance(error, dict) and error.get('code') == _METHOD_NOT_FOUND:
+                        self._supports_block_receipts = False
+                    per_hash.extend(indices)
+                    continue
+
+                self._supports_block_receipts = True
+                by_hash = {receipt['transactionHash'].lower(): receipt for receipt in receipts}
+                for i in indices:
+                    req = requests[i]
+                    receipt = by_hash.get(req._hash.lower())
+                    if receipt is None:
+                        per_hash.append(i)
+                        continue
+                    found.append((req._hash, receipt))
+                    responses[i] = BatchReceiptResponse(receipt=receipt, error=None, key=req.key)
+        self._cache_receipts(found)
+
+        if per_hash:
+            fallback = self.get_transaction_receipts_batch([requests[i] for i in per_hash])
+            for i, response in zip(per_hash, fallback.responses):
+                responses[i] = response
+
+        return BatchReceiptResult(responses=responses)
+
+    def _fetch_receipts(self, requests: List[BatchReceiptRequest]) -> List[BatchReceiptResponse]:
+        # Prepare batch requests
+        batch_requests = [('eth_getTransactionReceipt', [req._hash]) for req in requests]
+        
+        raw_responses = self._request_batch(batch_requests)
+        
+        responses = [None] * len(requests)
+        unsent = []
+        for i, (req, raw_response) in enumerate(zip(requests, raw_responses)):
+            if raw_response is None:
+                unsent.append(i)
+                continue
+            if 'error' in raw_response:
+                error_msg = raw_response['error'].get('message', 'Unknown error')
+                response = BatchReceiptResponse(
+                    receipt=None,
+                    error=Exception(error_msg),
+                    key=req.key
+                )
+            elif raw_response.get('result') is None:
+                response = BatchReceiptResponse(
+                    receipt=None,
+                    error=TransactionNotFound(f"Transaction {req.hash} not found"),
+                    key=req.key
+                )
+            else:
+                response = BatchReceiptResponse(
+                    receipt=raw_response['result'],
+                    error=None,
+                    key=req.key
+                )
+            responses[i] = response
+        
+        if unsent:
+            # Fallback: issue individual requests concurrently, preserving order
+            fetched = self._get_pool().map(self._get_transaction_receipt, [requests[i] for i in unsent])
+            for i, response in zip(unsent, fetched):
+                responses[i] = response
+        
+        return responses
+
+    def _get_transaction_receipt(self, req: BatchReceiptRequest) -> BatchReceiptResponse:
+        # The raw RPC returns None for unknown or pending transactions, which
+        # avoids raising and catching TransactionNotFound for every miss.
+        try:
+            receipt = self._request_blocking('eth_getTransactionReceipt', [req._hash])
+        except Exception as err:
+            return BatchReceiptResponse(
+                receipt=None,
+                error=err,
+                key=req.key
+            )
+
+        if receipt is None:
+            return BatchReceiptResponse(
+                receipt=None,
+                error=TransactionNotFound(f"Transaction {req.hash} not found"),
+                key=req.key
+            )
+        # Returned as-is (an AttributeDict once web3's middleware has run):
+        # receipts are read-only results and need no copy.
+        return BatchReceiptResponse(
+            receipt=receipt,
+            error=None,
+            key=req.key
+        )
 
     def get_blocks_batch(
         self, 
         block_numbers: List[int]
     ) -> List[BatchBlockResponse]:
-        batch_requests = []
-        for block_number in block_numbers:
-            block_hex = hex(block_number) if block_number >= 0 else 'latest'
-            batch_requests.append(('eth_getBlockByNumber', [block_hex, True]))
+        cache = self._block_cache
+        responses = [None] * len(block_numbers)
+        missing = []
+        for i, block_number in enumerate(block_numbers):
+            # Negative numbers mean 'latest', which is never cached.
+            block = cache.get(block_number) if block_number >= 0 else None
+            if block is not None:
+                responses[i] = BatchBlockResponse(block_number=block_number, block=block, error=None)
+            else:
+                missing.append(i)
+
+        if missing:
+            fetched = self._fetch_blocks([block_numbers[i] for i in missing])
+            for i, response in zip(missing, fetched):
+                responses[i] = response
+            self._cache_blocks([
+                response for response in fetched
+                if response.error is None and response.block_number >= 0
+            ])
+
+        return responses
+
+    def _fetch_blocks(self, block_numbers: List[int]) -> List[BatchBlockResponse]:
+        batch_requests = [
+            ('eth_getBlockByNumber', [hex(block_number) if block_number >= 0 else 'latest', True])
+            for block_number in block_numbers
+        ]
         
-        try:
-            raw_responses = self.web3.manager.request_blocking_batch(batch_requests)
-            
-            responses = []
-            for block_number, raw_response in zip(block_numbers, raw_responses):
-                if 'error' in raw_response:
-                    error_msg = raw_response['error'].get('message', 'Unknown error')
-                    response = BatchBlockResponse(
-                        block_number=block_number,
-                        block=None,
-                        error=Exception(error_msg)
-                    )
-                elif raw_response.get('result') is None:
-                    # Block not found
-                    response = BatchBlockResponse(
-                        block_number=block_number,
-                        block=None,
-                        error=BlockNotFound(f"Block {block_number} not found")
-                    )
-                else:
-                    try:
-                        block_json = json.dumps(raw_response['result']).encode('utf-8')
-                        block_data = block_from_json(block_json)
-                        response = BatchBlockResponse(
-                            block_number=block_number,
-                            block=block_data,
-                            error=None
-                        )
-                    except Exception as e:
-                        response = BatchBlockResponse(
-                            block_number=block_number,
-                            block=None,
-                            error=e
-                        )
-                responses.append(response)
-            
-            return responses
-            
-        except Exception as e:
-            responses = []
-            for block_number in block_numbers:
+        raw_responses = self._request_batch(batch_requests)
+        
+        responses = [None] * len(block_numbers)
+        unsent = []
+        for i, (block_number, raw_response) in enumerate(zip(block_numbers, raw_responses)):
+            if raw_response is None:
+                unsent.append(i)
+                continue
+            if 'error' in raw_response:
+                error_msg = raw_response['error'].get('message', 'Unknown error')
+                response = BatchBlockResponse(
+                    block_number=block_number,
+                    block=None,
+                    error=Exception(error_msg)
+                )
+            elif raw_response.get('result') is None:
+                # Block not found
+                response = BatchBlockResponse(
+                    block_number=block_number,
+                    block=None,
+                    error=BlockNotFound(f"Block {block_number} not found")
+                )
+            else:
                 try:
-                    block = self.web3.eth.get_block(block_number, full_transactions=True)
-                    block_json = json.dumps(dict(block)).encode('utf-8')
-                    block_data = block_from_json(block_json)
+                    block_data = block_from_mapping(raw_response['result'])
                     response = BatchBlockResponse(
                         block_number=block_number,
                         block=block_data,
                         error=None
                     )
-                except BlockNotFound:
+                except Exception as e:
                     response = BatchBlockResponse(
                         block_number=block_number,
                         block=None,
-                        error=BlockNotFound(f"Block {block_number} not found")
+                        error=e
                     )
-                except Exception as err:
-                    response = BatchBlockResponse(
-                        block_number=block_number,
-                        block=None,
-                        error=err
-                    )
-                responses.append(response)
-            
-            return responses
+            responses[i] = response
+        
+        if unsent:
+            # Fallback: issue individual requests concurrently, preserving order
+            fetched = self._get_pool().map(self._get_block, [block_numbers[i] for i in unsent])
+            for i, response in zip(unsent, fetched):
+                responses[i] = response
+        
+        return responses
+
+    def _get_block(self, block_number: int) -> BatchBlockResponse:
+        # Raw RPC, as for receipts: skips web3's result formatters, since
+        # block_from_mapping converts the hex fields itself.
+        block_hex = hex(block_number) if block_number >= 0 else 'latest'
+        try:
+            block = self._request_blocking('eth_getBlockByNumber', [block_hex, True])
+            if block is None:
+                return BatchBlockResponse(
+                    block_number=block_number,
+                    block=None,
+                    error=BlockNotFound(f"Block {block_number} not found")
+                )
+            block_data = block_from_mapping(block)
+            return BatchBlockResponse(
+                block_number=block_number,
+                block=block_data,
+                error=None
+            )
+        except Exception as err:
+            return BatchBlockResponse(
+                block_number=block_number,
+                block=None,
+                error=err
+            )
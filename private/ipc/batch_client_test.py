@@ -4,12 +4,16 @@
 import os
 import time
 import pytest
+from unittest.mock import Mock
 from eth_account import Account
 from web3 import Web3
-from web3.exceptions import BlockNotFound
+from web3.exceptions import BlockNotFound, TransactionNotFound
 
-from .batch_client import BatchClient, BatchReceiptRequest, BatchBlockResponse
+from .batch_client import (
+    BatchClient, BatchReceiptRequest, BatchReceiptResponse, BatchReceiptResult, BatchBlockResponse
+)
 from .client import Client, Config
+from ..retry import WithRetry
 from ..ipctest.ipctest import new_funded_account, to_wei
 
 
@@ -194,5 +198,404 @@ def test_get_blocks_batch():
     assert not_found_blocks == 1
 
 
+def test_get_transaction_receipts_batch_response_mapping():
+    web3 = Mock()
+    web3.manager.request_blocking_batch.return_value = [
+        {'result': {'status': 1, 'transactionHash': '0x01'}},
+        {'result': None},
+        {'error': {'message': 'boom'}},
+    ]
+    batch_client = BatchClient(web3)
+
+    result = batch_client.get_transaction_receipts_batch([
+        BatchReceiptRequest(hash='01', key='a'),
+        BatchReceiptRequest(hash='0x02', key='b'),
+        BatchReceiptRequest(hash='0x03', key='c'),
+    ])
+
+    web3.manager.request_blocking_batch.assert_called_once_with([
+        ('eth_getTransactionReceipt', ['0x01']),
+        ('eth_getTransactionReceipt', ['0x02']),
+        ('eth_getTransactionReceipt', ['0x03']),
+    ])
+    assert [r.key for r in result.responses] == ['a', 'b', 'c']
+    assert result.responses[0].receipt == {'status': 1, 'transactionHash': '0x01'}
+    assert isinstance(result.responses[1].error, TransactionNotFound)
+    assert str(result.responses[2].error) == 'boom'
+
+
+def test_get_transaction_receipts_batch_chunked():
+    web3 = Mock()
+    web3.manager.request_blocking_batch.side_effect = lambda batch: [
+        {'result': {'transactionHash': params[0]}} for _, params in batch
+    ]
+    batch_client = BatchClient(web3, batch_size=20)
+
+    requests = [BatchReceiptRequest(hash=f'{i:02x}', key=f'tx-{i}') for i in range(45)]
+    result = batch_client.get_transaction_receipts_batch(requests)
+    batch_client.close()
+
+    sizes = [len(call.args[0]) for call in web3.manager.request_blocking_batch.call_args_list]
+    assert sorted(sizes) == [5, 20, 20]
+    assert [r.key for r in result.responses] == [f'tx-{i}' for i in range(45)]
+    assert [r.receipt['transactionHash'] for r in result.responses] == [f'0x{i:02x}' for i in range(45)]
+
+
+def test_get_transaction_receipts_batch_fallback():
+    web3 = Mock()
+    web3.manager.request_blocking_batch.side_effect = Exception("batch not supported")
+
+    def request_blocking(method, params):
+        assert method == 'eth_getTransactionReceipt'
+        if params[0] == '0x02':
+            return None
+        return {'transactionHash': params[0], 'status': 1}
+
+    web3.manager.request_blocking.side_effect = request_blocking
+    batch_client = BatchClient(web3)
+
+    requests = [BatchReceiptRequest(hash=f'0{i}', key=f'tx-{i}') for i in range(1, 6)]
+    result = batch_client.get_transaction_receipts_batch(requests)
+    batch_client.close()
+
+    assert [r.key for r in result.responses] == [f'tx-{i}' for i in range(1, 6)]
+    assert result.responses[0].receipt == {'transactionHash': '0x01', 'status': 1}
+    assert isinstance(result.responses[1].error, TransactionNotFound)
+    assert result.responses[1].receipt is None
+    assert result.responses[4].receipt['transactionHash'] == '0x05'
+
+
+def test_get_transaction_receipts_batch_fallback_is_concurrent():
+    import threading
+
+    # Every request waits until all four are in flight at the same time.
+    barrier = threading.Barrier(4, timeout=5)
+
+    def request_blocking(method, params):
+        barrier.wait()
+        return {'transactionHash': params[0]}
+
+    web3 = Mock()
+    web3.manager.request_blocking_batch.side_effect = Exception("batch not supported")
+    web3.manager.request_blocking.side_effect = request_blocking
+    batch_client = BatchClient(web3, max_workers=4)
+
+    requests = [BatchReceiptRequest(hash=f'0{i}', key=f'tx-{i}') for i in range(4)]
+    result = batch_client.get_transaction_receipts_batch(requests)
+    batch_client.close()
+
+    assert [r.error for r in result.responses] == [None] * 4
+
+
+def test_batch_client_starts_one_pool():
+    import threading
+
+    batch_client = BatchClient(Mock())
+    barrier = threading.Barrier(8, timeout=5)
+    pools = []
+
+    def get_pool():
+        barrier.wait()
+        pools.append(batch_client._get_pool())
+
+    threads = [threading.Thread(target=get_pool) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    batch_client.close()
+
+    assert len({id(pool) for pool in pools}) == 1
+    assert batch_client._pool is None
+
+
+def test_get_blocks_batch_fallback():
+    web3 = Mock()
+    web3.manager.request_blocking_batch.side_effect = Exception("batch not supported")
+
+    def request_blocking(method, params):
+        assert method == 'eth_getBlockByNumber'
+        if params[0] == '0x3':
+            return None
+        return {'number': params[0], 'transactions': []}
+
+    web3.manager.request_blocking.side_effect = request_blocking
+    batch_client = BatchClient(web3)
+
+    responses = batch_client.get_blocks_batch([1, 2, 3, 4])
+    batch_client.close()
+
+    assert [r.block_number for r in responses] == [1, 2, 3, 4]
+    assert responses[0].block['number'] == 1
+    assert isinstance(responses[2].error, BlockNotFound)
+    assert responses[2].block is None
+    assert responses[3].block['number'] == 4
+
+
+def test_get_transaction_receipts_batch_retries_transient_errors():
+    import requests
+
+    calls = []
+
+    def request_blocking_batch(batch):
+        calls.append(len(batch))
+        if len(calls) == 1:
+            raise requests.ConnectionError("reset")
+        return [{'result': {'transactionHash': params[0]}} for _, params in batch]
+
+    web3 = Mock()
+    web3.manager.request_blocking_batch.side_effect = request_blocking_batch
+    batch_client = BatchClient(
+        web3, with_retry=WithRetry(max_attempts=2, base_delay=0), receipt_finality_depth=0
+    )
+
+    requests_ = [BatchReceiptRequest(hash=f'{i:02x}', key=f'tx-{i}') for i in range(3)]
+    result = batch_client.get_transaction_receipts_batch(requests_)
+
+    assert calls == [3, 3]
+    assert web3.manager.request_blocking.call_count == 0
+    assert [r.receipt['transactionHash'] for r in result.responses] == ['0x00', '0x01', '0x02']
+
+
+def test_get_blocks_batch_splits_failing_batch():
+    def request_blocking_batch(batch):
+        if ('eth_getBlockByNumber', ['0x3', True]) in batch:
+            raise ValueError("invalid request in batch")
+        return [{'result': {'number': params[0], 'transactions': []}} for _, params in batch]
+
+    web3 = Mock()
+    web3.manager.request_blocking_batch.side_effect = request_blocking_batch
+    web3.manager.request_blocking.side_effect = lambda method, params: {'number': params[0], 'transactions': []}
+    batch_client = BatchClient(
+        web3, with_retry=WithRetry(max_attempts=2, base_delay=0), block_finality_depth=0
+    )
+
+    responses = batch_client.get_blocks_batch(list(range(10)))
+    batch_client.close()
+
+    assert [r.block['number'] for r in responses] == list(range(10))
+    # Only the smallest failing sub-batch (blocks 0-4 -> 0-1, 2-4) is sent per request.
+    assert sorted(call.args[1][0] for call in web3.manager.request_blocking.call_args_list) == ['0x2', '0x3', '0x4']
+
+
+def test_get_blocks_batch_does_not_split_transient_failure():
+    import requests
+
+    web3 = Mock()
+    web3.manager.request_blocking_batch.side_effect = requests.ConnectionError("refused")
+    batch_client = BatchClient(web3, with_retry=WithRetry(max_attempts=2, base_delay=0))
+
+    responses = batch_client.get_blocks_batch(list(range(10)))
+    batch_client.close()
+
+    assert web3.manager.request_blocking_batch.call_count == 3
+    assert web3.manager.request_blocking.call_count == 0
+    assert all(r.block is None and 'refused' in str(r.error) for r in responses)
+
+
+def test_get_transaction_receipts_grouped():
+    blocks = {'0x01': 'bh-a', '0x02': 'bh-a', '0x03': 'bh-b', '0x04': None}
+    calls = []
+
+    def request_blocking_batch(batch):
+        calls.append(batch[0][0])
+        results = []
+        for method, params in batch:
+            if method == 'eth_getTransactionByHash':
+                block_hash = blocks[params[0]]
+                results.append({'result': {'hash': params[0], 'blockHash': block_hash}})
+            elif method == 'eth_getBlockReceipts':
+                results.append({'result': [
+                    {'transactionHash': tx_hash, 'status': '0x1'}
+                    for tx_hash, block_hash in blocks.items() if block_hash == params[0]
+                ]})
+        return results
+
+    web3 = Mock()
+    web3.manager.request_blocking_batch.side_effect = request_blocking_batch
+    batch_client = BatchClient(web3)
+
+    requests = [BatchReceiptRequest(hash=f'0{i}', key=f'tx-{i}') for i in range(1, 5)]
+    result = batch_client.get_transaction_receipts_grouped(requests)
+
+    assert calls == ['eth_getTransactionByHash', 'eth_getBlockReceipts']
+    assert web3.manager.request_blocking_batch.call_args.args[0] == [
+        ('eth_getBlockReceipts', ['bh-a']),
+        ('eth_getBlockReceipts', ['bh-b']),
+    ]
+    assert [r.key for r in result.responses] == ['tx-1', 'tx-2', 'tx-3', 'tx-4']
+    assert [r.receipt['transactionHash'] for r in result.responses[:3]] == ['0x01', '0x02', '0x03']
+    assert isinstance(result.responses[3].error, TransactionNotFound)
+
+
+def test_get_transaction_receipts_grouped_without_block_receipts():
+    def request_blocking_batch(batch):
+        method = batch[0][0]
+        if method == 'eth_getTransactionByHash':
+            return [{'result': {'hash': params[0], 'blockHash': 'bh'}} for _, params in batch]
+        if method == 'eth_getBlockReceipts':
+            return [{'error': {'code': -32601, 'message': 'method not found'}} for _ in batch]
+        return [{'result': {'transactionHash': params[0]}} for _, params in batch]
+
+    web3 = Mock()
+    web3.manager.request_blocking_batch.side_effect = request_blocking_batch
+    batch_client = BatchClient(web3, receipt_cache_size=0)
+
+    requests = [BatchReceiptRequest(hash='01', key='a'), BatchReceiptRequest(hash='02', key='b')]
+    result = batch_client.get_transaction_receipts_grouped(requests)
+    assert [r.receipt['transactionHash'] for r in result.responses] == ['0x01', '0x02']
+
+    web3.manager.request_blocking_batch.reset_mock()
+    batch_client.get_transaction_receipts_grouped(requests)
+    assert web3.manager.request_blocking_batch.call_count == 1
+    assert web3.manager.request_blocking_batch.call_args.args[0][0][0] == 'eth_getTransactionReceipt'
+
+
+def test_batch_client_caches_found_results():
+    def request_blocking_batch(batch):
+        results = []
+        for method, params in batch:
+            if params[0] in ('0x02', '0x3'):
+                results.append({'result': None})
+            elif method == 'eth_getBlockByNumber':
+                results.append({'result': {'number': params[0], 'transactions': []}})
+            else:
+                results.append({'result': {'transactionHash': params[0], 'blockNumber': '0x1'}})
+        return results
+
+    web3 = Mock()
+    web3.manager.request_blocking_batch.side_effect = request_blocking_batch
+    web3.manager.request_blocking.return_value = '0x64'
+    batch_client = BatchClient(web3)
+
+    batch_client.get_blocks_batch([1, 2, 3])
+    responses = batch_client.get_blocks_batch([1, 2, 3])
+    assert web3.manager.request_blocking_batch.call_args.args[0] == [('eth_getBlockByNumber', ['0x3', True])]
+    assert responses[0].block['number'] == 1
+    assert isinstance(responses[2].error, BlockNotFound)
+
+    batch_client.get_transaction_receipts_batch([
+        BatchReceiptRequest(hash='01', key='a'),
+        BatchReceiptRequest(hash='02', key='b'),
+    ])
+    result = batch_client.get_transaction_receipts_batch([
+        BatchReceiptRequest(hash='01', key='c'),
+        BatchReceiptRequest(hash='02', key='d'),
+    ])
+    assert web3.manager.request_blocking_batch.call_args.args[0] == [('eth_getTransactionReceipt', ['0x02'])]
+    assert result.responses[0].key == 'c'
+    assert result.responses[0].receipt == {'transactionHash': '0x01', 'blockNumber': '0x1'}
+    assert isinstance(result.responses[1].error, TransactionNotFound)
+
+
+def test_batch_client_caches_only_final_receipts():
+    def request_blocking_batch(batch):
+        return [
+            {'result': {'transactionHash': params[0], 'blockNumber': '0x5' if params[0] == '0x01' else '0x9'}}
+            for _, params in batch
+        ]
+
+    web3 = Mock()
+    web3.manager.request_blocking_batch.side_effect = request_blocking_batch
+    web3.manager.request_blocking.return_value = '0xa'
+    batch_client = BatchClient(web3, receipt_finality_depth=3)
+
+    requests = [BatchReceiptRequest(hash='01', key='a'), BatchReceiptRequest(hash='02', key='b')]
+    batch_client.get_transaction_receipts_batch(requests)
+    batch_client.get_transaction_receipts_batch(requests)
+
+    web3.manager.request_blocking.assert_called_with('eth_blockNumber', [])
+    assert web3.manager.request_blocking_batch.call_args.args[0] == [('eth_getTransactionReceipt', ['0x02'])]
+    assert batch_client.cache_stats()['receipts'] == {'hits': 1, 'misses': 3, 'size': 1}
+
+
+def test_batch_client_caches_only_final_blocks():
+    web3 = Mock()
+    web3.manager.request_blocking_batch.side_effect = lambda batch: [
+        {'result': {'number': params[0], 'transactions': []}} for _, params in batch
+    ]
+    web3.manager.request_blocking.return_value = '0xa'
+    batch_client = BatchClient(web3, block_finality_depth=3)
+
+    batch_client.get_blocks_batch([7, 8])
+    batch_client.get_blocks_batch([7, 8])
+
+    web3.manager.request_blocking.assert_called_with('eth_blockNumber', [])
+    assert web3.manager.request_blocking_batch.call_args.args[0] == [('eth_getBlockByNumber', ['0x8', True])]
+    assert batch_client.cache_stats()['blocks'] == {'hits': 1, 'misses': 3, 'size': 1}
+
+
+def test_batch_client_receipt_store_survives_restart(tmp_path):
+    def new_client():
+        web3 = Mock()
+        web3.manager.request_blocking_batch.side_effect = lambda batch: [
+            {'result': {'transactionHash': params[0], 'blockNumber': '0x5'}} for _, params in batch
+        ]
+        web3.manager.request_blocking.return_value = '0xa'
+        client = BatchClient(web3, receipt_finality_depth=3, receipt_store_path=str(tmp_path / "receipts.db"))
+        return web3, client
+
+    requests = [BatchReceiptRequest(hash='01', key='a'), BatchReceiptRequest(hash='02', key='b')]
+    _, first = new_client()
+    first.get_transaction_receipts_batch(requests)
+    first.close()
+
+    web3, second = new_client()
+    result = second.get_transaction_receipts_batch(requests)
+    second.close()
+
+    web3.manager.request_blocking_batch.assert_not_called()
+    assert [r.receipt for r in result.responses] == [
+        {'transactionHash': '0x01', 'blockNumber': '0x5'},
+        {'transactionHash': '0x02', 'blockNumber': '0x5'},
+    ]
+    with pytest.raises(ValueError):
+        BatchClient(Mock(), receipt_finality_depth=0, receipt_store_path=str(tmp_path / "unsafe.db"))
+
+
+def test_batch_encoder_payload():
+    import json
+
+    web3 = Web3(Web3.HTTPProvider("http://127.0.0.1:8545"))
+    BatchClient(web3)
+
+    payload = json.loads(web3.provider.encode_batch_rpc_request([
+        ('eth_getTransactionReceipt', ['0x01']),
+        ('eth_blockNumber', []),
+    ]))
+
+    assert [p['method'] for p in payload] == ['eth_getTransactionReceipt', 'eth_blockNumber']
+    assert payload[0]['params'] == ['0x01']
+    assert payload[0]['jsonrpc'] == '2.0'
+    assert payload[0]['id'] != payload[1]['id']
+
+
+def test_batch_response_decoder():
+    web3 = Web3(Web3.HTTPProvider("http://127.0.0.1:8545"))
+    BatchClient(web3)
+
+    big = 2 ** 70 + 1
+    decoded = web3.provider.decode_rpc_response(
+        b'[{"jsonrpc":"2.0","id":1,"result":{"value":%d}}]' % big
+    )
+    assert decoded[0]['result']['value'] == big
+
+    with pytest.raises(ValueError):
+        web3.provider.decode_rpc_response(b'{not json')
+
+
+def test_batch_types_are_slotted():
+    request = BatchReceiptRequest(hash='01', key='tx')
+    assert request.hash == '01'
+    assert request == BatchReceiptRequest(hash='01', key='tx')
+    for obj in (
+        request,
+        BatchReceiptResponse(receipt=None, error=None, key='tx'),
+        BatchReceiptResult(responses=[]),
+        BatchBlockResponse(block_number=1, block=None, error=None),
+    ):
+        assert not hasattr(obj, '__dict__')
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
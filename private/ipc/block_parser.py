@@ -4,92 +4,118 @@
 from __future__ import annotations
 
 import json
-from typing import Dict, Any, List, Optional
+from collections.abc import Mapping, Sequence
+from typing import Dict, Any, List, Optional, Union
 from web3.exceptions import BlockNotFound
 
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    msgspec = None
+    MSGSPEC_AVAILABLE = False
+
+if MSGSPEC_AVAILABLE:
+    # msgspec decodes straight from bytes and, unlike orjson, keeps integers
+    # wider than 64 bits exact.
+    _json_loads = msgspec.json.Decoder().decode
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError, msgspec.DecodeError)
+else:
+    _json_loads = json.loads
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
+_BLOCK_FIELDS = (
+    'hash', 'number', 'parentHash', 'nonce', 'sha3Uncles', 'logsBloom',
+    'transactionsRoot', 'stateRoot', 'receiptsRoot', 'miner', 'difficulty',
+    'totalDifficulty', 'extraData', 'size', 'gasLimit', 'gasUsed', 'timestamp',
+    'baseFeePerGas', 'mixHash',
+)
+
+# Quantities that JSON-RPC encodes as hex strings. int(value, 16) accepts the
+# "0x" prefix and beats bytes.fromhex + int.from_bytes at every width.
+_BLOCK_HEX_FIELDS = (
+    'number', 'difficulty', 'totalDifficulty', 'size', 'gasLimit', 'gasUsed',
+    'timestamp', 'baseFeePerGas',
+)
+
+_TX_FIELDS = (
+    'hash', 'nonce', 'blockHash', 'blockNumber', 'transactionIndex', 'from',
+    'to', 'value', 'gas', 'gasPrice', 'input', 'v', 'r', 's', 'type',
+    'chainId', 'accessList', 'maxPriorityFeePerGas', 'maxFeePerGas',
+)
+
+_TX_HEX_FIELDS = (
+    'nonce', 'blockNumber', 'transactionIndex', 'value', 'gas', 'gasPrice',
+    'v', 'type', 'chainId', 'maxPriorityFeePerGas', 'maxFeePerGas',
+)
+
+
+# Fields copied as-is; the hex quantities are converted in the same pass.
+_BLOCK_PLAIN_FIELDS = tuple(k for k in _BLOCK_FIELDS if k not in _BLOCK_HEX_FIELDS)
+_TX_PLAIN_FIELDS = tuple(k for k in _TX_FIELDS if k not in _TX_HEX_FIELDS)
+
+_NULL_JSON = (b'null', b'null\n', 'null', 'null\n')
+
+if MSGSPEC_AVAILABLE:
+    # Only the fields the parser reads are decoded and unknown ones are skipped.
+    # Transactions stay zero-copy msgspec.Raw views into the input (keeping it
+    # alive) until they are parsed, or until LazyTransactionList decodes them
+    # on access.
+    _RawBlock = msgspec.defstruct(
+        '_RawBlock',
+        [(key, Any, msgspec.UNSET) for key in _BLOCK_FIELDS] + [
+            ('transactions', Union[List[msgspec.Raw], msgspec.UnsetType], msgspec.UNSET),
+            ('uncles', Any, msgspec.UNSET),
+            ('withdrawals', Any, msgspec.UNSET),
+        ],
+    )
+    _decode_raw_block = msgspec.json.Decoder(Optional[_RawBlock]).decode
+
+    def _loads_block(raw_json: bytes) -> Optional[Dict[str, Any]]:
+        raw = _decode_raw_block(raw_json)
+        if raw is None:
+            return None
+        data = {}
+        for key in _RawBlock.__struct_fields__:
+            value = getattr(raw, key)
+            if value is not msgspec.UNSET:
+                data[key] = value
+        return data
+else:
+    _loads_block = json.loads
+
+
+def block_from_json(raw_json: bytes, lazy_transactions: bool = False) -> Dict[str, Any]:
+    # A missing block is a bare null; skip the decoder for it.
+    if raw_json in _NULL_JSON:
+        raise BlockNotFound("Block not found")
 
-def block_from_json(raw_json: bytes) -> Dict[str, Any]:
     try:
-        data = json.loads(raw_json)
-    except json.JSONDecodeError as e:
+        data = _loads_block(raw_json)
+    except _JSON_DECODE_ERRORS as e:
         raise ValueError(f"Invalid JSON: {e}")
     
     if data is None:
         raise BlockNotFound("Block not found")
     
-    block = {}
-    
-    if 'hash' in data:
-        block['hash'] = data['hash']
-    if 'number' in data:
-        if isinstance(data['number'], str):
-            block['number'] = int(data['number'], 16)
-        else:
-            block['number'] = data['number']
-    if 'parentHash' in data:
-        block['parentHash'] = data['parentHash']
-    if 'nonce' in data:
-        block['nonce'] = data['nonce']
-    if 'sha3Uncles' in data:
-        block['sha3Uncles'] = data['sha3Uncles']
-    if 'logsBloom' in data:
-        block['logsBloom'] = data['logsBloom']
-    if 'transactionsRoot' in data:
-        block['transactionsRoot'] = data['transactionsRoot']
-    if 'stateRoot' in data:
-        block['stateRoot'] = data['stateRoot']
-    if 'receiptsRoot' in data:
-        block['receiptsRoot'] = data['receiptsRoot']
-    if 'miner' in data:
-        block['miner'] = data['miner']
-    if 'difficulty' in data:
-        if isinstance(data['difficulty'], str):
-            block['difficulty'] = int(data['difficulty'], 16)
-        else:
-            block['difficulty'] = data['difficulty']
-    if 'totalDifficulty' in data:
-        if isinstance(data['totalDifficulty'], str):
-            block['totalDifficulty'] = int(data['totalDifficulty'], 16)
-        else:
-            block['totalDifficulty'] = data['totalDifficulty']
-    if 'extraData' in data:
-        block['extraData'] = data['extraData']
-    if 'size' in data:
-        if isinstance(data['size'], str):
-            block['size'] = int(data['size'], 16)
-        else:
-            block['size'] = data['size']
-    if 'gasLimit' in data:
-        if isinstance(data['gasLimit'], str):
-            block['gasLimit'] = int(data['gasLimit'], 16)
-        else:
-            block['gasLimit'] = data['gasLimit']
-    if 'gasUsed' in data:
-        if isinstance(data['gasUsed'], str):
-            block['gasUsed'] = int(data['gasUsed'], 16)
-        else:
-            block['gasUsed'] = data['gasUsed']
-    if 'timestamp' in data:
-        if isinstance(data['timestamp'], str):
-            block['timestamp'] = int(data['timestamp'], 16)
-        else:
-            block['timestamp'] = data['timestamp']
-    if 'baseFeePerGas' in data:
-        if isinstance(data['baseFeePerGas'], str):
-            block['baseFeePerGas'] = int(data['baseFeePerGas'], 16)
-        else:
-            block['baseFeePerGas'] = data['baseFeePerGas']
-    if 'mixHash' in data:
-        block['mixHash'] = data['mixHash']
+    return block_from_mapping(data, lazy_transactions=lazy_transactions)
+
+
+def block_from_mapping(data: Mapping, lazy_transactions: bool = False) -> Dict[str, Any]:
+    """Parse an already-decoded block, e.g. a JSON-RPC result or a web3 AttributeDict.
+
+    ``block['transactions']`` is a plain list. With ``lazy_transactions`` it is
+    a read-only LazyTransactionList instead, for callers that only look at a
+    few transactions and do not need a real list.
+    """
+    block = _copy_fields(data, _BLOCK_PLAIN_FIELDS, _BLOCK_HEX_FIELDS)
     
     transactions = []
     if 'transactions' in data:
-        for tx_data in data['transactions']:
-            if isinstance(tx_data, dict):
-                tx = _parse_transaction(tx_data)
-                transactions.append(tx)
-            else:
-                transactions.append(tx_data)
+        if lazy_transactions:
+            transactions = LazyTransactionList(data['transactions'])
+        else:
+            transactions = [_parse_transaction_item(tx) for tx in data['transactions']]
     block['transactions'] = transactions
     
     uncles = []
@@ -105,79 +131,62 @@ def block_from_json(raw_json: bytes) -> Dict[str, Any]:
     return block
 
 
-def _parse_transaction(tx_data: Dict[str, Any]) -> Dict[str, Any]:
-    tx = {}
-    
-    if 'hash' in tx_data:
-        tx['hash'] = tx_data['hash']
-    if 'nonce' in tx_data:
-        if isinstance(tx_data['nonce'], str):
-            tx['nonce'] = int(tx_data['nonce'], 16)
-        else:
-            tx['nonce'] = tx_data['nonce']
-    if 'blockHash' in tx_data:
-        tx['blockHash'] = tx_data['blockHash']
-    if 'blockNumber' in tx_data:
-        if isinstance(tx_data['blockNumber'], str):
-            tx['blockNumber'] = int(tx_data['blockNumber'], 16)
-        else:
-            tx['blockNumber'] = tx_data['blockNumber']
-    if 'transactionIndex' in tx_data:
-        if isinstance(tx_data['transactionIndex'], str):
-            tx['transactionIndex'] = int(tx_data['transactionIndex'], 16)
-        else:
-            tx['transactionIndex'] = tx_data['transactionIndex']
-    if 'from' in tx_data:
-        tx['from'] = tx_data['from']
-    if 'to' in tx_data:
-        tx['to'] = tx_data['to']
-    if 'value' in tx_data:
-        if isinstance(tx_data['value'], str):
-            tx['value'] = int(tx_data['value'], 16)
-        else:
-            tx['value'] = tx_data['value']
-    if 'gas' in tx_data:
-        if isinstance(tx_data['gas'], str):
-            tx['gas'] = int(tx_data['gas'], 16)
-        else:
-            tx['gas'] = tx_data['gas']
-    if 'gasPrice' in tx_data:
-        if isinstance(tx_data['gasPrice'], str):
-            tx['gasPrice'] = int(tx_data['gasPrice'], 16)
-        else:
-            tx['gasPrice'] = tx_data['gasPrice']
-    if 'input' in tx_data:
-        tx['input'] = tx_data['input']
-    if 'v' in tx_data:
-        if isinstance(tx_data['v'], str):
-            tx['v'] = int(tx_data['v'], 16)
-        else:
-            tx['v'] = tx_data['v']
-    if 'r' in tx_data:
-        tx['r'] = tx_data['r']
-    if 's' in tx_data:
-        tx['s'] = tx_data['s']
-    if 'type' in tx_data:
-        if isinstance(tx_data['type'], str):
-            tx['type'] = int(tx_data['type'], 16)
-        else:
-            tx['type'] = tx_data['type']
-    if 'chainId' in tx_data:
-        if isinstance(tx_data['chainId'], str):
-            tx['chainId'] = int(tx_data['chainId'], 16)
-        else:
-            tx['chainId'] = tx_data['chainId']
-    if 'accessList' in tx_data:
-        tx['accessList'] = tx_data['accessList']
-    if 'maxPriorityFeePerGas' in tx_data:
-        if isinstance(tx_data['maxPriorityFeePerGas'], str):
-            tx['maxPriorityFeePerGas'] = int(tx_data['maxPriorityFeePerGas'], 16)
-        else:
-            tx['maxPriorityFeePerGas'] = tx_data['maxPriorityFeePerGas']
-    if 'maxFeePerGas' in tx_data:
-        if isinstance(tx_data['maxFeePerGas'], str):
-            tx['maxFeePerGas'] = int(tx_data['maxFeePerGas'], 16)
-        else:
-            tx['maxFeePerGas'] = tx_data['maxFeePerGas']
-    
+class LazyTransactionList(Sequence):
+    """Block transactions, each parsed on first access.
+
+    Callers that only look at a few transactions (or only at block fields)
+    do not pay for converting every transaction in the block.
+    """
+
+    __slots__ = ('_raw', '_parsed')
+
+    def __init__(self, raw: Sequence):
+        self._raw = raw
+        self._parsed: List[Any] = [None] * len(raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._raw)))]
+
+        tx = self._parsed[index]
+        if tx is None:
+            tx = _parse_transaction_item(self._raw[index])
+            self._parsed[index] = tx
+        return tx
+
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple, LazyTransactionList)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"LazyTransactionList({list(self)!r})"
+
+
+def _parse_transaction_item(tx: Any) -> Any:
+    if MSGSPEC_AVAILABLE and type(tx) is msgspec.Raw:
+        tx = _json_loads(tx)
+    # Blocks fetched without full transactions hold bare hashes.
+    if isinstance(tx, Mapping):
+        tx = _parse_transaction(tx)
     return tx
+
+
+def _parse_transaction(tx_data: Mapping) -> Dict[str, Any]:
+    return _copy_fields(tx_data, _TX_PLAIN_FIELDS, _TX_HEX_FIELDS)
+
+
+def _copy_fields(data: Mapping, plain_fields: tuple, hex_fields: tuple) -> Dict[str, Any]:
+    # int(value, 16) is already a C call per field; batching the conversions
+    # (map over a list of values) measured slower than this single pass.
+    out = {key: data[key] for key in plain_fields if key in data}
+    for key in hex_fields:
+        if key in data:
+            value = data[key]
+            out[key] = int(value, 16) if type(value) is str else value
+    return out
@@ -7,7 +7,9 @@ from eth_account import Account
 from web3 import Web3
 from web3.exceptions import BlockNotFound
 
-from .block_parser import block_from_json
+from web3.datastructures import AttributeDict
+
+from .block_parser import block_from_json, block_from_mapping
 
 
 def test_parse_block_from_json_valid_block():
@@ -119,5 +121,70 @@ def test_parse_block_from_json_empty_transactions_and_uncles():
     assert len(block['uncles']) == 0
 
 
+def test_parse_block_from_json_hex_quantities():
+    block_data = {
+        'number': '0x10',
+        'hash': '0xabc1230000000000000000000000000000000000000000000000000000000003',
+        'gasLimit': '0x1c9c380',
+        'gasUsed': 21000,
+        'timestamp': '0x61bc6b5d',
+        'baseFeePerGas': '0x7',
+        'extraData': '0x01',
+        'transactions': [],
+    }
+
+    block = block_from_json(json.dumps(block_data).encode('utf-8'))
+
+    assert block['number'] == 16
+    assert block['gasLimit'] == 30000000
+    assert block['gasUsed'] == 21000
+    assert block['timestamp'] == 0x61bc6b5d
+    assert block['baseFeePerGas'] == 7
+    assert block['extraData'] == '0x01'
+    assert 'difficulty' not in block
+    assert block['uncles'] == []
+
+
+def test_parse_block_from_mapping_attribute_dict():
+    tx = AttributeDict({'hash': b'\x01' * 32, 'nonce': 3, 'value': 10, 'gas': 21000})
+    block = AttributeDict({
+        'number': 5,
+        'hash': b'\xab' * 32,
+        'timestamp': 1639738205,
+        'transactions': [tx],
+    })
+
+    parsed = block_from_mapping(block)
+
+    assert parsed['number'] == 5
+    assert parsed['hash'] == b'\xab' * 32
+    assert parsed['transactions'][0]['nonce'] == 3
+    assert parsed['transactions'][0]['gas'] == 21000
+
+
+def test_parse_block_transactions_are_a_list():
+    raw_txs = [{'hash': f'0x{i:02x}', 'nonce': hex(i)} for i in range(2)]
+    block = block_from_json(json.dumps({'number': '0x1', 'transactions': raw_txs}).encode())
+
+    assert isinstance(block['transactions'], list)
+    assert json.loads(json.dumps(block))['transactions'][1] == {'hash': '0x01', 'nonce': 1}
+
+
+def test_parse_block_transactions_lazily():
+    raw_txs = [{'hash': f'0x{i:02x}', 'nonce': hex(i), 'gas': '0x5208'} for i in range(3)]
+    block = block_from_json(
+        json.dumps({'number': '0x1', 'transactions': raw_txs}).encode(), lazy_transactions=True
+    )
+
+    txs = block['transactions']
+    assert len(txs) == 3
+    assert txs[1]['nonce'] == 1
+    assert txs[1] is txs[1]
+    assert [tx['hash'] for tx in txs] == ['0x00', '0x01', '0x02']
+    assert txs[-1]['gas'] == 21000
+    assert txs[:2] == [txs[0], txs[1]]
+    assert txs == [{'hash': f'0x{i:02x}', 'nonce': i, 'gas': 21000} for i in range(3)]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,14 +1,28 @@
-import time
 import threading
-from dataclasses import dataclass
-from typing import Optional, List, Dict, Any, Union
+import time
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Tuple, Union
+import requests
+from requests.adapters import HTTPAdapter
+from eth_abi import decode as abi_decode, encode as abi_encode
 from web3 import Web3
 from web3.middleware.proof_of_authority import ExtraDataToPOAMiddleware
-from web3.exceptions import TransactionNotFound
+from web3.exceptions import TimeExhausted, TransactionNotFound
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
-from .contracts import StorageContract, AccessManagerContract
+from .contracts import (
+    StorageContract, AccessManagerContract, ListPolicyMetaData,
+    deploy_erc1967_proxy, deploy_access_manager, deploy_list_policy,
+)
 from .ipc import StorageData, sign_block
+from .batch_client import BatchClient, BatchReceiptRequest
+
+try:
+    from .contracts import deploy_akave_token, deploy_storage
+except ImportError:
+    # Not generated yet; deploy_contracts reports this when called.
+    deploy_akave_token = None
+    deploy_storage = None
 
 @dataclass
 class Config:
@@ -16,11 +30,26 @@ class Config:
     private_key: str = ""
     storage_contract_address: str = ""
     access_contract_address: str = ""
+    poll_latency: Optional[float] = None
+    # (key, account) derived from private_key, kept on the config that already
+    # holds the key so repeated dials with it skip the derivation.
+    _account: Optional[Tuple[str, LocalAccount]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @staticmethod
     def default_config() -> 'Config':
         return Config()
 
+    def _load_account(self) -> LocalAccount:
+        private_key = self.private_key
+        if private_key.startswith('0x'):
+            private_key = private_key[2:]
+        # Deriving the address is a secp256k1 scalar multiplication.
+        if self._account is None or self._account[0] != private_key:
+            self._account = (private_key, Account.from_key(private_key))
+        return self._account[1]
+
 
 @dataclass 
 class ContractsAddresses:
@@ -32,12 +61,72 @@ class TransactionFailedError(Exception):
     pass
 
 
+class NonceManager:
+    """
+    Hands out consecutive nonces for one account without waiting for each
+    transaction to be mined.
+
+    Seeded from the pending transaction count, so several transactions can be
+    submitted back to back and their receipts awaited together with
+    Client.wait_for_txs. Pass it as ``nonce_manager`` to the StorageContract
+    transaction methods.
+    """
+
+    def __init__(self, web3: Web3, address: str):
+        self._web3 = web3
+        self._address = address
+        self._next: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def get_nonce(self) -> int:
+        with self._lock:
+            if self._next is None:
+                self._next = self._web3.eth.get_transaction_count(self._address, 'pending')
+            nonce = self._next
+            self._next += 1
+            return nonce
+
+    def reset_nonce(self) -> None:
+        """Re-read the pending count on the next call, e.g. after 'nonce too low'."""
+        with self._lock:
+            self._next = None
+
+
+# Receipt poll interval used by wait_for_tx when neither a configured value
+# nor a sampled block time is available.
+DEFAULT_POLL_LATENCY = 0.5
+
+# HTTP connection pool and per-request timeout (seconds) of dialed providers.
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
+HTTP_TIMEOUT = 30
+
+# Multicall3 is deployed at the same address on most EVM chains; chains
+# without it can pass their own deployment to Client.multicall.
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+# Selector of aggregate3((address,bool,bytes)[]).
+_AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")
+
+# RPC methods whose results the dialed provider caches; only results that
+# cannot change for a given node are listed. Receipts are left out: web3 caches
+# any non-null result, so a receipt from a block that is later reorged out
+# would keep being served (BatchClient caches receipts only past
+# receipt_finality_depth). eth_getCode is left out too: it is queried at
+# 'latest' and changes when a contract deploys.
+CACHEABLE_RPC_METHODS = {
+    'eth_chainId',
+    'net_version',
+    'web3_clientVersion',
+}
+
+
 class Client:    
     def __init__(self, web3: Web3, auth: LocalAccount, storage: StorageContract, 
                  access_manager: Optional[AccessManagerContract] = None,
                  list_policy_abi: Optional[dict] = None,
                  addresses: Optional[ContractsAddresses] = None,
-                 chain_id: Optional[int] = None):
+                 chain_id: Optional[int] = None,
+                 poll_latency: Optional[float] = None):
         self.storage = storage
         self.access_manager = access_manager
         self.list_policy_abi = list_policy_abi
@@ -45,11 +134,16 @@ class Client:
         self.eth = web3
         self.addresses = addresses or ContractsAddresses()
         self._chain_id = chain_id
+        # Sampled from the chain on first use of poll_latency, not on dial.
+        self._block_time: Optional[float] = None
+        self._block_time_sampled = False
+        self._poll_latency = poll_latency
+        self._batch_client: Optional[BatchClient] = None
 
     @classmethod
     def dial(cls, config: Config) -> 'Client':
         try:
-            client = Web3(Web3.HTTPProvider(config.dial_uri))
+            client = _new_web3(config.dial_uri)
             if not client.is_connected():
                 raise ConnectionError(f"Failed to connect to {config.dial_uri}")
         except Exception as e:
@@ -58,10 +152,7 @@ class Client:
         client.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
 
         try:
-            private_key = config.private_key
-            if private_key.startswith('0x'):
-                private_key = private_key[2:]
-            account = Account.from_key(private_key)
+            account = config._load_account()
         except Exception as e:
             raise ValueError(f"Failed to load private key: {e}")
 
@@ -76,13 +167,8 @@ class Client:
         if config.access_contract_address:
             access_manager = AccessManagerContract(client, config.access_contract_address)
         
-        list_policy_abi = None
-        try:
-            from .contracts import ListPolicyMetaData
-            list_policy_abi = ListPolicyMetaData.ABI
-        except ImportError:
-            pass  
-        
+        list_policy_abi = ListPolicyMetaData.ABI
+
         addresses = ContractsAddresses(
             storage=config.storage_contract_address,
             access_manager=config.access_contract_address
@@ -95,22 +181,20 @@ class Client:
             access_manager=access_manager,
             list_policy_abi=list_policy_abi,
             addresses=addresses,
-            chain_id=chain_id
+            chain_id=chain_id,
+            poll_latency=config.poll_latency
         )
 
         return ipc_client
 
     @classmethod
     def deploy_contracts(cls, config: Config) -> 'Client':
-        eth_client = Web3(Web3.HTTPProvider(config.dial_uri))
+        eth_client = _new_web3(config.dial_uri)
         if not eth_client.is_connected():
             raise ConnectionError(f"Failed to connect to {config.dial_uri}")
 
         # Setup account
-        private_key = config.private_key
-        if private_key.startswith('0x'):
-            private_key = private_key[2:]
-        account = Account.from_key(private_key)
+        account = config._load_account()
         
         chain_id = eth_client.eth.chain_id
         
@@ -121,102 +205,244 @@ class Client:
             chain_id=chain_id
         )
         
-        try:
-            from .contracts import (
-                deploy_erc1967_proxy, deploy_access_manager, deploy_list_policy, 
-                StorageContract, AccessManagerContract, ListPolicyMetaData
-            )
-            
-            try:
-                from .contracts import deploy_akave_token, deploy_storage
-            except ImportError:
-                raise NotImplementedError(
-                    "AkaveToken and Storage deployment functions are not yet implemented. "
-                    "The following functions are missing: deploy_akave_token, deploy_storage"
-                )
-            
-            akave_token_addr, tx_hash, token_contract = deploy_akave_token(eth_client, account)
-            client.wait_for_tx(tx_hash)
-            
-            storage_impl_addr, tx_hash, _ = deploy_storage(eth_client, account)
-            client.wait_for_tx(tx_hash)
-            
-            storage_abi = StorageContract.get_abi()
-            init_data = StorageContract.encode_function_data("initialize", [akave_token_addr])
-            
-            storage_proxy_addr, tx_hash, _ = deploy_erc1967_proxy(
-                eth_client, account, storage_impl_addr, init_data
-            )
-            client.wait_for_tx(tx_hash)
-            
-            storage = StorageContract(eth_client, storage_proxy_addr)
-            client.storage = storage
-            client.addresses.storage = storage_proxy_addr
-            
-            minter_role = token_contract.functions.MINTER_ROLE().call()
-            tx_hash = token_contract.functions.grantRole(minter_role, storage_proxy_addr).transact({
-                'from': account.address
-            })
-            client.wait_for_tx(tx_hash)
-            
-            access_addr, tx_hash, access_manager = deploy_access_manager(eth_client, account, storage_proxy_addr)
-            client.wait_for_tx(tx_hash)
-            
-            client.access_manager = access_manager
-            client.addresses.access_manager = access_addr
-            
-            tx_hash = storage.set_access_manager(account, access_addr)
-            client.wait_for_tx(tx_hash)
-            
-            base_list_policy_addr, tx_hash, _ = deploy_list_policy(eth_client, account)
-            client.wait_for_tx(tx_hash)
-            
-            client.list_policy_abi = ListPolicyMetaData.ABI
-            
-            return client
-            
-        except ImportError as e:
+        if deploy_akave_token is None or deploy_storage is None:
             raise NotImplementedError(
-                f"Contract deployment functions not available: {e}. "
-                "This feature requires complete contract bindings."
+                "AkaveToken and Storage deployment functions are not yet implemented. "
+                "The following functions are missing: deploy_akave_token, deploy_storage"
             )
 
+        # Steps stay sequential (see wait_for_txs for independent ones): the
+        # bindings take nonces from the mined transaction count and
+        # estimate gas against contracts deployed by the previous step.
+        akave_token_addr, tx_hash, token_contract = deploy_akave_token(eth_client, account)
+        client.wait_for_tx(tx_hash)
+        
+        storage_impl_addr, tx_hash, _ = deploy_storage(eth_client, account)
+        client.wait_for_tx(tx_hash)
+        
+        storage_abi = StorageContract.get_abi()
+        init_data = StorageContract.encode_function_data("initialize", [akave_token_addr])
+        
+        storage_proxy_addr, tx_hash, _ = deploy_erc1967_proxy(
+            eth_client, account, storage_impl_addr, init_data
+        )
+        client.wait_for_tx(tx_hash)
+        
+        storage = StorageContract(eth_client, storage_proxy_addr)
+        client.storage = storage
+        client.addresses.storage = storage_proxy_addr
+        
+        minter_role = token_contract.functions.MINTER_ROLE().call()
+        tx_hash = token_contract.functions.grantRole(minter_role, storage_proxy_addr).transact({
+            'from': account.address
+        })
+        client.wait_for_tx(tx_hash)
+        
+        access_addr, tx_hash, access_manager = deploy_access_manager(eth_client, account, storage_proxy_addr)
+        client.wait_for_tx(tx_hash)
+        
+        client.access_manager = access_manager
+        client.addresses.access_manager = access_addr
+        
+        tx_hash = storage.set_access_manager(account, access_addr)
+        client.wait_for_tx(tx_hash)
+        
+        base_list_policy_addr, tx_hash, _ = deploy_list_policy(eth_client, account)
+        client.wait_for_tx(tx_hash)
+        
+        client.list_policy_abi = ListPolicyMetaData.ABI
+        
+        return client
+
     def chain_id(self) -> int:
         return self._chain_id
 
+    def close(self) -> None:
+        """Release the worker threads of wait_for_txs; the HTTP session is shared and stays open."""
+        if self._batch_client is not None:
+            self._batch_client.close()
+            self._batch_client = None
+
+    def multicall(
+        self,
+        calls: List[Tuple[str, bytes]],
+        allow_failure: bool = False,
+        multicall_address: str = MULTICALL3_ADDRESS,
+    ) -> List[Optional[bytes]]:
+        """
+        Run several contract view calls in one eth_call through Multicall3.
+
+        *calls* are (target address, calldata) pairs, e.g. from a contract
+        function's ``_encode_transaction_data()``. Returns the raw return
+        data of each call, in order. With *allow_failure*, a reverted call
+        yields None instead of reverting the whole aggregate.
+        """
+        if not calls:
+            return []
+        payload = _AGGREGATE3_SELECTOR + abi_encode(
+            ['(address,bool,bytes)[]'],
+            [[(target, allow_failure, bytes(data)) for target, data in calls]],
+        )
+        raw = self.eth.eth.call({'to': multicall_address, 'data': payload})
+        (results,) = abi_decode(['(bool,bytes)[]'], bytes(raw))
+        return [data if success else None for success, data in results]
+
+    @property
+    def poll_latency(self) -> float:
+        """Seconds between receipt polls in wait_for_tx."""
+        if self._poll_latency is not None:
+            return self._poll_latency
+        if not self._block_time_sampled:
+            self._block_time_sampled = True
+            if self._block_time is None:
+                self._block_time = _sample_block_time(self.eth)
+        if self._block_time is not None:
+            # A receipt can only appear once per block; half a block time
+            # bounds the added latency without polling much more often.
+            return self._block_time / 2
+        return DEFAULT_POLL_LATENCY
+
+    @poll_latency.setter
+    def poll_latency(self, value: Optional[float]) -> None:
+        self._poll_latency = value
+
     def wait_for_tx(self, tx_hash: Union[str, bytes], timeout: float = 120.0) -> dict:
-        if isinstance(tx_hash, bytes):
-            tx_hash = tx_hash.hex()
-        if not tx_hash.startswith('0x'):
-            tx_hash = '0x' + tx_hash
+        tx_hash = _normalize_tx_hash(tx_hash)
+        deadline = time.monotonic() + timeout
 
         try:
-            receipt = self.eth.eth.get_transaction_receipt(tx_hash)
-            if receipt.status == 1:
-                return receipt
-            else:
-                raise TransactionFailedError("Transaction failed")
-        except TransactionNotFound:
-            pass  
+            # Already-mined transactions are answered by this first probe.
+            try:
+                receipt = self.eth.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                self._wait_until_mined(tx_hash, deadline)
+                receipt = self.eth.eth.wait_for_transaction_receipt(
+                    tx_hash,
+                    timeout=max(deadline - time.monotonic(), 0),
+                    poll_latency=self.poll_latency,
+                )
+        except (TimeExhausted, TimeoutError):
+            raise TimeoutError(f"Timeout waiting for transaction {tx_hash}")
         except Exception as e:
             raise TransactionFailedError(f"Error checking transaction receipt: {e}")
-        
-        start_time = time.time()
-        poll_interval = 0.2  
-        
+
+        if receipt.status != 1:
+            raise TransactionFailedError("Transaction failed")
+        return receipt
+
+    def _wait_until_mined(self, tx_hash: str, deadline: float) -> None:
+        # eth_getTransactionByHash is cheaper for the node than building a
+        # receipt; a null blockNumber means the transaction is still pending.
         while True:
-            current_time = time.time()
-            if current_time - start_time > timeout:
-                raise TimeoutError(f"Timeout waiting for transaction {tx_hash}")
-            
             try:
-                receipt = self.eth.eth.get_transaction_receipt(tx_hash)
-                if receipt.status == 1:
-                    return receipt
-                else:
-                    raise TransactionFailedError("Transaction failed")
+                if self.eth.eth.get_transaction(tx_hash).blockNumber is not None:
+                    return
             except TransactionNotFound:
-                time.sleep(poll_interval)
-                continue
-            except Exception as e:
-                raise TransactionFailedError(f"Error checking transaction receipt: {e}")
\ No newline at end of file
+                pass
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Timeout waiting for transaction {tx_hash}")
+            time.sleep(min(self.poll_latency, remaining))
+
+    def wait_for_txs(self, tx_hashes: List[Union[str, bytes]], timeout: float = 120.0) -> List[dict]:
+        """
+        Wait for several independent transactions at once.
+
+        Each interval, the still-pending transactions are looked up with one
+        eth_getTransactionByHash batch and the mined ones are fetched with one
+        eth_getBlockReceipts call per block, so the total wait is that of the
+        slowest transaction rather than the sum. Receipts are returned as raw
+        JSON-RPC dicts, in order.
+        """
+        hashes = [_normalize_tx_hash(tx_hash) for tx_hash in tx_hashes]
+        if self._batch_client is None:
+            # Receipts are polled until found; caching them is of no use here.
+            self._batch_client = BatchClient(self.eth, receipt_cache_size=0)
+
+        receipts: List[Optional[dict]] = [None] * len(hashes)
+        pending = list(range(len(hashes)))
+        deadline = time.monotonic() + timeout
+
+        while True:
+            result = self._batch_client.get_transaction_receipts_grouped(
+                [BatchReceiptRequest(hash=hashes[i], key=str(i)) for i in pending]
+            )
+            still_pending = []
+            for i, response in zip(pending, result.responses):
+                if response.receipt is None:
+                    if not isinstance(response.error, TransactionNotFound):
+                        raise TransactionFailedError(
+                            f"Error checking transaction receipt: {response.error}"
+                        )
+                    still_pending.append(i)
+                    continue
+
+                status = response.receipt['status']
+                if type(status) is str:
+                    status = int(status, 16)
+                if status != 1:
+                    raise TransactionFailedError(f"Transaction {hashes[i]} failed")
+                receipts[i] = response.receipt
+
+            pending = still_pending
+            if not pending:
+                return receipts
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Timeout waiting for transactions {[hashes[i] for i in pending]}")
+            time.sleep(min(self.poll_latency, remaining))
+
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def _get_shared_session() -> requests.Session:
+    # One keep-alive session for every dialed client, with room for the
+    # concurrent batch and receipt calls; redialing the same node reuses its
+    # open connections instead of paying for new TCP and TLS handshakes.
+    global _shared_session
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _shared_session = session
+    return _shared_session
+
+
+def _new_web3(dial_uri: str) -> Web3:
+    # web3 caches sessions per thread, so the shared session serves the
+    # dialing thread; BatchClient worker threads get web3's default sessions.
+    return Web3(Web3.HTTPProvider(
+        dial_uri,
+        request_kwargs={'timeout': HTTP_TIMEOUT},
+        session=_get_shared_session(),
+        cache_allowed_requests=True,
+        cacheable_requests=CACHEABLE_RPC_METHODS,
+    ))
+
+
+def _normalize_tx_hash(tx_hash: Union[str, bytes]) -> str:
+    # Prefixed strings are the common case and are returned as-is; bytes
+    # (including HexBytes) are encoded once with the prefix prepended.
+    if isinstance(tx_hash, str):
+        return tx_hash if tx_hash.startswith('0x') else '0x' + tx_hash
+    return '0x' + bytes(tx_hash).hex()
+
+
+def _sample_block_time(web3: Web3, span: int = 10) -> Optional[float]:
+    """Average seconds per block over the last *span* blocks, or None if unknown."""
+    try:
+        latest = web3.eth.get_block('latest')
+        if latest.number < span:
+            return None
+        older = web3.eth.get_block(latest.number - span)
+    except Exception:
+        return None
+    block_time = (latest.timestamp - older.timestamp) / span
+    return block_time if block_time > 0 else None
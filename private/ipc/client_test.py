@@ -9,7 +9,7 @@ import pytest
 from typing import Optional
 from unittest.mock import Mock, patch
 
-from .client import Client, Config, TransactionFailedError
+from .client import Client, Config, NonceManager, TransactionFailedError
 from .ipc import StorageData, sign_block
 from ..ipctest.ipctest import new_funded_account, to_wei, IPCTestError
 
@@ -57,6 +57,15 @@ class TestClient:
         assert config.private_key == "0x123"
         assert config.storage_contract_address == "0xstorage"
 
+    def test_config_load_account(self):
+        key = "0x" + "11" * 32
+        config = Config(private_key=key)
+        account = config._load_account()
+        assert config._load_account() is account
+
+        config.private_key = "22" * 32
+        assert config._load_account().address != account.address
+
     @pytest.mark.integration
     def test_dial_connection(self):
         dial_uri = pick_dial_uri()
@@ -102,6 +111,114 @@ class TestClient:
                 with pytest.raises((TimeoutError, TransactionFailedError)):
                     client.wait_for_tx("0x" + "0" * 64, timeout=0.1)
 
+    def test_wait_for_tx_mined(self):
+        web3 = Mock()
+        receipt = Mock(status=1)
+        web3.eth.get_transaction_receipt.return_value = receipt
+        client = Client(web3=web3, auth=None, storage=None, chain_id=1)
+
+        assert client.wait_for_tx(b"\xab" * 32, timeout=5) is receipt
+        web3.eth.get_transaction_receipt.assert_called_once_with("0x" + "ab" * 32)
+        web3.eth.get_transaction.assert_not_called()
+
+        web3.eth.get_transaction_receipt.return_value = Mock(status=0)
+        with pytest.raises(TransactionFailedError):
+            client.wait_for_tx("ab" * 32)
+
+    def test_wait_for_tx_pending(self):
+        from web3.exceptions import TransactionNotFound
+
+        web3 = Mock()
+        receipt = Mock(status=1)
+        web3.eth.get_transaction_receipt.side_effect = TransactionNotFound("pending")
+        web3.eth.get_transaction.side_effect = [
+            TransactionNotFound("not propagated"),
+            Mock(blockNumber=None),
+            Mock(blockNumber=7),
+        ]
+        web3.eth.wait_for_transaction_receipt.return_value = receipt
+        client = Client(web3=web3, auth=None, storage=None, chain_id=1, poll_latency=0)
+
+        assert client.wait_for_tx("ab" * 32, timeout=5) is receipt
+        assert web3.eth.get_transaction.call_count == 3
+        web3.eth.get_transaction_receipt.assert_called_once()
+        assert web3.eth.wait_for_transaction_receipt.call_args.kwargs['poll_latency'] == 0
+
+        web3.eth.get_transaction.side_effect = None
+        web3.eth.get_transaction.return_value = Mock(blockNumber=None)
+        with pytest.raises(TimeoutError):
+            client.wait_for_tx("ab" * 32, timeout=0.01)
+
+    def test_poll_latency(self):
+        client = Client(web3=Mock(), auth=None, storage=None, chain_id=1)
+        assert client.poll_latency == 0.5
+        client = Client(web3=Mock(), auth=None, storage=None, chain_id=1)
+        blocks = {'latest': Mock(number=100, timestamp=200), 90: Mock(number=90, timestamp=180)}
+        client.eth.eth.get_block.side_effect = blocks.__getitem__
+        assert client.eth.eth.get_block.call_count == 0
+        assert client.poll_latency == 1.0
+        assert client.poll_latency == 1.0
+        assert client.eth.eth.get_block.call_count == 2
+        client._block_time = 2.0
+        assert client.poll_latency == 1.0
+        client.poll_latency = 0.1
+        assert client.poll_latency == 0.1
+
+    def test_wait_for_txs_polls_in_batches(self):
+        web3 = Mock()
+        polls = []
+
+        def request_blocking_batch(batch):
+            method = batch[0][0]
+            if method == 'eth_getBlockReceipts':
+                return [
+                    {'result': [{'transactionHash': h, 'status': '0x1'} for h in blocks[params[0]]]}
+                    for _, params in batch
+                ]
+            polls.append([params[0] for _, params in batch])
+            mined = len(polls) >= 2
+            return [
+                {'result': {'blockHash': '0xb1' if params[0] == '0x01' else '0xb2'}}
+                if mined or params[0] == '0x01' else {'result': {'blockHash': None}}
+                for _, params in batch
+            ]
+
+        blocks = {'0xb1': ['0x01'], '0xb2': ['0x02', '0x03']}
+        web3.manager.request_blocking_batch.side_effect = request_blocking_batch
+        client = Client(web3=web3, auth=None, storage=None, chain_id=1, poll_latency=0)
+
+        receipts = client.wait_for_txs(['01', b'\x02', '0x03'])
+
+        assert polls == [['0x01', '0x02', '0x03'], ['0x02', '0x03']]
+        assert [r['transactionHash'] for r in receipts] == ['0x01', '0x02', '0x03']
+
+    def test_multicall(self):
+        from eth_abi import decode, encode
+
+        web3 = Mock()
+        web3.eth.call.return_value = encode(['(bool,bytes)[]'], [[(True, b'\x01'), (False, b'')]])
+        client = Client(web3=web3, auth=None, storage=None, chain_id=1)
+        target = "0x" + "11" * 20
+
+        assert client.multicall([(target, b'\xaa'), (target, b'\xbb')], allow_failure=True) == [b'\x01', None]
+
+        tx = web3.eth.call.call_args.args[0]
+        assert tx['data'][:4] == bytes.fromhex("82ad56cb")
+        (calls,) = decode(['(address,bool,bytes)[]'], tx['data'][4:])
+        assert [data for _, _, data in calls] == [b'\xaa', b'\xbb']
+        assert client.multicall([]) == []
+
+    def test_nonce_manager(self):
+        web3 = Mock()
+        web3.eth.get_transaction_count.side_effect = [5, 9]
+        nonces = NonceManager(web3, "0xabc")
+
+        assert [nonces.get_nonce() for _ in range(3)] == [5, 6, 7]
+        web3.eth.get_transaction_count.assert_called_once_with("0xabc", 'pending')
+
+        nonces.reset_nonce()
+        assert nonces.get_nonce() == 9
+
     def test_storage_data_structure(self):
         chunk_cid = b"test_chunk_cid"
         block_cid = b"0" * 32  # 32 bytes
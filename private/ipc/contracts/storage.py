@@ -12,6 +12,11 @@ def get_raw_transaction(signed_tx):
     else:
         raise AttributeError("SignedTransaction has neither raw_transaction nor rawTransaction attribute")
 import json
+import weakref
+
+# Contract factories per Web3 instance. Building one walks the whole ABI, so
+# further handles on the same connection only bind a new address.
+_contract_factories: "weakref.WeakKeyDictionary[Web3, type]" = weakref.WeakKeyDictionary()
 
 class StorageContract:
     """Python bindings for the Storage smart contract."""
@@ -2071,7 +2076,11 @@ class StorageContract:
         ]
         
         try:
-            self.contract = web3.eth.contract(address=contract_address, abi=self.abi)
+            factory = _contract_factories.get(web3)
+            if factory is None:
+                factory = web3.eth.contract(abi=self.abi)
+                _contract_factories[web3] = factory
+            self.contract = factory(address=contract_address)
         except Exception as e:
             # Hide the ABI details from error messages
             error_msg = str(e)
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import functools
 import secrets
 from dataclasses import dataclass
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Union
 
+from eth_keys import keys
 from eth_utils import keccak, to_bytes, to_checksum_address
 
 try:
-    from multiformats import CID
+    from multiformats import CID, multibase, multicodec, multihash
     MULTIFORMATS_AVAILABLE = True
 except ImportError:
     MULTIFORMATS_AVAILABLE = False
@@ -21,9 +23,33 @@ except ImportError:
     sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
     from eip712 import Domain as EIP712Domain, TypedData as EIP712TypedData, sign as eip712_sign
 
+try:
+    from ..eip712.eip712 import encode_data as eip712_encode_data, encode_value as eip712_encode_value, SDKError
+except ImportError:
+    from eip712.eip712 import encode_data as eip712_encode_data, encode_value as eip712_encode_value, SDKError
+
+# Multihash header of a sha2-256 digest: code 0x12, length 0x20.
+_SHA256_MULTIHASH_PREFIX = bytes([0x12, 0x20])
+
+if MULTIFORMATS_AVAILABLE and hasattr(CID, '_new_instance'):
+    # The public CID constructor re-validates base, codec and multihash with
+    # runtime type checks (~150us); these are fixed for block CIDs, so they are
+    # resolved once and the instance is built directly (~7us).
+    _BLOCK_CID_PARTS = (multibase.get("base58btc"), 1, multicodec.get("dag-pb"), multihash.get("sha2-256"))
+
+    def _new_block_cid(digest: bytes) -> 'CID':
+        return CID._new_instance(CID, *_BLOCK_CID_PARTS, digest)
+else:
+    def _new_block_cid(digest: bytes) -> 'CID':
+        return CID("base58btc", 1, "dag-pb", digest)
+
 
 @dataclass
 class StorageData:
+    # Explicit __slots__ (dataclass(slots=True) needs Python 3.10+).
+    __slots__ = ('chunk_cid', 'block_cid', 'chunk_index', 'block_index',
+                 'node_id', 'nonce', 'deadline', 'bucket_id')
+
     chunk_cid: bytes
     block_cid: bytes  
     chunk_index: int
@@ -58,19 +84,22 @@ def calculate_file_id(bucket_id: bytes, name: str) -> bytes:
     return keccak(data)
 
 
+def calculate_file_ids(bucket_id: bytes, names: List[str]) -> List[bytes]:
+    """calculate_file_id for many names in one bucket."""
+    if not isinstance(bucket_id, (bytes, bytearray)):
+        raise TypeError("bucket_id must be bytes")
+
+    prefix = bytes(bucket_id)
+    return [keccak(prefix + name.encode('utf-8')) for name in names]
+
+
 def calculate_bucket_id(bucket_name: str, address: str) -> bytes:
-    data = bucket_name.encode('utf-8')
-    
-    addr = address.lower()
-    if addr.startswith("0x"):
-        addr = addr[2:]
+    # fromhex accepts either case, so the address needs no lower().
+    addr = address[2:] if address[:2] in ("0x", "0X") else address
     if len(addr) != 40:
         raise ValueError("address must be a 20-byte hex string")
-    
-    address_bytes = bytes.fromhex(addr)
-    data += address_bytes
-    
-    return keccak(data)
+
+    return keccak(bucket_name.encode('utf-8') + bytes.fromhex(addr))
 
 
 def from_byte_array_cid(data: bytes) -> 'CID':
@@ -80,44 +109,81 @@ def from_byte_array_cid(data: bytes) -> 'CID':
     if len(data) != 32:
         raise ValueError(f"expected 32 bytes, got {len(data)}")
     
-    # CID v1, dag-pb (0x70), sha2-256 (0x12)
-    # Construct CID bytes: version + codec + multihash
-    # multihash format: hash_type (0x12 for sha2-256) + length (0x20 = 32) + hash_data
-    multicodec_dagpb = bytes([0x70])
-    multihash_sha256_header = bytes([0x12, 0x20])
-    cid_bytes = bytes([0x01]) + multicodec_dagpb + multihash_sha256_header + data
-    
-    return CID.decode(cid_bytes)
-
-
-def sign_block(private_key_hex: str, storage_address: str, chain_id: int, data: StorageData) -> bytes:
+    # CID v1, dag-pb, whose multihash is the sha2-256 digest *data*. Built directly
+    # rather than decoded from bytes; base58btc is what CID.decode picks for
+    # binary input, so str() is unchanged.
+    return _new_block_cid(_SHA256_MULTIHASH_PREFIX + bytes(data))
+
+
+_STORAGE_DATA_TYPES: Dict[str, List[EIP712TypedData]] = {
+    "StorageData": [
+        EIP712TypedData("chunkCID", "bytes"),
+        EIP712TypedData("blockCID", "bytes32"),
+        EIP712TypedData("chunkIndex", "uint256"),
+        EIP712TypedData("blockIndex", "uint256"),
+        EIP712TypedData("nodeId", "bytes32"),
+        EIP712TypedData("nonce", "uint256"),
+        EIP712TypedData("deadline", "uint256"),
+        EIP712TypedData("bucketId", "bytes32"),
+    ],
+    "EIP712Domain": [
+        EIP712TypedData("name", "string"),
+        EIP712TypedData("version", "string"),
+        EIP712TypedData("chainId", "uint256"),
+        EIP712TypedData("verifyingContract", "address"),
+    ],
+}
+
+_STORAGE_DATA_TYPE_HASH = keccak(
+    b"StorageData(bytes chunkCID,bytes32 blockCID,uint256 chunkIndex,uint256 blockIndex,"
+    b"bytes32 nodeId,uint256 nonce,uint256 deadline,bytes32 bucketId)"
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _domain_separator(chain_id: int, storage_address: str) -> bytes:
+    return eip712_encode_data("EIP712Domain", {
+        "name": "Storage",
+        "version": "1",
+        "chainId": chain_id,
+        "verifyingContract": to_checksum_address(storage_address),
+    }, _STORAGE_DATA_TYPES)
+
+
+def _private_key(private_key_hex: str) -> keys.PrivateKey:
+    # Not cached: a module-level cache would keep raw keys alive for the
+    # whole process. Bulk signers build the PrivateKey once and pass it in.
     key_hex = private_key_hex.lower()
     if key_hex.startswith("0x"):
         key_hex = key_hex[2:]
-    private_key_bytes = bytes.fromhex(key_hex)
-
-    checksum_addr = to_checksum_address(storage_address)
-
-    domain = EIP712Domain(
-        name="Storage",
-        version="1",
-        chain_id=chain_id,
-        verifying_contract=checksum_addr,
-    )
-
-    storage_data_types: Dict[str, List[EIP712TypedData]] = {
-        "StorageData": [
-            EIP712TypedData("chunkCID", "bytes"),
-            EIP712TypedData("blockCID", "bytes32"),
-            EIP712TypedData("chunkIndex", "uint256"),
-            EIP712TypedData("blockIndex", "uint256"),
-            EIP712TypedData("nodeId", "bytes32"),
-            EIP712TypedData("nonce", "uint256"),
-            EIP712TypedData("deadline", "uint256"),
-            EIP712TypedData("bucketId", "bytes32"),
-        ]
-    }
-
-    message = data.to_message_dict()
-
-    return eip712_sign(private_key_bytes, domain, "StorageData", storage_data_types, message)
\ No newline at end of file
+    return keys.PrivateKey(bytes.fromhex(key_hex))
+
+
+def sign_block(private_key_hex: Union[str, keys.PrivateKey], storage_address: str, chain_id: int,
+               data: StorageData) -> bytes:
+    # Same digest as eip712.sign over the StorageData type, with the domain
+    # separator and type hash computed once instead of per block. Bulk
+    # signers should pass an eth_keys PrivateKey they keep themselves:
+    # building one from hex derives the public key on every call.
+    try:
+        if isinstance(private_key_hex, keys.PrivateKey):
+            private_key = private_key_hex
+        else:
+            private_key = _private_key(private_key_hex)
+        struct_hash = keccak(b"".join((
+            _STORAGE_DATA_TYPE_HASH,
+            eip712_encode_value(data.chunk_cid, "bytes"),
+            eip712_encode_value(data.block_cid, "bytes32"),
+            eip712_encode_value(data.chunk_index, "uint256"),
+            eip712_encode_value(data.block_index, "uint256"),
+            eip712_encode_value(data.node_id, "bytes32"),
+            eip712_encode_value(data.nonce, "uint256"),
+            eip712_encode_value(data.deadline, "uint256"),
+            eip712_encode_value(data.bucket_id, "bytes32"),
+        )))
+        digest = keccak(b"\x19\x01" + _domain_separator(chain_id, storage_address) + struct_hash)
+
+        signature = private_key.sign_msg_hash(digest).to_bytes()
+    except Exception as e:
+        raise SDKError(f"EIP-712 signing failed: {str(e)}")
+    return signature[:64] + bytes([signature[64] + 27])
@@ -2,7 +2,9 @@
 # See LICENSE for copying information.
 
 import pytest
-from .ipc import generate_nonce, calculate_file_id, calculate_bucket_id, from_byte_array_cid
+from .ipc import generate_nonce, calculate_file_id, calculate_file_ids, calculate_bucket_id, from_byte_array_cid
+from .ipc import StorageData, sign_block, _STORAGE_DATA_TYPES
+from ..eip712 import Domain, recover_signer_address, sign as eip712_sign
 
 try:
     from multiformats import CID
@@ -51,6 +53,15 @@ def test_calculate_file_id():
         assert file_id == tc["expected"]
 
 
+def test_calculate_file_ids():
+    bucket_id = bytes(range(32))
+    names = ["a.txt", "", "файл"]
+
+    assert calculate_file_ids(bucket_id, names) == [calculate_file_id(bucket_id, n) for n in names]
+    with pytest.raises(TypeError):
+        calculate_file_ids("not bytes", names)
+
+
 def test_calculate_bucket_id():
     test_cases = [
         {
@@ -90,5 +101,34 @@ def test_from_byte_array_cid():
     assert reconstructed_cid.codec.name == 'dag-pb'
 
 
+
+def test_sign_block_matches_eip712_sign():
+    from eth_account import Account
+    from eth_utils import to_checksum_address
+
+    account = Account.create()
+    storage_address = to_checksum_address("0x" + "ab" * 20)
+    data = StorageData(
+        chunk_cid=b"test_chunk",
+        block_cid=b"0" * 32,
+        chunk_index=3,
+        block_index=7,
+        node_id=b"1" * 32,
+        nonce=generate_nonce(),
+        deadline=1700000000,
+        bucket_id=b"2" * 32,
+    )
+    domain = Domain("Storage", "1", 5, storage_address)
+    types = {"StorageData": _STORAGE_DATA_TYPES["StorageData"]}
+
+    signature = sign_block(account.key.hex(), storage_address.lower(), 5, data)
+
+    assert signature == eip712_sign(account.key, domain, "StorageData", types, data.to_message_dict())
+    assert recover_signer_address(signature, domain, "StorageData", types, data.to_message_dict()) == account.address
+
+    from eth_keys import keys
+    assert sign_block(keys.PrivateKey(account.key), storage_address, 5, data) == signature
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -4,10 +4,10 @@
 import os
 import json
 import pytest
-import requests
 from web3 import Web3
 from eth_account import Account
 
+from .client import _get_shared_session
 from ..ipctest.ipctest import new_funded_account, to_wei, wait_for_tx
 
 
@@ -35,17 +35,12 @@ def fill_blocks(dial_uri: str):
         "id": 1
     }
     
-    response = requests.post(dial_uri, json=payload, headers={"Content-Type": "application/json"})
+    response = _get_shared_session().post(dial_uri, json=payload)
     response.raise_for_status()
 
 
 def pad_left(data: bytes, size: int) -> bytes:
-    if len(data) >= size:
-        return data
-    
-    padded = bytearray(size)
-    padded[size - len(data):] = data
-    return bytes(padded)
+    return data.rjust(size, b"\x00")
 
 
 @pytest.mark.integration
@@ -55,7 +50,7 @@ def test_contract_pdp():
     
     pk = new_funded_account(private_key, dial_uri, to_wei(10))
     
-    web3 = Web3(Web3.HTTPProvider(dial_uri))
+    web3 = Web3(Web3.HTTPProvider(dial_uri, session=_get_shared_session()))
     assert web3.is_connected()
     
     chain_id = web3.eth.chain_id
@@ -77,12 +72,18 @@ def test_contract_pdp():
     
     value_wei = web3.to_wei(1, 'ether')
     
+    # Gas price and nonce are independent reads, so fetch them in one round trip.
+    with web3.batch_requests() as batch:
+        batch.add(web3.eth.gas_price)
+        batch.add(web3.eth.get_transaction_count(pk.address))
+        gas_price, nonce = batch.execute()
+    
     tx = pdp_verifier.functions.createProofSet(sink_address, b'').build_transaction({
         'from': pk.address,
         'value': value_wei,
         'gas': 500000,
-        'gasPrice': web3.eth.gas_price,
-        'nonce': web3.eth.get_transaction_count(pk.address),
+        'gasPrice': gas_price,
+        'nonce': nonce,
     })
     
     signed_tx = pk.sign_transaction(tx)
@@ -95,17 +96,7 @@ def test_contract_pdp():
             set_id = int.from_bytes(log['topics'][1], byteorder='big')
             break
     
-    data = bytes([
-        0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31,
-        1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31,
-        2, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31,
-        3, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31,
-        4, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31,
-        5, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31,
-        6, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31,
-        7, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31,
-        8, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31,
-    ])
+    data = b"".join(bytes([k]) + bytes(range(1, 32)) for k in range(9))
     
     assert len(data) == 288
     
@@ -1,8 +1,15 @@
 # Copyright (C) 2025 Akave
 # See LICENSE for copying information.
 
+import functools
+import threading
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Tuple
+
+from eth_abi import decode as abi_decode
+from eth_utils.abi import collapse_if_tuple, function_abi_to_4byte_selector
+
+from .ipc import from_byte_array_cid
 
 try:
     from multiformats import CID
@@ -11,9 +18,57 @@ except ImportError:
     MULTIFORMATS_AVAILABLE = False
     CID = None
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
 
 CONTRACT_METHOD_SIGNATURE_LEN = 4
 
+# Function name -> ABI entry for recently used contract ABIs, keyed by id().
+_ABI_FUNCTION_INDEX_SIZE = 8
+_abi_function_index: Dict[int, Tuple[list, dict, dict]] = {}
+# Guards eviction and insertion; parsers may run on several threads.
+_abi_function_index_lock = threading.Lock()
+
+
+class CIDHandle:
+    """A dag-pb/sha2-256 block CID kept as its raw 32-byte digest.
+
+    Hashing and comparing handles only touches the digest; the
+    ``multiformats.CID`` is decoded on first use of :attr:`cid`.
+    """
+    __slots__ = ('raw_digest', '_cid')
+    
+    def __init__(self, raw_digest: bytes):
+        self.raw_digest = bytes(raw_digest)
+        self._cid = None
+    
+    @property
+    def cid(self) -> 'CID':
+        if self._cid is None:
+            self._cid = from_byte_array_cid(self.raw_digest)
+        return self._cid
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CIDHandle):
+            return self.raw_digest == other.raw_digest
+        if CID is not None and isinstance(other, CID):
+            return self.cid == other
+        return NotImplemented
+    
+    def __hash__(self) -> int:
+        return hash(self.raw_digest)
+    
+    def __str__(self) -> str:
+        return str(self.cid)
+    
+    def __repr__(self) -> str:
+        return f"CIDHandle({self.raw_digest.hex()})"
+
 
 @dataclass
 class AddChunkTransactionData:
@@ -26,67 +81,122 @@ class AddChunkTransactionData:
     index: int
 
 
-def from_byte_array_cid(data: bytes) -> 'CID':
-    if not MULTIFORMATS_AVAILABLE:
-        raise ImportError("multiformats library is required")
-    
-    if len(data) != 32:
-        raise ValueError(f"expected 32 bytes, got {len(data)}")
+@dataclass
+class AddChunkTransactionDataBatch:
+    """Column-oriented form of the chunks added by one addFileChunks call.
+
+    Blocks of chunk ``i`` are ``block_cids[block_offsets[i]:block_offsets[i + 1]]``
+    and the matching slice of ``block_sizes``. Block CIDs are lazy
+    :class:`CIDHandle` values; :meth:`chunk` materializes them.
+    """
+    bucket_id: bytes
+    file_name: str
+    cids: List['CID']
+    encoded_sizes: 'np.ndarray'
+    indices: 'np.ndarray'
+    block_cids: List[CIDHandle]
+    block_sizes: 'np.ndarray'
+    block_offsets: 'np.ndarray'
     
-    multicodec_dagpb = bytes([0x70])
-    multihash_sha256_header = bytes([0x12, 0x20])
-    cid_bytes = bytes([0x01]) + multicodec_dagpb + multihash_sha256_header + data
+    def __len__(self) -> int:
+        return len(self.cids)
     
+    def chunk(self, i: int) -> AddChunkTransactionData:
+        start, end = int(self.block_offsets[i]), int(self.block_offsets[i + 1])
+        return AddChunkTransactionData(
+            cid=self.cids[i],
+            bucket_id=self.bucket_id,
+            file_name=self.file_name,
+            encoded_size=int(self.encoded_sizes[i]),
+            block_cids=[h.cid for h in self.block_cids[start:end]],
+            block_sizes=self.block_sizes[start:end].tolist(),
+            index=int(self.indices[i]),
+        )
+
+
+@functools.lru_cache(maxsize=4096)
+def _decode_cid(cid_bytes: bytes) -> 'CID':
+    # CIDs are immutable, so chunk CIDs repeated across calls share one instance.
     return CID.decode(cid_bytes)
 
 
-def parse_add_chunk_tx(storage_contract_abi: dict, tx_data: bytes) -> AddChunkTransactionData:
-    if len(tx_data) < CONTRACT_METHOD_SIGNATURE_LEN:
-        raise ValueError("invalid transaction data length")
+def _abi_index(storage_contract_abi: dict) -> Tuple[dict, dict]:
+    """Return the (name -> ABI entry, name -> decoder) maps for an ABI."""
+    key = id(storage_contract_abi)
+    entry = _abi_function_index.get(key)
+    # The cache holds the ABI itself, so its id cannot be reused while cached.
+    if entry is not None and entry[0] is storage_contract_abi:
+        return entry[1], entry[2]
     
-    method_abi = None
+    functions = {}
     for item in storage_contract_abi:
-        if item.get('type') == 'function' and item.get('name') == 'addFileChunk':
-            method_abi = item
-            break
+        if item.get('type') == 'function':
+            functions.setdefault(item.get('name'), item)
     
+    with _abi_function_index_lock:
+        entry = _abi_function_index.get(key)
+        if entry is not None and entry[0] is storage_contract_abi:
+            return entry[1], entry[2]
+        if len(_abi_function_index) >= _ABI_FUNCTION_INDEX_SIZE:
+            _abi_function_index.pop(next(iter(_abi_function_index)))
+        decoders = {}
+        _abi_function_index[key] = (storage_contract_abi, functions, decoders)
+    return functions, decoders
+
+
+def _method_decoder(storage_contract_abi: dict, method_name: str) -> Tuple[bytes, Tuple[str, ...]]:
+    functions, decoders = _abi_index(storage_contract_abi)
+    decoder = decoders.get(method_name)
+    if decoder is not None:
+        return decoder
+    
+    method_abi = functions.get(method_name)
     if not method_abi:
-        raise ValueError("method addFileChunk not found in ABI")
+        raise ValueError(f"method {method_name} not found in ABI")
     
-    from web3 import Web3
-    contract = Web3().eth.contract(abi=[method_abi])
+    decoder = (
+        function_abi_to_4byte_selector(method_abi),
+        tuple(collapse_if_tuple(i) for i in method_abi.get('inputs', [])),
+    )
+    decoders[method_name] = decoder
+    return decoder
+
+
+def _decode_method_input(storage_contract_abi: dict, method_name: str, tx_data: bytes) -> tuple:
+    selector, types = _method_decoder(storage_contract_abi, method_name)
+    tx_data = bytes(tx_data)
+    if tx_data[:CONTRACT_METHOD_SIGNATURE_LEN] != selector:
+        raise ValueError(f"transaction data is not a {method_name} call")
     
-    fn, params = contract.decode_function_input(tx_data)
+    # Arguments are returned positionally, in the order of the ABI inputs.
+    return abi_decode(types, tx_data[CONTRACT_METHOD_SIGNATURE_LEN:])
+
+
+def parse_add_chunk_tx(storage_contract_abi: dict, tx_data: bytes) -> AddChunkTransactionData:
+    if len(tx_data) < CONTRACT_METHOD_SIGNATURE_LEN:
+        raise ValueError("invalid transaction data length")
+    
+    (chunk_cid_bytes, bucket_id, file_name, encoded_size, block_cid_arrays,
+     block_sizes_bigint, chunk_index) = _decode_method_input(storage_contract_abi, 'addFileChunk', tx_data)
     
-    chunk_cid_bytes = params['chunkCID']
     if not MULTIFORMATS_AVAILABLE:
         raise ImportError("multiformats library is required")
-    chunk_cid = CID.decode(chunk_cid_bytes)
-    
-    bucket_id = params['bucketId']
-    file_name = params['fileName']
-    encoded_size = int(params['encodedChunkSize'])
-    block_cid_arrays = params['cids']
-    block_sizes_bigint = params['chunkBlocksSizes']
-    chunk_index = int(params['chunkIndex'])
+    chunk_cid = _decode_cid(bytes(chunk_cid_bytes))
     
-    block_cids = []
-    for b in block_cid_arrays:
-        block_cids.append(from_byte_array_cid(b))
+    if len(block_cid_arrays) != len(block_sizes_bigint):
+        raise ValueError("mismatched block CIDs and sizes lengths")
     
+    block_cids = [from_byte_array_cid(b) for b in block_cid_arrays]
     block_sizes = [int(size) for size in block_sizes_bigint]
     
-    if len(block_cids) != len(block_sizes):
-        raise ValueError("mismatched block CIDs and sizes lengths")
-    
     return AddChunkTransactionData(
         cid=chunk_cid,
         bucket_id=bucket_id,
         file_name=file_name,
-        encoded_size=encoded_size,
+        encoded_size=int(encoded_size),
         block_cids=block_cids,
         block_sizes=block_sizes,
-        index=chunk_index,
+        index=int(chunk_index),
     )
 
 
@@ -94,45 +204,24 @@ def parse_add_chunks_tx(storage_contract_abi: dict, tx_data: bytes) -> List[AddC
     if len(tx_data) < CONTRACT_METHOD_SIGNATURE_LEN:
         raise ValueError("invalid transaction data length")
     
-    method_abi = None
-    for item in storage_contract_abi:
-        if item.get('type') == 'function' and item.get('name') == 'addFileChunks':
-            method_abi = item
-            break
+    (chunk_cids_bytes, bucket_id, file_name, encoded_chunk_sizes, chunk_blocks_cids,
+     chunk_blocks_sizes, starting_chunk_index) = _decode_method_input(storage_contract_abi, 'addFileChunks', tx_data)
+    starting_chunk_index = int(starting_chunk_index)
     
-    if not method_abi:
-        raise ValueError("method addFileChunks not found in ABI")
-    
-    from web3 import Web3
-    contract = Web3().eth.contract(abi=[method_abi])
-    
-    fn, params = contract.decode_function_input(tx_data)
-    
-    chunk_cids_bytes = params['cids']
-    bucket_id = params['bucketId']
-    file_name = params['fileName']
-    encoded_chunk_sizes = params['encodedChunkSizes']
-    chunk_blocks_cids = params['chunkBlocksCIDs']
-    chunk_blocks_sizes = params['chunkBlockSizes']
-    starting_chunk_index = int(params['startingChunkIndex'])
+    if not MULTIFORMATS_AVAILABLE:
+        raise ImportError("multiformats library is required")
     
     num_chunks = len(chunk_cids_bytes)
     chunks = []
     
     for i in range(num_chunks):
-        if not MULTIFORMATS_AVAILABLE:
-            raise ImportError("multiformats library is required")
-        chunk_cid = CID.decode(chunk_cids_bytes[i])
-        
-        block_cids = []
-        for b in chunk_blocks_cids[i]:
-            block_cids.append(from_byte_array_cid(b))
+        if len(chunk_blocks_cids[i]) != len(chunk_blocks_sizes[i]):
+            raise ValueError(f"mismatched block CIDs and sizes for chunk {i}")
         
+        chunk_cid = _decode_cid(bytes(chunk_cids_bytes[i]))
+        block_cids = [from_byte_array_cid(b) for b in chunk_blocks_cids[i]]
         block_sizes = [int(size) for size in chunk_blocks_sizes[i]]
         
-        if len(block_cids) != len(block_sizes):
-            raise ValueError(f"mismatched block CIDs and sizes for chunk {i}")
-        
         chunks.append(AddChunkTransactionData(
             cid=chunk_cid,
             bucket_id=bucket_id,
@@ -144,3 +233,41 @@ def parse_add_chunks_tx(storage_contract_abi: dict, tx_data: bytes) -> List[AddC
         ))
     
     return chunks
+
+
+def parse_add_chunks_tx_batch(storage_contract_abi: dict, tx_data: bytes) -> AddChunkTransactionDataBatch:
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy library is required")
+    if len(tx_data) < CONTRACT_METHOD_SIGNATURE_LEN:
+        raise ValueError("invalid transaction data length")
+    
+    (chunk_cids_bytes, bucket_id, file_name, encoded_chunk_sizes, chunk_blocks_cids,
+     chunk_blocks_sizes, starting_chunk_index) = _decode_method_input(storage_contract_abi, 'addFileChunks', tx_data)
+    
+    if not MULTIFORMATS_AVAILABLE:
+        raise ImportError("multiformats library is required")
+    
+    num_chunks = len(chunk_cids_bytes)
+    counts = np.fromiter((len(b) for b in chunk_blocks_cids), dtype=np.int64, count=num_chunks)
+    size_counts = np.fromiter((len(s) for s in chunk_blocks_sizes), dtype=np.int64, count=len(chunk_blocks_sizes))
+    if not np.array_equal(counts, size_counts):
+        mismatched = np.flatnonzero(counts[:len(size_counts)] != size_counts[:num_chunks])
+        i = int(mismatched[0]) if len(mismatched) else min(num_chunks, len(size_counts))
+        raise ValueError(f"mismatched block CIDs and sizes for chunk {i}")
+    
+    block_offsets = np.zeros(num_chunks + 1, dtype=np.int64)
+    np.cumsum(counts, out=block_offsets[1:])
+    num_blocks = int(block_offsets[-1])
+    
+    return AddChunkTransactionDataBatch(
+        bucket_id=bucket_id,
+        file_name=file_name,
+        cids=[_decode_cid(bytes(c)) for c in chunk_cids_bytes],
+        encoded_sizes=np.fromiter(encoded_chunk_sizes, dtype=np.int64, count=num_chunks),
+        indices=np.arange(int(starting_chunk_index), int(starting_chunk_index) + num_chunks, dtype=np.int64),
+        block_cids=[CIDHandle(b) for blocks in chunk_blocks_cids for b in blocks],
+        block_sizes=np.fromiter(
+            (size for sizes in chunk_blocks_sizes for size in sizes), dtype=np.int64, count=num_blocks
+        ),
+        block_offsets=block_offsets,
+    )
@@ -0,0 +1,80 @@
+# Copyright (C) 2025 Akave
+# See LICENSE for copying information.
+
+import os
+
+import pytest
+from web3 import Web3
+
+from .contracts import StorageContract
+from .transactiondata_parser import parse_add_chunk_tx, parse_add_chunks_tx, parse_add_chunks_tx_batch
+
+pytest.importorskip("multiformats")
+from multiformats import CID, multihash
+
+
+def _storage_abi():
+    return StorageContract(Web3(), "0x" + "0" * 40).abi
+
+
+def test_parse_add_chunk_txs():
+    abi = _storage_abi()
+    contract = Web3().eth.contract(abi=abi)
+    chunk_cid = CID("base32", 1, "dag-pb", multihash.digest(b"chunk", "sha2-256"))
+    block = os.urandom(32)
+    bucket_id = b"\x01" * 32
+
+    tx_data = bytes.fromhex(contract.encode_abi(
+        "addFileChunk", args=[bytes(chunk_cid), bucket_id, "file", 10, [block], [7], 3],
+    )[2:])
+    chunk = parse_add_chunk_tx(abi, tx_data)
+    assert chunk.cid == chunk_cid
+    assert (chunk.bucket_id, chunk.file_name, chunk.encoded_size, chunk.index) == (bucket_id, "file", 10, 3)
+    assert chunk.block_cids[0].raw_digest == block
+    assert chunk.block_sizes == [7]
+
+    tx_data = bytes.fromhex(contract.encode_abi(
+        "addFileChunks",
+        args=[[bytes(chunk_cid)] * 2, bucket_id, "file", [10, 20], [[block, block], [block]], [[1, 2], [3]], 5],
+    )[2:])
+    chunks = parse_add_chunks_tx(abi, tx_data)
+    assert [c.index for c in chunks] == [5, 6]
+    assert [c.encoded_size for c in chunks] == [10, 20]
+    assert [c.block_sizes for c in chunks] == [[1, 2], [3]]
+
+    batch = parse_add_chunks_tx_batch(abi, tx_data)
+    assert len(batch) == 2
+    assert batch.block_offsets.tolist() == [0, 2, 3]
+    assert int(batch.block_sizes.sum()) == 6
+    assert [batch.chunk(i) for i in range(len(batch))] == chunks
+    assert batch.block_cids[0] == batch.block_cids[1] == chunks[0].block_cids[0]
+    assert len(set(batch.block_cids)) == 1
+
+    with pytest.raises(ValueError):
+        parse_add_chunk_tx(abi, tx_data)
+
+    tx_data = bytes.fromhex(contract.encode_abi(
+        "addFileChunks",
+        args=[[bytes(chunk_cid)] * 2, bucket_id, "file", [10, 20], [[block, block], [block]], [[1], [3]], 5],
+    )[2:])
+    for parse in (parse_add_chunks_tx, parse_add_chunks_tx_batch):
+        with pytest.raises(ValueError, match="for chunk 0"):
+            parse(abi, tx_data)
+
+
+def test_parse_add_chunk_tx_concurrent_abis():
+    from concurrent.futures import ThreadPoolExecutor
+
+    abi = _storage_abi()
+    contract = Web3().eth.contract(abi=abi)
+    chunk_cid = CID("base32", 1, "dag-pb", multihash.digest(b"chunk", "sha2-256"))
+    tx_data = bytes.fromhex(contract.encode_abi(
+        "addFileChunk", args=[bytes(chunk_cid), b"\x01" * 32, "file", 10, [os.urandom(32)], [7], 3],
+    )[2:])
+    # More distinct ABI objects than the index holds, so threads evict entries concurrently.
+    abis = [list(abi) for _ in range(32)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        chunks = list(pool.map(lambda a: parse_add_chunk_tx(a, tx_data), abis * 8))
+
+    assert all(chunk.index == 3 for chunk in chunks)
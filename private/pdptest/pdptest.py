@@ -1,7 +1,12 @@
 # Copyright (C) 2025 Akave
 # See LICENSE for copying information.
 
+import base64
+import hashlib
 import os
+import threading
+from collections import OrderedDict
+
 import pytest
 
 CALIBRATION_WARM_STORAGE_CONTRACT = "0x02925630df557F957f70E112bA06e50965417CA0"
@@ -22,68 +27,106 @@ def pick_server_url() -> str:
         pytest.skip("PDP server URL flag missing, example: -pdp-server-url=<pdp server url>")
     return PDP_SERVER_URL
 
-#temporary solution to calculate piece CID
+# Piece CIDs are computed natively (FRC-0069 "PieceCIDv2"): the payload is
+# zero-padded to 127 * 2^k bytes, Fr32-expanded to 128 * 2^k bytes, and
+# reduced by a binary SHA-256 Merkle tree whose nodes have their two top bits
+# cleared (sha2-256-trunc254). hashlib runs on OpenSSL's SHA-NI code path.
+_MIN_PIECE_PAYLOAD = 65
+_RAW_CODEC = 0x55
+_FR32_SHA256_TRUNC254_PADBINTREE = 0x1011
+_FR32_QUAD_MASK = (1 << 254) - 1
+
+# Piece CIDs by blake2b digest of the data, so repeated payloads are not re-hashed.
+_PIECE_CID_CACHE_SIZE = 1024
+_piece_cid_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_piece_cid_cache_lock = threading.Lock()
+
+
+def _uvarint(value: int) -> bytes:
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _fr32_pad(data: bytes) -> bytes:
+    """Expand each 127-byte chunk into four 32-byte words of 254 bits each."""
+    out = bytearray()
+    for start in range(0, len(data), 127):
+        bits = int.from_bytes(data[start:start + 127], "little")
+        for shift in (0, 254, 508, 762):
+            out += ((bits >> shift) & _FR32_QUAD_MASK).to_bytes(32, "little")
+    return bytes(out)
+
+
+def _truncate_node(digest: bytes) -> bytes:
+    return digest[:31] + bytes([digest[31] & 0x3F])
+
+
+# Roots of all-zero subtrees by height; Fr32 maps zero bytes to zero leaves,
+# so the zero padding of a piece never has to be hashed.
+_ZERO_COMMITMENTS = [bytes(32)]
+for _ in range(63):
+    _ZERO_COMMITMENTS.append(_truncate_node(hashlib.sha256(_ZERO_COMMITMENTS[-1] * 2).digest()))
+
+
+def _commp_root(leaves: bytes, height: int) -> bytes:
+    """Reduce Fr32 leaves to the root of a tree of the given height.
+
+    Leaves missing on the right are zero, so an odd node at any level is
+    paired with the zero subtree root of that level.
+    """
+    sha256 = hashlib.sha256
+    layer = leaves
+    for level in range(height):
+        if len(layer) % 64:
+            layer += _ZERO_COMMITMENTS[level]
+        view = memoryview(layer)
+        out = bytearray()
+        for i in range(0, len(layer), 64):
+            out += sha256(view[i:i + 64]).digest()
+            out[-1] &= 0x3F
+        layer = bytes(out)
+    return layer
+
+
+def _piece_cid_v2(data: bytes) -> str:
+    if len(data) < _MIN_PIECE_PAYLOAD:
+        raise ValueError(f"piece payload must be at least {_MIN_PIECE_PAYLOAD} bytes, got {len(data)}")
+
+    unpadded_size = 127
+    while unpadded_size < len(data):
+        unpadded_size *= 2
+    # Only the 127-byte chunks holding data are expanded; the rest of the tree
+    # is zero and comes from _ZERO_COMMITMENTS.
+    leaves = _fr32_pad(data + bytes(-len(data) % 127))
+    height = (unpadded_size // 127 * 4).bit_length() - 1
+
+    digest = _uvarint(unpadded_size - len(data)) + bytes([height]) + _commp_root(leaves, height)
+    cid_bytes = (
+        b"\x01" + _uvarint(_RAW_CODEC) + _uvarint(_FR32_SHA256_TRUNC254_PADBINTREE)
+        + _uvarint(len(digest)) + digest
+    )
+    return "b" + base64.b32encode(cid_bytes).decode().lower().rstrip("=")
+
+
 def calculate_piece_cid(data: bytes) -> str:
+    key = hashlib.blake2b(data).digest()
+    with _piece_cid_cache_lock:
+        cached = _piece_cid_cache.get(key)
+        if cached is not None:
+            _piece_cid_cache.move_to_end(key)
+            return cached
+
     try:
-        import subprocess
-        import tempfile
-        import os
-        
-        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
-            f.write(data)
-            temp_path = f.name
-        
-        try:
-            result = subprocess.run(
-                ['go', 'run', '-', temp_path],
-                input='''
-package main
-import (
-    "fmt"
-    "io/ioutil"
-    "os"
-    commcid "github.com/filecoin-project/go-fil-commcid"
-    commp "github.com/filecoin-project/go-fil-commp-hashhash"
-)
-func main() {
-    data, err := ioutil.ReadFile(os.Args[1])
-    if err != nil {
-        panic(err)
-    }
-    cp := new(commp.Calc)
-    cp.Write(data)
-    rawCommP, _, err := cp.Digest()
-    if err != nil {
-        panic(err)
-    }
-    pieceCid, err := commcid.DataCommitmentToPieceCidv2(rawCommP, uint64(len(data)))
-    if err != nil {
-        panic(err)
-    }
-    fmt.Print(pieceCid.String())
-}
-''',
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            if result.returncode != 0:
-                raise RuntimeError(f"Failed to calculate piece CID: {result.stderr}")
-            
-            return result.stdout.strip()
-        finally:
-            os.unlink(temp_path)
-            
-    except FileNotFoundError:
-        raise RuntimeError(
-            "Go toolchain not found. To calculate piece CIDs, you need:\n"
-            "1. Install Go from https://go.dev/\n"
-            "2. Run: go get github.com/filecoin-project/go-fil-commcid\n"
-            "3. Run: go get github.com/filecoin-project/go-fil-commp-hashhash\n"
-            "Alternative: Use the Go SDK directly for PDP operations."
-        )
-    except subprocess.TimeoutExpired:
-        raise RuntimeError("Piece CID calculation timed out")
+        piece_cid = _piece_cid_v2(bytes(data))
     except Exception as e:
         raise RuntimeError(f"Failed to calculate piece CID: {e}")
+
+    with _piece_cid_cache_lock:
+        _piece_cid_cache[key] = piece_cid
+        if len(_piece_cid_cache) > _PIECE_CID_CACHE_SIZE:
+            _piece_cid_cache.popitem(last=False)
+    return piece_cid
@@ -0,0 +1,44 @@
+# Copyright (C) 2025 Akave
+# See LICENSE for copying information.
+
+import base64
+
+import pytest
+
+from .pdptest import _ZERO_COMMITMENTS, _commp_root, _fr32_pad, calculate_piece_cid
+
+
+def test_commp_zero_pieces():
+    # Well-known commitments of all-zero 64 and 128 byte padded pieces.
+    assert _commp_root(bytes(64), 1).hex() == "f5a5fd42d16a20302798ef6ed309979b43003d2320d9f0e8ea9831a92759fb0b"
+    assert _commp_root(bytes(128), 2).hex() == "3731bb99ac689f66eef5973e4a94da188f4ddcae580724fc6f3fd60dfd488333"
+    assert _ZERO_COMMITMENTS[2].hex() == "3731bb99ac689f66eef5973e4a94da188f4ddcae580724fc6f3fd60dfd488333"
+
+
+def test_commp_root_skips_zero_padding():
+    leaves = _fr32_pad(bytes(range(127)))
+    assert _commp_root(leaves, 5) == _commp_root(leaves + bytes(1024 - len(leaves)), 5)
+
+
+def test_fr32_pad_clears_top_bits():
+    padded = _fr32_pad(b"\xff" * 127)
+    assert len(padded) == 128
+    assert all(padded[i] == 0x3F for i in range(31, 128, 32))
+
+
+def test_calculate_piece_cid():
+    piece_cid = calculate_piece_cid(bytes(127))
+    raw = base64.b32decode(piece_cid[1:].upper() + "=" * (-len(piece_cid[1:]) % 8))
+
+    # CIDv1, raw, fr32-sha256-trunc254-padbintree; digest = padding, height, root.
+    assert piece_cid.startswith("b")
+    assert raw[:4] == bytes([0x01, 0x55, 0x91, 0x20])
+    assert raw[4:7] == bytes([34, 0, 2])
+    assert raw[7:].hex() == "3731bb99ac689f66eef5973e4a94da188f4ddcae580724fc6f3fd60dfd488333"
+    assert calculate_piece_cid(bytes(127)) == piece_cid
+
+    # Pinned from the full-tree implementation that hashed the zero padding.
+    assert calculate_piece_cid(bytes(range(200))) == "bafkzcibcgybvpcaunemac4urulapnfygjzts7iick7pb6iiwpb4w2e2sw4lvima"
+
+    with pytest.raises(RuntimeError):
+        calculate_piece_cid(b"too short")
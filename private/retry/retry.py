@@ -2,15 +2,86 @@
 # See LICENSE for copying information.
 
 import asyncio
+import datetime
+import email.utils
 import random
+import threading
 import time
-from typing import Callable, Tuple
+from typing import Callable, Optional, Tuple
+
+
+# Upper bound on a server-requested Retry-After delay when max_delay is unset.
+MAX_RETRY_AFTER = 60.0
+
+
+def retry_after(err: Exception) -> Optional[float]:
+    """Returns the server-requested delay carried by *err*, if any.
+
+    Honors an explicit ``retry_after`` attribute, then a ``Retry-After``
+    header (seconds or HTTP-date) on the 429/503 response of an HTTP error.
+    """
+    value = getattr(err, 'retry_after', None)
+    if value is None:
+        response = getattr(err, 'response', None)
+        if getattr(response, 'status_code', None) not in (429, 503):
+            return None
+        value = getattr(response, 'headers', {}).get('Retry-After')
+        if value is None:
+            return None
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=datetime.timezone.utc)
+    return max(when.timestamp() - time.time(), 0.0)
 
 
 class WithRetry:
-    def __init__(self, max_attempts: int, base_delay: float):
+    def __init__(self, max_attempts: int, base_delay: float, cancel_event: Optional[threading.Event] = None,
+                 max_delay: Optional[float] = None, full_jitter: bool = False):
         self.max_attempts = max_attempts
         self.base_delay = base_delay
+        # Caps the exponential backoff before jitter is applied.
+        self.max_delay = max_delay
+        # Sleep a uniform random time in [0, backoff) instead of backoff plus up
+        # to one base_delay, so callers failing together spread their retries.
+        self.full_jitter = full_jitter
+        # Setting the event interrupts a backoff sleep in do().
+        self.cancel_event = cancel_event
+        self._backoffs = []
+        self._backoffs_key = None
+    
+    def _backoff(self, attempt: int) -> float:
+        # Exponential delays are tabulated once; callers may still reassign
+        # max_attempts or base_delay, which rebuilds the table.
+        key = (self.max_attempts, self.base_delay)
+        if key != self._backoffs_key:
+            self._backoffs = [self.base_delay * (1 << i) for i in range(max(self.max_attempts, 0) + 1)]
+            self._backoffs_key = key
+        return self._backoffs[attempt]
+    
+    def _delay(self, attempt: int) -> float:
+        # Jitter only needs to decorrelate callers, so the shared module PRNG
+        # is fine; nonces and keys use secrets instead.
+        backoff = self._backoff(attempt)
+        if self.max_delay is not None:
+            backoff = min(backoff, self.max_delay)
+        if self.full_jitter:
+            return random.random() * backoff
+        return backoff + random.random() * self.base_delay
+    
+    def _with_retry_after(self, delay: float, err: Exception) -> float:
+        server_delay = retry_after(err)
+        if server_delay is None:
+            return delay
+        # Never let a server hint block the caller beyond the configured cap.
+        cap = self.max_delay if self.max_delay is not None else MAX_RETRY_AFTER
+        return max(delay, min(server_delay, cap))
     
     def do(self, f: Callable[[], Tuple[bool, Exception]]) -> Exception:
         for attempt in range(self.max_attempts + 1):
@@ -21,11 +92,12 @@ class WithRetry:
             if not needs_retry or attempt >= self.max_attempts:
                 return err
             
-            backoff = self.base_delay * (2 ** attempt)
-            jitter = random.uniform(0, self.base_delay)
-            delay = backoff + jitter
+            delay = self._with_retry_after(self._delay(attempt), err)
             
-            time.sleep(delay)
+            if self.cancel_event is None:
+                time.sleep(delay)
+            elif self.cancel_event.wait(delay):
+                return Exception(f"retry aborted: {err}")
         
         return err
     
@@ -41,12 +113,10 @@ class WithRetry:
             if not needs_retry or attempt >= self.max_attempts:
                 return err
             
-            backoff = self.base_delay * (2 ** attempt)
-            jitter = random.uniform(0, self.base_delay)
-            delay = backoff + jitter
+            delay = self._with_retry_after(self._delay(attempt), err)
             
             try:
-                await asyncio.wait_for(asyncio.sleep(delay), timeout=delay + 1)
+                await asyncio.sleep(delay)
             except asyncio.CancelledError:
                 return Exception(f"retry aborted: {err}")
         
@@ -2,8 +2,11 @@
 # See LICENSE for copying information.
 
 import pytest
+import threading
 import time
-from .retry import WithRetry
+from unittest.mock import Mock
+
+from .retry import MAX_RETRY_AFTER, WithRetry, retry_after
 
 
 def test_success_on_first_attempt():
@@ -85,5 +88,71 @@ def test_max_attempts_zero():
     assert call_count == 1
 
 
+def test_backoff_follows_updated_settings():
+    retry = WithRetry(max_attempts=2, base_delay=0.5)
+    assert [retry._backoff(i) for i in range(3)] == [0.5, 1.0, 2.0]
+
+    retry.max_attempts = 3
+    retry.base_delay = 0.1
+    assert retry._backoff(3) == pytest.approx(0.8)
+
+
+def test_delay_jitter_and_cap(monkeypatch):
+    monkeypatch.setattr("random.random", lambda: 0.5)
+
+    retry = WithRetry(max_attempts=4, base_delay=1.0)
+    assert [retry._delay(i) for i in range(4)] == [1.5, 2.5, 4.5, 8.5]
+
+    retry = WithRetry(max_attempts=4, base_delay=1.0, max_delay=3.0, full_jitter=True)
+    assert [retry._delay(i) for i in range(4)] == [0.5, 1.0, 1.5, 1.5]
+
+
+
+def test_retry_after_header(monkeypatch):
+    err = Exception("rate limited")
+    err.response = Mock(status_code=429, headers={'Retry-After': '2'})
+    assert retry_after(err) == 2.0
+
+    err.response = Mock(status_code=503, headers={'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+    assert retry_after(err) == 0.0
+    err.response = Mock(status_code=500, headers={'Retry-After': '2'})
+    assert retry_after(err) is None
+    assert retry_after(Exception()) is None
+
+    sleeps = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    err.response = Mock(status_code=429, headers={'Retry-After': '2'})
+    retry = WithRetry(max_attempts=1, base_delay=0.01)
+    assert retry.do(lambda: (True, err)) is err
+    assert sleeps and sleeps[0] >= 2
+
+    sleeps.clear()
+    err.response = Mock(status_code=429, headers={'Retry-After': '86400'})
+    assert retry.do(lambda: (True, err)) is err
+    assert sleeps == [pytest.approx(MAX_RETRY_AFTER)]
+
+    sleeps.clear()
+    retry = WithRetry(max_attempts=1, base_delay=0.01, max_delay=5.0)
+    assert retry.do(lambda: (True, err)) is err
+    assert sleeps == [pytest.approx(5.0)]
+
+
+def test_cancel_event_interrupts_backoff():
+    cancel = threading.Event()
+    retry = WithRetry(max_attempts=3, base_delay=10, cancel_event=cancel)
+    call_count = 0
+    
+    def f():
+        nonlocal call_count
+        call_count += 1
+        cancel.set()
+        return True, Exception("test error")
+    
+    start = time.monotonic()
+    err = retry.do(f)
+    assert time.monotonic() - start < 1
+    assert str(err) == "retry aborted: test error"
+    assert call_count == 1
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
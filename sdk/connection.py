@@ -1,17 +1,39 @@
+import functools
 import grpc
 import time
 import threading
 import logging
-from typing import Dict, Optional, Tuple, Callable
+from typing import Dict, List, Optional, Tuple, Callable
 from private.pb import ipcnodeapi_pb2_grpc
 from .config import SDKError
 
+# Channel arguments shared by pooled and dedicated node connections.
+CHANNEL_OPTIONS = [
+    ('grpc.max_receive_message_length', 100 * 1024 * 1024),
+    ('grpc.max_send_message_length', 100 * 1024 * 1024),
+    ('grpc.keepalive_time_ms', 30000),
+    ('grpc.keepalive_timeout_ms', 10000),
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.http2.min_time_between_pings_ms', 10000),
+    # Lets the transport coalesce back-to-back small messages (e.g. block
+    # metadata on a stream) into fewer writes instead of flushing each one.
+    ('grpc.http2.write_buffer_size', 1024 * 1024),
+]
+
+# Without a local subchannel pool, channels to the same target with equal
+# arguments share one underlying connection.
+_POOLED_CHANNEL_OPTIONS = CHANNEL_OPTIONS + [('grpc.use_local_subchannel_pool', 1)]
+
 
 class ConnectionPool:
     
-    def __init__(self):
+    def __init__(self, channels_per_addr: int = 4):
         self._lock = threading.RLock()
-        self._connections: Dict[str, grpc.Channel] = {}
+        self._channels_per_addr = max(1, channels_per_addr)
+        self._connections: Dict[str, List[grpc.Channel]] = {}
+        # Clients handed out per pooled channel and not yet released.
+        self._in_use: Dict[grpc.Channel, int] = {}
 
     def create_ipc_client(self, addr: str, pooled: bool) -> Tuple[ipcnodeapi_pb2_grpc.IPCNodeAPIStub, Optional[Callable[[], None]], Optional[Exception]]:
         try:
@@ -19,18 +41,9 @@ class ConnectionPool:
                 conn, err = self._get(addr)
                 if err:
                     return None, None, err
-                return ipcnodeapi_pb2_grpc.IPCNodeAPIStub(conn), None, None
-
-            options = [
-                ('grpc.max_receive_message_length', 100 * 1024 * 1024),  
-                ('grpc.max_send_message_length', 100 * 1024 * 1024),
-                ('grpc.keepalive_time_ms', 30000),  
-                ('grpc.keepalive_timeout_ms', 10000),  
-                ('grpc.keepalive_permit_without_calls', 1), 
-                ('grpc.http2.max_pings_without_data', 0),  
-                ('grpc.http2.min_time_between_pings_ms', 10000), 
-            ]
-            conn = grpc.insecure_channel(addr, options=options)
+                return ipcnodeapi_pb2_grpc.IPCNodeAPIStub(conn), functools.partial(self._release, conn), None
+
+            conn = grpc.insecure_channel(addr, options=CHANNEL_OPTIONS)
             return ipcnodeapi_pb2_grpc.IPCNodeAPIStub(conn), conn.close, None
             
         except Exception as e:
@@ -42,66 +55,81 @@ class ConnectionPool:
                 conn, err = self._get(addr)
                 if err:
                     return None, None, err
-                return ipcnodeapi_pb2_grpc.IPCArchivalAPIStub(conn), None, None
-
-            options = [
-                ('grpc.max_receive_message_length', 100 * 1024 * 1024), 
-                ('grpc.max_send_message_length', 100 * 1024 * 1024),
-                ('grpc.keepalive_time_ms', 30000), 
-                ('grpc.keepalive_timeout_ms', 10000), 
-                ('grpc.keepalive_permit_without_calls', 1),  
-                ('grpc.http2.max_pings_without_data', 0), 
-                ('grpc.http2.min_time_between_pings_ms', 10000),  
-            ]
-            conn = grpc.insecure_channel(addr, options=options)
+                return ipcnodeapi_pb2_grpc.IPCArchivalAPIStub(conn), functools.partial(self._release, conn), None
+
+            conn = grpc.insecure_channel(addr, options=CHANNEL_OPTIONS)
             return ipcnodeapi_pb2_grpc.IPCArchivalAPIStub(conn), conn.close, None
             
         except Exception as e:
             return None, None, SDKError(f"Failed to create archival client: {str(e)}")
 
     def _get(self, addr: str) -> Tuple[Optional[grpc.Channel], Optional[Exception]]:
+        # A single HTTP/2 connection caps concurrent streams (~100 by default),
+        # so while every channel to an address is in use another one is opened,
+        # up to channels_per_addr, each with its own subchannel pool (and thus
+        # TCP connection). Otherwise the least used channel is handed out.
         with self._lock:
-            if addr in self._connections:
-                return self._connections[addr], None
+            conn = self._acquire_existing(addr, grow=True)
+            if conn is not None:
+                return conn, None
+            first = addr not in self._connections
 
-        with self._lock:
-            if addr in self._connections:
-                return self._connections[addr], None
-
-            try:
-                options = [
-                    ('grpc.max_receive_message_length', 100 * 1024 * 1024),  
-                    ('grpc.max_send_message_length', 100 * 1024 * 1024),
-                    ('grpc.keepalive_time_ms', 30000),  
-                    ('grpc.keepalive_timeout_ms', 10000),  
-                    ('grpc.keepalive_permit_without_calls', 1),  
-                    ('grpc.http2.max_pings_without_data', 0), 
-                    ('grpc.http2.min_time_between_pings_ms', 10000),  
-                ]
-                conn = grpc.insecure_channel(addr, options=options)
-                
+        # Connecting happens outside the lock so a slow node does not stall
+        # callers of other addresses.
+        try:
+            conn = grpc.insecure_channel(addr, options=_POOLED_CHANNEL_OPTIONS)
+            if first:
                 try:
                     grpc.channel_ready_future(conn).result(timeout=5)
                 except grpc.FutureTimeoutError:
                     logging.warning(f"Connection to {addr} not ready within timeout, proceeding anyway")
-                
-                self._connections[addr] = conn
-                return conn, None
-                
-            except Exception as e:
-                return None, SDKError(f"Failed to connect to {addr}: {str(e)}")
+        except Exception as e:
+            with self._lock:
+                existing = self._acquire_existing(addr, grow=False)
+            if existing is not None:
+                return existing, None
+            return None, SDKError(f"Failed to connect to {addr}: {str(e)}")
+
+        with self._lock:
+            conns = self._connections.setdefault(addr, [])
+            if len(conns) >= self._channels_per_addr:
+                # Another caller filled the pool meanwhile.
+                conn.close()
+                return self._acquire_existing(addr, grow=False), None
+            conns.append(conn)
+            self._in_use[conn] = 1
+            return conn, None
+
+    def _acquire_existing(self, addr: str, grow: bool) -> Optional[grpc.Channel]:
+        # Must be called with the lock held. With grow, returns None when a new
+        # channel should be opened instead.
+        conns = self._connections.get(addr)
+        if not conns:
+            return None
+        conn = min(conns, key=self._in_use.__getitem__)
+        if grow and self._in_use[conn] and len(conns) < self._channels_per_addr:
+            return None
+        self._in_use[conn] += 1
+        return conn
+
+    def _release(self, conn: grpc.Channel) -> None:
+        with self._lock:
+            if self._in_use.get(conn):
+                self._in_use[conn] -= 1
 
     def close(self) -> Optional[Exception]:
         with self._lock:
             errors = []
             
-            for addr, conn in self._connections.items():
-                try:
-                    conn.close()
-                except Exception as e:
-                    errors.append(f"failed to close connection to {addr}: {str(e)}")
+            for addr, conns in self._connections.items():
+                for conn in conns:
+                    try:
+                        conn.close()
+                    except Exception as e:
+                        errors.append(f"failed to close connection to {addr}: {str(e)}")
             
             self._connections.clear()
+            self._in_use.clear()
             
             if errors:
                 return SDKError(f"encountered errors while closing connections: {errors}")
@@ -109,5 +137,5 @@ class ConnectionPool:
             return None
 
 
-def new_connection_pool() -> ConnectionPool:
-    return ConnectionPool()
\ No newline at end of file
+def new_connection_pool(channels_per_addr: int = 4) -> ConnectionPool:
+    return ConnectionPool(channels_per_addr)
\ No newline at end of file
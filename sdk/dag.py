@@ -1,10 +1,14 @@
+import base64
+import functools
 import io
 import hashlib
-from typing import List, Optional, Any, BinaryIO, Tuple
+import itertools
+from typing import Dict, List, Optional, Any, BinaryIO, Tuple, Union
 from dataclasses import dataclass
 
 try:
-    from multiformats import CID, multihash
+    from multiformats import CID, multibase, multihash
+    from multiformats import multicodec as _multicodec
     from multiformats.multicodec import multicodec
     from ipld_dag_pb import PBNode, PBLink, encode, decode, prepare, code as dag_pb_code
     IPLD_AVAILABLE = True
@@ -44,6 +48,43 @@ from .config import DAG_PB_CODEC, RAW_CODEC, DEFAULT_CID_VERSION
 
 CID_VERSION = 1
 
+# CID instances are immutable, so parsed CID strings can be shared; the same
+# block and chunk CIDs are decoded again when links and downloads are built.
+_decode_cid = functools.lru_cache(maxsize=8192)(CID.decode)
+
+# Multihash header of a sha2-256 digest: code 0x12, length 0x20.
+_SHA256_MULTIHASH_PREFIX = b"\x12\x20"
+
+# Protobuf field keys used when serializing UnixFS data and dag-pb nodes.
+_UNIXFS_TYPE_FILE = b"\x08\x02"   # UnixFS Type = File
+_UNIXFS_DATA = b"\x22"             # UnixFS Data
+_UNIXFS_FILESIZE = b"\x18"         # UnixFS filesize
+_PB_DATA = b"\x0a"                 # PBNode Data
+
+if IPLD_AVAILABLE:
+    # Every CID built here is a base32 dag-pb CIDv1 over a sha2-256 digest.
+    # The public constructor re-validates all of that with runtime type checks
+    # (~150us), so the parts are resolved once and the instance built directly.
+    _DAG_PB_CID_PARTS = (
+        multibase.get("base32"), CID_VERSION, _multicodec.get("dag-pb"), multihash.get("sha2-256"),
+    )
+
+    def _cid_from_digest(digest: bytes) -> CID:
+        return CID._new_instance(CID, *_DAG_PB_CID_PARTS, _SHA256_MULTIHASH_PREFIX + digest)
+
+    # str(CID) goes through the generic multibase encoder (~200us); for the
+    # CIDs built above the string is always "b" + base32(0x01 0x70 multihash).
+    _DAG_PB_CID_PREFIX = b"\x01\x70"
+
+    def _cid_str(cid: Union[CID, str]) -> str:
+        if isinstance(cid, CID) and cid.base is _DAG_PB_CID_PARTS[0] and cid.codec is _DAG_PB_CID_PARTS[2] \
+                and cid.version == CID_VERSION:
+            return "b" + base64.b32encode(_DAG_PB_CID_PREFIX + cid.digest).decode("ascii").lower().rstrip("=")
+        return str(cid)
+else:
+    def _cid_str(cid: Any) -> str:
+        return str(cid)
+
 class DAGError(Exception):
     pass
 
@@ -51,53 +92,62 @@ class DAGRoot:
     def __init__(self):
         self.node = None  # Will store PBNode
         self.fs_node_data = b""  # UnixFS data
-        self.links = []  # Store links for the node
+        # Links are kept as parallel lists (CID, CID string, encoded size)
+        # rather than a dict per link; every link in a file root is unnamed.
+        self.link_cids = []
+        self.link_cid_strs = []
+        self.link_sizes = []
         self.total_file_size = 0  # Track total file size for UnixFS
         
     @classmethod 
     def new(cls):
         return cls()
     
+    @property
+    def links(self) -> List[Dict[str, Any]]:
+        return [
+            {"cid": cid, "cid_str": cid_str, "name": "", "size": size}
+            for cid, cid_str, size in zip(self.link_cids, self.link_cid_strs, self.link_sizes)
+        ]
+    
     def add_link(self, chunk_cid, raw_data_size: int, proto_node_size: int) -> None:
         if hasattr(chunk_cid, 'string'):
             cid_str = chunk_cid.string()
         elif hasattr(chunk_cid, '__str__'):
-            cid_str = str(chunk_cid)
+            cid_str = _cid_str(chunk_cid)
         else:
             cid_str = chunk_cid
             
         if IPLD_AVAILABLE:
-            try:
-                cid_obj = CID.decode(cid_str) if isinstance(cid_str, str) else chunk_cid
-            except:
-                cid_obj = cid_str
+            if isinstance(chunk_cid, CID):
+                cid_obj = chunk_cid
+            else:
+                try:
+                    cid_obj = _decode_cid(cid_str) if isinstance(cid_str, str) else chunk_cid
+                except:
+                    cid_obj = cid_str
         else:
             cid_obj = cid_str
             
         self.total_file_size += raw_data_size
         
-        self.links.append({
-            "cid": cid_obj,
-            "cid_str": cid_str,  
-            "name": "",  
-            "size": proto_node_size
-        })
+        self.link_cids.append(cid_obj)
+        self.link_cid_strs.append(cid_str)
+        self.link_sizes.append(proto_node_size)
     
     def build(self):
-        if len(self.links) == 0:
+        if len(self.link_cids) == 0:
             raise DAGError("no chunks added")
         
-        if len(self.links) == 1:
-            link_cid = self.links[0]["cid"]
+        if len(self.link_cids) == 1:
+            link_cid = self.link_cids[0]
             if hasattr(link_cid, 'string'):
                 return link_cid.string()
-            elif "cid_str" in self.links[0]:
-                return self.links[0]["cid_str"]
-            return str(link_cid)
+            return self.link_cid_strs[0]
         
         if not IPLD_AVAILABLE:
             import base64
-            combined_data = "".join([link["cid_str"] for link in self.links]).encode()
+            combined_data = "".join(self.link_cid_strs).encode()
             hash_digest = hashlib.sha256(combined_data).digest()
             b32_hash = base64.b32encode(hash_digest).decode().lower().rstrip('=')
             char_map = str.maketrans('01', 'ab')
@@ -106,29 +156,21 @@ class DAGRoot:
         
         try:
             pb_links = []
-            for link in self.links:
-                link_cid = link["cid"]
+            for link_cid, size in zip(self.link_cids, self.link_sizes):
                 if isinstance(link_cid, str):
                     try:
-                        link_cid = CID.decode(link_cid)
+                        link_cid = _decode_cid(link_cid)
                     except Exception:
                         continue
                 
-                pb_link = PBLink(
-                    hash=link_cid,
-                    name=link["name"], 
-                    size=link["size"]
-                )
-                pb_links.append(pb_link)
+                pb_links.append(PBLink(hash=link_cid, name="", size=size))
             
             if not pb_links:
                 raise DAGError("no valid CIDs found for DAG links")
             
             unixfs_data = self._create_unixfs_file_data()
-            pb_node = PBNode(data=unixfs_data, links=pb_links)
-            encoded_bytes = encode(pb_node)
-            digest = multihash.digest(encoded_bytes, "sha2-256")
-            root_cid = CID("base32", CID_VERSION, dag_pb_code, digest)
+            encoded_bytes = _encode_pb_node(pb_links, unixfs_data)
+            root_cid = _cid_from_digest(hashlib.sha256(encoded_bytes).digest())
             
             return root_cid
             
@@ -136,20 +178,15 @@ class DAGRoot:
             raise DAGError(f"failed to build DAG root: {str(e)}")
     
     def _create_unixfs_file_data(self) -> bytes:
-        unixfs_data = bytes([0x08, 0x02])  # Type = File
+        unixfs_data = _UNIXFS_TYPE_FILE
         
         if self.total_file_size > 0:
-            unixfs_data += bytes([0x18]) + self._encode_varint(self.total_file_size)
+            unixfs_data += _UNIXFS_FILESIZE + self._encode_varint(self.total_file_size)
         
         return unixfs_data
     
     def _encode_varint(self, value: int) -> bytes:
-        result = b''
-        while value > 127:
-            result += bytes([(value & 127) | 128])
-            value >>= 7
-        result += bytes([value & 127])
-        return result
+        return _encode_varint(value)
 
 @dataclass 
 class ChunkDAG:
@@ -160,43 +197,46 @@ class ChunkDAG:
 
 def build_dag(ctx: Any, reader: BinaryIO, block_size: int) -> ChunkDAG:
     try:
-        data = reader.read()
-        if not data:
+        # Blocks are read one at a time into a reused buffer rather than
+        # materializing the whole chunk; the first is copied out so the
+        # single-block case can be detected by peeking at the second.
+        block_reader = _read_blocks(reader, block_size)
+        first_block = next(block_reader, None)
+        if first_block is None:
             raise DAGError("empty data")
-        
-        raw_data_size = len(data)
+        first_block = bytes(first_block)
+        next_block = next(block_reader, None)
         
         blocks = []
         
-        if len(data) <= block_size:
-            chunk_cid, encoded_data = _create_unixfs_file_node(data)
+        if next_block is None:
+            chunk_cid, encoded_data = _create_unixfs_file_node(first_block)
             proto_node_size = len(encoded_data)
             
             blocks = [FileBlockUpload(
-                cid=str(chunk_cid) if hasattr(chunk_cid, '__str__') else chunk_cid,
+                cid=_cid_str(chunk_cid),
                 data=encoded_data
             )]
             raw_size, encoded_size = node_sizes(encoded_data)
             
         else:
-            offset = 0
+            raw_data_size = 0
             pb_links = []
             
-            while offset < len(data):
-                end_offset = min(offset + block_size, len(data))
-                block_data = data[offset:end_offset]
-                
+            for block_data in itertools.chain((first_block, next_block), block_reader):
+                raw_data_size += len(block_data)
                 block_cid, block_encoded_data = _create_unixfs_file_node(block_data)
                 
                 block = FileBlockUpload(
-                    cid=str(block_cid) if hasattr(block_cid, '__str__') else block_cid,
+                    cid=_cid_str(block_cid),
                     data=block_encoded_data
                 )
                 blocks.append(block)
                 
                 if IPLD_AVAILABLE:
                     try:
-                        cid_obj = CID.decode(block.cid) if isinstance(block.cid, str) else block_cid
+                        # The CID object is at hand unless the fallback produced a string.
+                        cid_obj = _decode_cid(block_cid) if isinstance(block_cid, str) else block_cid
                         pb_links.append(PBLink(
                             hash=cid_obj,
                             name="",
@@ -204,8 +244,6 @@ def build_dag(ctx: Any, reader: BinaryIO, block_size: int) -> ChunkDAG:
                         ))
                     except:
                         pass
-                
-                offset = end_offset
             
             chunk_cid, encoded_size = _create_chunk_dag_root_node(blocks, pb_links)
             raw_size = raw_data_size
@@ -222,6 +260,33 @@ def build_dag(ctx: Any, reader: BinaryIO, block_size: int) -> ChunkDAG:
     except Exception as e:
         raise DAGError(f"failed to build chunk DAG: {str(e)}")
 
+def _read_blocks(reader: BinaryIO, block_size: int):
+    """Yield consecutive *block_size* views of *reader*; only the last may be shorter.
+
+    The views share one buffer, so each is valid until the next is yielded.
+    """
+    buf = bytearray(block_size)
+    view = memoryview(buf)
+    readinto = getattr(reader, 'readinto', None)
+    while True:
+        filled = 0
+        while filled < block_size:
+            if readinto is not None:
+                n = readinto(view[filled:]) or 0
+            else:
+                part = reader.read(block_size - filled)
+                n = len(part) if part else 0
+                if n:
+                    view[filled:filled + n] = part
+            if n == 0:
+                break
+            filled += n
+        if filled == 0:
+            return
+        yield view[:filled]
+        if filled < block_size:
+            return
+
 def _create_unixfs_file_node(data: bytes):
     if not IPLD_AVAILABLE:
         hash_digest = hashlib.sha256(data).digest()
@@ -229,19 +294,21 @@ def _create_unixfs_file_node(data: bytes):
         b32_hash = base64.b32encode(hash_digest).decode().lower().rstrip('=')
         char_map = str.maketrans('01', 'ab')
         b32_hash = b32_hash.translate(char_map)
-        return f"bafybeig{b32_hash[:50]}", data
+        return f"bafybeig{b32_hash[:50]}", bytes(data)
     
     try:
-        unixfs_data = bytes([0x08, 0x02])  
+        unixfs_header = _UNIXFS_TYPE_FILE
         
         if len(data) > 0:
-            unixfs_data += bytes([0x22]) + _encode_varint(len(data)) + data
+            unixfs_header += _UNIXFS_DATA + _encode_varint(len(data))
         
-        pb_node = PBNode(data=unixfs_data, links=[])
-        encoded_bytes = encode(pb_node)
+        # A leaf PBNode has only its Data field (tag 0x0a), so it is serialized
+        # here in one join; ipld_dag_pb's encoder copies data byte by byte.
+        encoded_bytes = b"".join((
+            _PB_DATA, _encode_varint(len(unixfs_header) + len(data)), unixfs_header, data,
+        ))
         
-        digest = multihash.digest(encoded_bytes, "sha2-256")
-        cid = CID("base32", CID_VERSION, dag_pb_code, digest)
+        cid = _cid_from_digest(hashlib.sha256(encoded_bytes).digest())
         
         return cid, encoded_bytes
         
@@ -251,7 +318,7 @@ def _create_unixfs_file_node(data: bytes):
         b32_hash = base64.b32encode(hash_digest).decode().lower().rstrip('=')
         char_map = str.maketrans('01', 'ab')
         b32_hash = b32_hash.translate(char_map)
-        return f"bafybeig{b32_hash[:50]}", data
+        return f"bafybeig{b32_hash[:50]}", bytes(data)
 
 def _create_chunk_dag_root_node(blocks: List[FileBlockUpload], pb_links: List = None):
     if not IPLD_AVAILABLE:
@@ -268,7 +335,7 @@ def _create_chunk_dag_root_node(blocks: List[FileBlockUpload], pb_links: List =
             pb_links = []
             for block in blocks:
                 try:
-                    block_cid = CID.decode(block.cid) if isinstance(block.cid, str) else block.cid
+                    block_cid = _decode_cid(block.cid) if isinstance(block.cid, str) else block.cid
                     pb_link = PBLink(
                         hash=block_cid,
                         name="",
@@ -278,13 +345,11 @@ def _create_chunk_dag_root_node(blocks: List[FileBlockUpload], pb_links: List =
                 except:
                     continue
         
-        unixfs_data = bytes([0x08, 0x02]) 
+        unixfs_data = _UNIXFS_TYPE_FILE
         
-        pb_node = PBNode(data=unixfs_data, links=pb_links)
-        encoded_bytes = encode(pb_node)
+        encoded_bytes = _encode_pb_node(pb_links, unixfs_data)
         
-        digest = multihash.digest(encoded_bytes, "sha2-256")
-        cid = CID("base32", CID_VERSION, dag_pb_code, digest)
+        cid = _cid_from_digest(hashlib.sha256(encoded_bytes).digest())
         
         total_size = sum(len(block.data) for block in blocks)
         return cid, total_size
@@ -340,16 +405,16 @@ def _extract_unixfs_data_size(unixfs_bytes: bytes) -> int:
             wire_type = field_tag & 0x07
             
             if field_number == 3 and wire_type == 0:  
-                file_size, bytes_read = _decode_varint(unixfs_bytes[offset:])
+                file_size, bytes_read = _decode_varint(unixfs_bytes, offset)
                 return file_size
             elif field_number == 4 and wire_type == 2:  
-                length, bytes_read = _decode_varint(unixfs_bytes[offset:])
+                length, bytes_read = _decode_varint(unixfs_bytes, offset)
                 return length  
             elif wire_type == 2:  
-                length, bytes_read = _decode_varint(unixfs_bytes[offset:])
+                length, bytes_read = _decode_varint(unixfs_bytes, offset)
                 offset += bytes_read + length
             elif wire_type == 0:  
-                value, bytes_read = _decode_varint(unixfs_bytes[offset:])
+                value, bytes_read = _decode_varint(unixfs_bytes, offset)
                 offset += bytes_read
             elif wire_type == 1:  
                 offset += 8
@@ -363,21 +428,63 @@ def _extract_unixfs_data_size(unixfs_bytes: bytes) -> int:
     except Exception:
         return 0
 
+def _encode_pb_link(link_hash, name: Optional[str], t_size: Optional[int]) -> bytes:
+    buf = bytearray()
+    if link_hash is not None:
+        hash_bytes = bytes(link_hash)
+        buf.append(0x0a)
+        buf += _encode_varint(len(hash_bytes))
+        buf += hash_bytes
+    if name is not None:
+        name_bytes = name.encode('utf-8')
+        buf.append(0x12)
+        buf += _encode_varint(len(name_bytes))
+        buf += name_bytes
+    if t_size is not None:
+        buf.append(0x18)
+        buf += _encode_varint(t_size)
+    return bytes(buf)
+
+def _encode_pb_node(links: List, data: Optional[bytes]) -> bytes:
+    # Same wire format as ipld_dag_pb.encode (Links, field 2, before Data,
+    # field 1), assembled in one bytearray; links must already be in order.
+    buf = bytearray()
+    for link in links:
+        link_bytes = _encode_pb_link(link.hash, link.name, link.t_size)
+        buf.append(0x12)
+        buf += _encode_varint(len(link_bytes))
+        buf += link_bytes
+    if data is not None:
+        buf.append(0x0a)
+        buf += _encode_varint(len(data))
+        buf += data
+    return bytes(buf)
+
 def _encode_varint(value: int) -> bytes:
-    result = b''
+    result = bytearray()
     while value > 127:
-        result += bytes([(value & 127) | 128])
+        result.append((value & 127) | 128)
         value >>= 7
-    result += bytes([value & 127])
-    return result
+    result.append(value)
+    return bytes(result)
+
+def _decode_varint(data: bytes, offset: int = 0) -> tuple[int, int]:
+    # Reads in place from *offset*; callers used to pass data[offset:], which
+    # copied the rest of the buffer for every field.
+    if offset < len(data):
+        # Tags and short lengths almost always fit in a single byte.
+        byte = data[offset]
+        if byte < 0x80:
+            return byte, 1
 
-def _decode_varint(data: bytes) -> tuple[int, int]:
     value = 0
     shift = 0
-    bytes_read = 0
+    pos = offset
+    end = len(data)
     
-    for byte in data:
-        bytes_read += 1
+    while pos < end:
+        byte = data[pos]
+        pos += 1
         value |= (byte & 0x7F) << shift
         if (byte & 0x80) == 0:
             break
@@ -385,7 +492,7 @@ def _decode_varint(data: bytes) -> tuple[int, int]:
         if shift >= 64:
             raise ValueError("varint too long")
     
-    return value, bytes_read
+    return value, pos - offset
 
 def extract_block_data(cid_str: str, data: bytes) -> bytes:
     try:
@@ -393,7 +500,7 @@ def extract_block_data(cid_str: str, data: bytes) -> bytes:
             return _extract_unixfs_data_fallback(data)
             
         try:
-            cid_obj = CID.decode(cid_str)
+            cid_obj = _decode_cid(cid_str)
             cid_type = cid_obj.codec
         except:
             if cid_str.startswith('bafkreig'):
@@ -402,6 +509,17 @@ def extract_block_data(cid_str: str, data: bytes) -> bytes:
                 cid_type = DAG_PB_CODEC
         
         if cid_type == DAG_PB_CODEC:
+            if data[:1] == _PB_DATA:
+                # A leaf node is a single Data field with no links, so the
+                # UnixFS payload can be sliced out without decoding the node.
+                length, bytes_read = _decode_varint(data, 1)
+                if 1 + bytes_read + length == len(data):
+                    if length == 0:
+                        return b""
+                    extracted = _extract_unixfs_data(memoryview(data)[1 + bytes_read:])
+                    if extracted:
+                        return bytes(extracted)
+                    return _extract_unixfs_data_fallback(data)
             try:
                 pb_node = decode(data)
                 if pb_node.data:
@@ -439,7 +557,7 @@ def _extract_unixfs_data_fallback(data: bytes) -> bytes:
             wire_type = field_tag & 0x07
             
             if field_number == 1 and wire_type == 2:
-                length, bytes_read = _decode_varint(data[offset:])
+                length, bytes_read = _decode_varint(data, offset)
                 offset += bytes_read
                 
                 if offset + length <= len(data):
@@ -451,10 +569,10 @@ def _extract_unixfs_data_fallback(data: bytes) -> bytes:
                 else:
                     break
             elif wire_type == 2:  
-                length, bytes_read = _decode_varint(data[offset:])
+                length, bytes_read = _decode_varint(data, offset)
                 offset += bytes_read + length
             elif wire_type == 0:  
-                value, bytes_read = _decode_varint(data[offset:])
+                value, bytes_read = _decode_varint(data, offset)
                 offset += bytes_read
             elif wire_type == 1:  
                 offset += 8
@@ -482,7 +600,7 @@ def _extract_unixfs_data(unixfs_bytes: bytes) -> bytes:
             wire_type = field_tag & 0x07
             
             if field_number == 4 and wire_type == 2:  # Field 4 (Data) with length-delimited wire type
-                length, bytes_read = _decode_varint(unixfs_bytes[offset:])
+                length, bytes_read = _decode_varint(unixfs_bytes, offset)
                 offset += bytes_read
                 
                 if offset + length <= len(unixfs_bytes):
@@ -490,10 +608,10 @@ def _extract_unixfs_data(unixfs_bytes: bytes) -> bytes:
                 else:
                     break
             elif wire_type == 2:  # Length-delimited field
-                length, bytes_read = _decode_varint(unixfs_bytes[offset:])
+                length, bytes_read = _decode_varint(unixfs_bytes, offset)
                 offset += bytes_read + length
             elif wire_type == 0:  # Varint
-                value, bytes_read = _decode_varint(unixfs_bytes[offset:])
+                value, bytes_read = _decode_varint(unixfs_bytes, offset)
                 offset += bytes_read
             elif wire_type == 1:  # Fixed64
                 offset += 8
@@ -532,7 +650,21 @@ def get_node_links(node_data: bytes) -> List[dict]:
     except Exception as e:
         raise DAGError(f"failed to extract links from node: {str(e)}")
 
-def block_by_cid(blocks: List[FileBlockUpload], cid_str: str) -> tuple[FileBlockUpload, bool]:
+def build_block_index(blocks: List[FileBlockUpload]) -> Dict[str, FileBlockUpload]:
+    index: Dict[str, FileBlockUpload] = {}
+    for block in blocks:
+        # Keep the first block per CID, as a scan of the list would.
+        index.setdefault(block.cid, block)
+    return index
+
+def block_by_cid(blocks: Union[List[FileBlockUpload], Dict[str, FileBlockUpload]], cid_str: str) -> tuple[FileBlockUpload, bool]:
+    # Repeated lookups should pass an index from build_block_index instead of the list.
+    if isinstance(blocks, dict):
+        block = blocks.get(cid_str)
+        if block is not None:
+            return block, True
+        return FileBlockUpload(cid="", data=b""), False
+    
     for block in blocks:
         if block.cid == cid_str:
             return block, True
@@ -5,13 +5,13 @@ import time
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Callable, TypeVar, List, Dict, Any
+from typing import Optional, Callable, TypeVar, List, Dict, Any, Union
 from private.pb import ipcnodeapi_pb2, ipcnodeapi_pb2_grpc
 from private.ipc.client import Client
 from private.retry.retry import WithRetry
-from .sdk_ipc import IPC
+from private.httpext import is_shared_pool, shared_pool
+from .sdk_ipc import IPC, encryption_key
 from .config import Config, SDKConfig, SDKError, BLOCK_SIZE, MIN_BUCKET_NAME_LENGTH
-from private.encryption import derive_key
 from .shared.grpc_base import GrpcClientBase
 
 try:
@@ -169,7 +169,7 @@ class SDK():
         
         # Initialize HTTP client
         if HTTP_CLIENT_AVAILABLE:
-            self.http_client = requests.Session()
+            self.http_client = shared_pool()
         else:
             self.http_client = None
         
@@ -233,7 +233,7 @@ class SDK():
 
     def close(self):
         """Close the gRPC channels and HTTP client."""
-        if self.http_client and HTTP_CLIENT_AVAILABLE:
+        if self.http_client and HTTP_CLIENT_AVAILABLE and not is_shared_pool(self.http_client):
             self.http_client.close()
         if self.conn:
             self.conn.close()
@@ -294,10 +294,6 @@ class SDK():
     
 
 
-def get_monkit_stats() -> List[MonkitStats]:
-    stats = []
-    return stats
-
 def extract_block_data(id_str: str, data: bytes) -> bytes:
     try:
         from multiformats import CID
@@ -318,14 +314,12 @@ def extract_block_data(id_str: str, data: bytes) -> bytes:
     else:
         raise ValueError(f"unknown cid type: {codec_name}")
 
-def encryption_key_derivation(parent_key: bytes, *info_data: str) -> bytes:
+def encryption_key_derivation(parent_key: bytes, *info_data: Union[str, bytes]) -> bytes:
     if not parent_key:
         return b""
     
-    info = "/".join(info_data)
     try:
-        key = derive_key(parent_key, info.encode())
-        return key
+        return encryption_key(parent_key, *info_data)
     except Exception as e:
         raise SDKError(f"failed to derive key: {e}")
 
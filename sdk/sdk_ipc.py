@@ -12,6 +12,8 @@ from typing import List, Optional, Callable, Dict, Any, Union, Tuple
 from google.protobuf.timestamp_pb2 import Timestamp
 from datetime import datetime
 import grpc 
+import requests
+from web3.exceptions import ContractLogicError
 
 from .config import MIN_BUCKET_NAME_LENGTH, SDKError, SDKConfig, BLOCK_SIZE, ENCRYPTION_OVERHEAD
 from .dag import DAGRoot, build_dag, extract_block_data
@@ -29,6 +31,7 @@ class TxWaitSignal:
         self.Transaction = Transaction
 from private.encryption import encrypt, derive_key, decrypt
 from private.pb import ipcnodeapi_pb2, ipcnodeapi_pb2_grpc
+from private.ipc.ipc import generate_nonce
 
 try:
     from multiformats.cid import CID
@@ -46,12 +49,33 @@ except ImportError:
 BlockSize = BLOCK_SIZE
 EncryptionOverhead = ENCRYPTION_OVERHEAD
 
-def encryption_key(parent_key: bytes, *info_data: str):
+# Upper bound on the file keys an IPC instance keeps derived.
+FILE_KEY_CACHE_SIZE = 256
+
+def _derivation_info(info_data: Tuple[Union[str, bytes], ...]) -> bytes:
+    try:
+        # Joining the str parts and encoding once is the fast path.
+        return "/".join(info_data).encode()
+    except TypeError:
+        # Some parts were passed pre-encoded.
+        return b"/".join(s.encode() if isinstance(s, str) else bytes(s) for s in info_data)
+
+def encryption_key(parent_key: bytes, *info_data: Union[str, bytes]):
     if len(parent_key) == 0:
         return b''
     
-    info = "/".join(info_data)
-    return derive_key(parent_key, info.encode())
+    return derive_key(bytes(parent_key), _derivation_info(info_data))
+
+def _is_permanent_error(err: Exception) -> bool:
+    # Reverts and client-side HTTP errors (other than timeouts and rate
+    # limits) fail the same way on every attempt, so backing off only adds
+    # latency and load.
+    if isinstance(err, ContractLogicError):
+        return True
+    if isinstance(err, requests.HTTPError):
+        status = getattr(err.response, 'status_code', None)
+        return status is not None and 400 <= status < 500 and status not in (408, 429)
+    return False
 
 def maybe_encrypt_metadata(value: str, derivation_path: str, encryption_key: bytes) -> str:
     if len(encryption_key) == 0:
@@ -138,6 +162,9 @@ class IPC:
         self.block_part_size = config.block_part_size
         self.use_connection_pool = config.use_connection_pool
         self.encryption_key = config.encryption_key if config.encryption_key else b''
+        # File subkeys derived from encryption_key, by derivation info; the same
+        # ones are derived again for every upload and download of a file.
+        self._file_keys: Dict[bytes, bytes] = {}
         self.max_blocks_in_chunk = config.streaming_max_blocks_in_chunk
         self.chunk_buffer = config.chunk_buffer
         self.http_client = http_client
@@ -146,6 +173,22 @@ class IPC:
         from private.retry.retry import WithRetry
         self.with_retry = with_retry if with_retry is not None else WithRetry(max_attempts=5, base_delay=0.1)
 
+    def close(self):
+        """Drop the file keys derived from the encryption key."""
+        self._file_keys.clear()
+
+    def _file_encryption_key(self, *info_data: Union[str, bytes]) -> bytes:
+        if len(self.encryption_key) == 0:
+            return b''
+        info = _derivation_info(info_data)
+        key = self._file_keys.get(info)
+        if key is None:
+            if len(self._file_keys) >= FILE_KEY_CACHE_SIZE:
+                self._file_keys.clear()
+            key = derive_key(bytes(self.encryption_key), info)
+            self._file_keys[info] = key
+        return key
+
     def create_bucket(self, ctx, name: str) -> IPCBucketCreateResult:
         if len(name) < MIN_BUCKET_NAME_LENGTH:
             raise SDKError("invalid bucket name")
@@ -182,40 +225,75 @@ class IPC:
         if not bucket_name:
             raise SDKError("empty bucket name")
         try:
-            request = ipcnodeapi_pb2.IPCBucketViewRequest(
-                name=bucket_name,     
-                address=self.ipc.auth.address.lower() 
-            )
-            response = self.client.BucketView(request)
-            
-            if not response:
-                return None
-            created_at = 0
-            if hasattr(response, 'created_at') and response.created_at:
-                created_at = int(response.created_at.seconds)
+            response = self.client.BucketView(self._bucket_view_request(bucket_name))
+            return self._bucket_from_view(response, bucket_name)
+        except Exception as err:
+            return self._view_bucket_error(bucket_name, err)
 
-            return IPCBucket(
-                id=response.id if hasattr(response, 'id') else '',
-                name=response.name if hasattr(response, 'name') else bucket_name,
-                created_at=created_at
-            )
-        except grpc.RpcError as e:
-            if e.code() == grpc.StatusCode.NOT_FOUND:
+    def view_buckets(self, ctx, bucket_names: List[str]) -> List[Optional[IPCBucket]]:
+        """Views several buckets at once.
+
+        Every BucketView call is started with the stub's future API before any
+        result is awaited, so the requests share the channel as concurrent
+        HTTP/2 streams instead of running one round trip after another.
+        Results follow the order of bucket_names; missing buckets are None.
+        """
+        if not all(bucket_names):
+            raise SDKError("empty bucket name")
+
+        futures = []
+        for bucket_name in bucket_names:
+            try:
+                futures.append(self.client.BucketView.future(self._bucket_view_request(bucket_name)))
+            except Exception as err:
+                futures.append(err)
+
+        buckets = []
+        for bucket_name, future in zip(bucket_names, futures):
+            try:
+                if isinstance(future, Exception):
+                    raise future
+                buckets.append(self._bucket_from_view(future.result(), bucket_name))
+            except Exception as err:
+                buckets.append(self._view_bucket_error(bucket_name, err))
+        return buckets
+
+    def _bucket_view_request(self, bucket_name: str):
+        return ipcnodeapi_pb2.IPCBucketViewRequest(
+            name=bucket_name,     
+            address=self.ipc.auth.address.lower() 
+        )
+
+    def _bucket_from_view(self, response, bucket_name: str) -> Optional[IPCBucket]:
+        if not response:
+            return None
+        created_at = 0
+        if hasattr(response, 'created_at') and response.created_at:
+            created_at = int(response.created_at.seconds)
+
+        return IPCBucket(
+            id=response.id if hasattr(response, 'id') else '',
+            name=response.name if hasattr(response, 'name') else bucket_name,
+            created_at=created_at
+        )
+
+    def _view_bucket_error(self, bucket_name: str, err: Exception) -> None:
+        if isinstance(err, grpc.RpcError):
+            if err.code() == grpc.StatusCode.NOT_FOUND:
                 logging.info(f"Bucket '{bucket_name}' not found")
                 return None
-            error_details = str(e.details()).lower() if e.details() else ""
+            error_details = str(err.details()).lower() if err.details() else ""
             if "not found" in error_details:
                 logging.info(f"Bucket '{bucket_name}' not found")
                 return None
-            logging.error(f"IPC view_bucket gRPC failed: {e.code()} - {e.details()}")
-            raise SDKError(f"failed to view bucket: {e.details()}")
-        except Exception as err:
-            error_str = str(err).lower()
-            if "not found" in error_str:
-                logging.info(f"Bucket '{bucket_name}' not found")
-                return None
-            logging.error(f"IPC view_bucket unexpected error: {err}")
-            raise SDKError(f"failed to get bucket: {err}")
+            logging.error(f"IPC view_bucket gRPC failed: {err.code()} - {err.details()}")
+            raise SDKError(f"failed to view bucket: {err.details()}")
+        error_str = str(err).lower()
+        if "not found" in error_str:
+            logging.info(f"Bucket '{bucket_name}' not found")
+            return None
+        logging.error(f"IPC view_bucket unexpected error: {err}")
+        raise SDKError(f"failed to get bucket: {err}")
 
     def list_buckets(self, ctx, offset: int = 0, limit: int = 0) -> list[IPCBucket]:    
         try:
@@ -226,12 +304,15 @@ class IPC:
                 offset=offset,
                 limit=actual_limit
             )
-            logging.info(f"Sending BucketList request - address: {self.ipc.auth.address}, offset: {offset}, limit: {actual_limit} (user limit: {limit})")
+            logging.info(
+                "Sending BucketList request - address: %s, offset: %s, limit: %s (user limit: %s)",
+                self.ipc.auth.address, offset, actual_limit, limit,
+            )
             response = self.client.BucketList(request)
             
             buckets = []
             if response and hasattr(response, 'buckets'):
-                logging.info(f"Received BucketList response with {len(response.buckets)} buckets")
+                logging.info("Received BucketList response with %d buckets", len(response.buckets))
                 for bucket in response.buckets:
                     created_at = 0
                     if hasattr(bucket, 'created_at') and bucket.created_at:
@@ -357,7 +438,7 @@ class IPC:
             
             files = []
             if response and hasattr(response, 'list'):
-                logging.info(f"Received FileList response with {len(response.list)} files")
+                logging.info("Received FileList response with %d files", len(response.list))
                 for file_item in response.list:
                     created_at = 0
                     if hasattr(file_item, 'created_at') and file_item.created_at:
@@ -368,7 +449,10 @@ class IPC:
                     encoded_size = file_item.encoded_size if hasattr(file_item, 'encoded_size') else 0
                     actual_size = file_item.actual_size if hasattr(file_item, 'actual_size') else 0
                     
-                    logging.info(f"Processing file: name={file_name}, root_cid={root_cid}, encoded_size={encoded_size}, actual_size={actual_size}, created_at={created_at}")
+                    logging.debug(
+                        "Processing file: name=%s, root_cid=%s, encoded_size=%s, actual_size=%s, created_at=%s",
+                        file_name, root_cid, encoded_size, actual_size, created_at,
+                    )
                     
                     files.append(IPCFileListItem(
                         name=file_name,
@@ -578,7 +662,7 @@ class IPC:
                     )
                     return (False, None)
                 except Exception as e:
-                    return (True, e)
+                    return (not _is_permanent_error(e), e)
 
             retry_err = self.with_retry.do(get_bucket_call)
             if retry_err:
@@ -590,7 +674,7 @@ class IPC:
             bucket_id = bucket[0]
 
             chunk_enc_overhead = 0
-            file_enc_key = encryption_key(self.encryption_key, encrypted_bucket_name, encrypted_file_name)
+            file_enc_key = self._file_encryption_key(encrypted_bucket_name, encrypted_file_name)
             if len(file_enc_key) > 0:
                 chunk_enc_overhead = EncryptionOverhead
 
@@ -898,7 +982,7 @@ class IPC:
             if not node_address or not node_address.strip():
                 raise SDKError(f"Invalid node address for block {block_cid}: '{node_address}'")
             
-            logging.debug(f"Uploading block {block_index}: CID={block_cid}, node={node_address}")
+            logging.debug("Uploading block %d: CID=%s, node=%s", block_index, block_cid, node_address)
             
             result = pool.create_ipc_client(node_address, self.use_connection_pool)
             
@@ -913,9 +997,9 @@ class IPC:
             
             try:
                 def upload_streaming():
-                    import random
-                    nonce_bytes = random.randbytes(32)
-                    nonce = int.from_bytes(nonce_bytes, byteorder='big')
+                    # The nonce guards the storage signature against replay,
+                    # so it comes from the OS CSPRNG, not the Mersenne Twister.
+                    nonce = generate_nonce()
                     deadline = int(time.time() + 24 * 60 * 60)
 
                     try:
@@ -1258,8 +1342,7 @@ class IPC:
     def download(self, ctx, file_download, writer: io.IOBase):
         pool = ConnectionPool()
         try:
-            file_enc_key = encryption_key(
-                self.encryption_key, 
+            file_enc_key = self._file_encryption_key(
                 file_download.bucket_name, 
                 file_download.name
             )
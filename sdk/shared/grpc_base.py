@@ -13,11 +13,11 @@ class GrpcClientBase:
 
         if status_code == grpc.StatusCode.DEADLINE_EXCEEDED:
             # Deadline exceeded → request took longer than connection_timeout
-            logging.warning(f"{method_name} timed out after {self.connection_timeout}s")
+            logging.warning("%s timed out after %ss", method_name, self.connection_timeout)
             raise SDKError(f"{method_name} request timed out after {self.connection_timeout}s") from error
 
         logging.error(
-            f"gRPC call {method_name} failed: {status_code.name} ({status_code.value}) - {details}"
+            "gRPC call %s failed: %s (%s) - %s", method_name, status_code.name, status_code.value, details
         )
         raise SDKError(
             f"gRPC call {method_name} failed: {status_code.name} ({status_code.value}) - {details}"
@@ -23,4 +23,8 @@ setup(
     ],
     python_requires=">=3.9",
     install_requires=requirements,
+    extras_require={
+        # HTTP/2 client for range downloads, see private.httpext.make_pool.
+        "http2": ["httpx[http2]"],
+    },
 )
\ No newline at end of file
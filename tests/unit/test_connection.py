@@ -1,6 +1,36 @@
-import pytest
+from unittest.mock import MagicMock, patch
 
+from sdk.connection import ConnectionPool
 
-def test_placeholder():
-    """Placeholder test to keep file valid."""
-    pass
+
+def test_pooled_channels_round_robin():
+    with patch("sdk.connection.grpc.insecure_channel", side_effect=lambda *a, **kw: MagicMock()) as channel, \
+            patch("sdk.connection.grpc.channel_ready_future"):
+        pool = ConnectionPool(channels_per_addr=2)
+        conns = [pool._get("node:5000")[0] for _ in range(5)]
+
+        assert channel.call_count == 2
+        assert conns[0] is not conns[1]
+        assert conns[2:] == [conns[0], conns[1], conns[0]]
+
+        assert pool.close() is None
+        conns[0].close.assert_called_once()
+        conns[1].close.assert_called_once()
+
+
+def test_pooled_channels_grow_only_when_in_use():
+    with patch("sdk.connection.grpc.insecure_channel", side_effect=lambda *a, **kw: MagicMock()) as channel, \
+            patch("sdk.connection.grpc.channel_ready_future") as ready:
+        pool = ConnectionPool(channels_per_addr=4)
+        for _ in range(3):
+            _, release, err = pool.create_ipc_client("node:5000", pooled=True)
+            assert err is None
+            release()
+
+        assert channel.call_count == 1
+
+        pool.create_ipc_client("node:5000", pooled=True)
+        pool.create_ipc_client("node:5000", pooled=True)
+        assert channel.call_count == 2
+        # Only the first channel to an address waits for the connection.
+        assert ready.call_count == 1
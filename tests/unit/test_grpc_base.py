@@ -1,6 +1,31 @@
+import logging
+
+import grpc
 import pytest
 
+from sdk.config import SDKError
+from sdk.shared.grpc_base import GrpcClientBase
+
+
+class _RpcError(grpc.RpcError):
+    def __init__(self, code, details):
+        self._code = code
+        self._details = details
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return self._details
+
+
+def test_handle_grpc_error(caplog):
+    base = GrpcClientBase(connection_timeout=5)
+
+    with caplog.at_level(logging.ERROR), pytest.raises(SDKError) as exc_info:
+        base._handle_grpc_error("BucketView", _RpcError(grpc.StatusCode.UNAVAILABLE, "down"))
+    assert caplog.messages == [str(exc_info.value)]
+    assert str(exc_info.value).startswith("gRPC call BucketView failed: UNAVAILABLE (")
 
-def test_placeholder():
-    """Placeholder test to keep file valid."""
-    pass
+    with pytest.raises(SDKError, match="timed out after 5s"):
+        base._handle_grpc_error("BucketView", _RpcError(grpc.StatusCode.DEADLINE_EXCEEDED, None))
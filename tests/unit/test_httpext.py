@@ -1,6 +1,163 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
+import requests
+import urllib3
+
+from private.httpext import (
+    is_shared_pool, make_async_pool, make_pool, range_download, range_download_async, range_download_many,
+    shared_pool,
+)
+
+PAYLOAD = bytes(range(256)) * 1024
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/missing":
+            body = b"not found"
+            self.send_response(404)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if self.path == "/truncated":
+            self.send_response(206)
+            self.send_header("Content-Length", "1000")
+            self.end_headers()
+            self.wfile.write(PAYLOAD[:10])
+            self.close_connection = True
+            return
+
+        start, end = self.headers["Range"].split("=")[1].split("-")
+        body = PAYLOAD[int(start):int(end) + 1]
+        self.send_response(206)
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(PAYLOAD)}")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def range_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RangeHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_range_download(range_server):
+    with requests.Session() as session:
+        data = range_download(session, range_server + "/data", 1000, 70000)
+
+    assert data == PAYLOAD[1000:71000]
+
+
+def test_range_download_pool_manager(range_server):
+    pool = urllib3.PoolManager()
+
+    data = range_download(pool, range_server + "/data", 1000, 70000)
+    assert data == PAYLOAD[1000:71000]
+
+    with pytest.raises(Exception) as exc_info:
+        range_download(pool, range_server + "/missing", 0, 10)
+    assert "download failed with status 404: not found" in str(exc_info.value)
+
+    pool.clear()
+
+
+def test_range_download_httpx(range_server):
+    httpx = pytest.importorskip("httpx")
+
+    with httpx.Client() as client:
+        data = range_download(client, range_server + "/data", 1000, 70000)
+        assert data == PAYLOAD[1000:71000]
+
+        with pytest.raises(Exception) as exc_info:
+            range_download(client, range_server + "/missing", 0, 10)
+        assert "download failed with status 404: not found" in str(exc_info.value)
+
+
+def test_range_download_async(range_server):
+    pytest.importorskip("httpx")
+
+    async def download():
+        async with make_async_pool() as client:
+            parts = await asyncio.gather(*(
+                range_download_async(client, range_server + "/data", offset, 1000)
+                for offset in range(0, 8000, 1000)
+            ))
+            with pytest.raises(Exception) as exc_info:
+                await range_download_async(client, range_server + "/missing", 0, 10)
+            return parts, exc_info
+
+    parts, exc_info = asyncio.run(download())
+    assert b"".join(parts) == PAYLOAD[:8000]
+    assert "download failed with status 404: not found" in str(exc_info.value)
+
+
+def test_range_download_many(range_server):
+    pytest.importorskip("httpx")
+
+    ranges = [(range_server + "/data", offset, 500) for offset in range(4500, -1, -500)]
+    parts = range_download_many(ranges, max_concurrency=3)
+
+    assert parts == [PAYLOAD[offset:offset + 500] for _, offset, _ in ranges]
+    assert range_download_many([]) == []
+
+
+def test_range_download_truncated_body(range_server):
+    with requests.Session() as session:
+        with pytest.raises(Exception, match="failed to read response body"):
+            range_download(session, range_server + "/truncated", 0, 1000)
+
+
+def test_make_pool(range_server):
+    pool = make_pool(http2=True)
+    try:
+        assert range_download(pool, range_server + "/data", 0, 16) == PAYLOAD[:16]
+    finally:
+        pool.close()
+
+
+def test_make_pool_requests_fallback(range_server):
+    default = make_pool()
+    assert isinstance(default, requests.Session)
+    default.close()
+
+    pool = make_pool(http2=False, max_connections=8)
+    try:
+        assert isinstance(pool, requests.Session)
+        assert pool.get_adapter(range_server)._pool_maxsize == 8
+        assert range_download(pool, range_server + "/data", 0, 16) == PAYLOAD[:16]
+    finally:
+        pool.close()
+
+
+def test_shared_pool(range_server):
+    pool = shared_pool()
+
+    assert shared_pool() is pool
+    assert is_shared_pool(pool)
+    assert not is_shared_pool(requests.Session())
+    assert range_download(pool, range_server + "/data", 0, 16) == PAYLOAD[:16]
+
+
+def test_range_download_error_status(range_server):
+    with requests.Session() as session:
+        with pytest.raises(Exception) as exc_info:
+            range_download(session, range_server + "/missing", 0, 10)
+
+    assert "download failed with status 404: not found" in str(exc_info.value)
 
 
-def test_placeholder():
-    """Placeholder test to keep file valid."""
-    pass
+def test_range_download_invalid_range():
+    with pytest.raises(ValueError):
+        range_download(requests.Session(), "http://127.0.0.1", 0, 0)
@@ -1,6 +1,13 @@
-import pytest
+from private.encryption import derive_key
+from sdk.sdk import encryption_key_derivation
 
 
-def test_placeholder():
-    """Placeholder test to keep file valid."""
-    pass
+def test_encryption_key_derivation():
+    parent = bytes(range(32))
+
+    key = encryption_key_derivation(parent, "bucket", "file")
+    assert key == derive_key(parent, b"bucket/file")
+    assert encryption_key_derivation(bytearray(parent), "bucket", "file") == key
+    assert encryption_key_derivation(parent, b"bucket", "file") == key
+    assert encryption_key_derivation(parent, "bucket") != key
+    assert encryption_key_derivation(b"", "bucket") == b""
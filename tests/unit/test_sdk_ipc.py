@@ -48,3 +48,90 @@ class TestCreateBucket:
         assert isinstance(result, IPCBucketCreateResult)
         assert result.name == "test-bucket"
         assert result.created_at == 1234567890
+
+
+class TestViewBuckets:
+    """Test concurrent bucket views."""
+
+    def setup_method(self):
+        self.mock_client = Mock()
+        self.mock_ipc = Mock()
+        self.mock_ipc.auth.address = "0xABC"
+        config = SDKConfig(
+            address="test:5500",
+            max_concurrency=10,
+            block_part_size=1048576,
+            use_connection_pool=True
+        )
+        self.ipc = IPC(self.mock_client, Mock(), self.mock_ipc, config)
+
+    def test_view_buckets_issues_all_calls_before_waiting(self):
+        import grpc
+
+        class NotFound(grpc.RpcError):
+            def code(self):
+                return grpc.StatusCode.NOT_FOUND
+
+            def details(self):
+                return "bucket not found"
+
+        started = []
+
+        def future(request):
+            started.append(request.name)
+            result = Mock()
+            if request.name == "missing":
+                result.result.side_effect = NotFound()
+            else:
+                result.result.side_effect = lambda: (
+                    Mock(id="id-" + request.name, created_at=Mock(seconds=7))
+                    if started == ["a", "missing", "b"] else None
+                )
+            return result
+
+        self.mock_client.BucketView.future.side_effect = future
+
+        buckets = self.ipc.view_buckets(None, ["a", "missing", "b"])
+
+        assert [b.id if b else None for b in buckets] == ["id-a", None, "id-b"]
+        assert buckets[0].created_at == 7
+        assert self.mock_client.BucketView.future.call_args_list[0].args[0].address == "0xabc"
+
+
+def test_is_permanent_error():
+    import requests
+    from web3.exceptions import ContractLogicError
+    from sdk.sdk_ipc import _is_permanent_error
+
+    def http_error(status):
+        response = requests.Response()
+        response.status_code = status
+        return requests.HTTPError(response=response)
+
+    assert _is_permanent_error(ContractLogicError("execution reverted"))
+    assert _is_permanent_error(http_error(404))
+    assert not _is_permanent_error(http_error(429))
+    assert not _is_permanent_error(http_error(408))
+    assert not _is_permanent_error(http_error(503))
+    assert not _is_permanent_error(requests.ConnectionError())
+
+
+def test_file_encryption_key_cached_per_instance():
+    from private.encryption import derive_key
+
+    parent = bytes(range(32))
+    config = SDKConfig(
+        address="test:5500",
+        max_concurrency=10,
+        block_part_size=1048576,
+        use_connection_pool=True,
+        encryption_key=parent,
+    )
+    ipc = IPC(Mock(), Mock(), Mock(), config)
+
+    key = ipc._file_encryption_key("bucket", "file")
+    assert key == derive_key(parent, b"bucket/file")
+    assert ipc._file_keys == {b"bucket/file": key}
+
+    ipc.close()
+    assert ipc._file_keys == {}